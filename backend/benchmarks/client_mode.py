@@ -0,0 +1,136 @@
+"""
+Client mode benchmark: embedded (in-process) Qdrant versus the Qdrant server.
+
+The same encoded points are loaded into a server collection and an embedded
+collection. The same hybrid queries are then run against both, first as raw
+`query_batch_points` calls and then end to end through `advanced_search`
+(query encoding included, result cache disabled). The benchmark reports p50
+and p95 latency per mode.
+
+Usage (from the backend directory, with Qdrant reachable):
+    python -m benchmarks.client_mode --limit 2000
+    python -m benchmarks.client_mode --path /tmp/qdrant-embedded --limit 2000
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmarks.common import load_manager, load_documents, load_documents_file, write_markdown, write_report
+from benchmarks.retrieval import encode_corpus, layout_vectors, sample_queries
+from routes.collections.manager import QdrantDBManager
+
+COLLECTION_NAME = "benchmark-client-mode"
+
+REPORT_COLUMNS = ["mode", "search_p50_ms", "search_p95_ms", "end_to_end_p50_ms", "end_to_end_p95_ms"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare embedded and server Qdrant latency")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--path", type=str, default=":memory:", help="Embedded storage: a directory or :memory:")
+    parser.add_argument("--dataset", type=str, default="macadeliccc/US-SupremeCourtVerdicts", help="Dataset to sample documents from")
+    parser.add_argument("--split", type=str, default="train", help="Dataset split")
+    parser.add_argument("--documents", type=str, default=None, help="Local JSONL corpus used instead of the dataset")
+    parser.add_argument("--text-field", type=str, default="document", help="Field containing the text")
+    parser.add_argument("--limit", type=int, default=2000, help="Number of documents to index")
+    parser.add_argument("--num-queries", type=int, default=100, help="Queries sampled from the corpus")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--batch-size", type=int, default=64, help="Points per upsert")
+    parser.add_argument("--output", type=str, default="client_mode_benchmark", help="Report path without extension")
+    return parser.parse_args()
+
+
+def percentile(latencies: List[float], q: int) -> float:
+    return round(float(np.percentile(latencies, q)), 2)
+
+
+async def run(
+    dbms: QdrantDBManager,
+    mode: str,
+    documents: List[Dict[str, Any]],
+    vectors: List[Dict[str, Any]],
+    queries: List[str],
+    args: argparse.Namespace
+) -> Dict[str, Any]:
+    dbms.recreate_collection(collection_name=COLLECTION_NAME)
+    for i in range(0, len(documents), args.batch_size):
+        dbms.client.upsert(
+            collection_name=COLLECTION_NAME,
+            points=[
+                models.PointStruct(id=doc["id"], vector=vector, payload={"document": doc["document"]})
+                for doc, vector in zip(documents[i:i + args.batch_size], vectors[i:i + args.batch_size])
+            ]
+        )
+    await dbms.wait_for_indexing(COLLECTION_NAME, poll_interval=0.5)
+
+    profile = dbms.get_collection_profile(COLLECTION_NAME)
+    fusion = profile.fusion_options(args.top_k)
+    encoded = list(zip(*dbms._encode_queries(queries)))
+
+    search_latencies = []
+    for dense, indices, values in encoded:
+        requests = dbms._build_hybrid_query(
+            dense, indices, values,
+            top_k=args.top_k,
+            search_params=profile.search_params(),
+            fusion=fusion
+        )
+        started = time.perf_counter()
+        responses = dbms.client.query_batch_points(collection_name=COLLECTION_NAME, requests=requests)
+        dbms._process_search_results(dbms._fuse_responses(responses, args.top_k, fusion))
+        search_latencies.append((time.perf_counter() - started) * 1000)
+
+    end_to_end_latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        await dbms.advanced_search(COLLECTION_NAME, query, top_k=args.top_k, use_cache=False)
+        end_to_end_latencies.append((time.perf_counter() - started) * 1000)
+
+    dbms.delete_collection_version(COLLECTION_NAME)
+    return {
+        "mode": mode,
+        "search_p50_ms": round(statistics.median(search_latencies), 2),
+        "search_p95_ms": percentile(search_latencies, 95),
+        "end_to_end_p50_ms": round(statistics.median(end_to_end_latencies), 2),
+        "end_to_end_p95_ms": percentile(end_to_end_latencies, 95),
+    }
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    server = load_manager(args.host, args.port)
+    embedded = QdrantDBManager(embeddings=server.embeddings, path=args.path)
+
+    if args.documents:
+        documents = load_documents_file(args.documents, args.text_field, args.limit)
+    else:
+        documents = load_documents(args.dataset, args.split, args.text_field, args.limit)
+    queries = [label["query"] for label in sample_queries(documents, args.num_queries, seed=13)]
+    vectors = layout_vectors(server, {}, *encode_corpus(server, documents))
+
+    results = [
+        await run(server, "server", documents, vectors, queries, args),
+        await run(embedded, "embedded", documents, vectors, queries, args),
+    ]
+
+    print()
+    print(" ".join(f"{column:>18}" for column in REPORT_COLUMNS))
+    for row in results:
+        print(" ".join(f"{str(row[column]):>18}" for column in REPORT_COLUMNS))
+
+    report = {"documents": len(documents), "queries": len(queries), "top_k": args.top_k, "results": results}
+    write_report(report, f"{args.output}.json")
+    write_markdown(results, REPORT_COLUMNS, f"{args.output}.md", title=f"Client mode benchmark ({len(documents)} documents)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
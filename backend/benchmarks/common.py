@@ -0,0 +1,87 @@
+import os
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from datasets import load_dataset
+from dotenv import load_dotenv
+
+from embeddings.models import EmbeddingModels
+from routes.collections.manager import QdrantDBManager
+
+
+def load_manager(host: str = "localhost", port: int = 6333, path: Optional[str] = None) -> QdrantDBManager:
+    """
+    Create a QdrantDBManager with the models configured in the environment.
+
+    With `path` Qdrant runs embedded (a storage directory or ":memory:") instead of connecting to host:port.
+    """
+    load_dotenv(override=True)
+    embeddings = EmbeddingModels()
+    embeddings.configure(
+        query_model_name=os.getenv("SPARSE_MODEL_QUERY", "naver/efficient-splade-VI-BT-large-query"),
+        doc_model_name=os.getenv("SPARSE_MODEL_DOCS", "naver/efficient-splade-VI-BT-large-doc"),
+        dense_model_name=os.getenv("DENSE_MODEL", "mixedbread-ai/mxbai-embed-large-v1")
+    )
+    return QdrantDBManager(embeddings=embeddings, host=host, port=port, path=path)
+
+
+def load_documents(
+    dataset_name: str,
+    split: str = "train",
+    text_field: str = "text",
+    limit: int = 1000
+) -> List[Dict[str, Any]]:
+    """Stream the first `limit` documents of a dataset into the build document format."""
+    dataset = load_dataset(dataset_name, split=split, streaming=True)
+    documents = []
+    for index, item in enumerate(dataset):
+        if len(documents) >= limit:
+            break
+        if not item.get(text_field):
+            continue
+        documents.append({
+            "document": item[text_field],
+            "id": index,
+            "dataset": dataset_name
+        })
+    logging.info(f"Loaded {len(documents)} documents from {dataset_name}")
+    return documents
+
+
+def write_report(report: Dict[str, Any], path: str):
+    """Write a benchmark report as JSON."""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    logging.info(f"Report written to {path}")
+
+
+def load_documents_file(path: str, text_field: str = "text", limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Read documents from a local JSONL file into the build document format."""
+    documents = []
+    with open(path) as f:
+        for index, line in enumerate(f):
+            if limit is not None and len(documents) >= limit:
+                break
+            item = json.loads(line)
+            if not item.get(text_field):
+                continue
+            documents.append({
+                "document": item[text_field],
+                "id": item.get("id", index),
+                "dataset": item.get("dataset", path)
+            })
+    logging.info(f"Loaded {len(documents)} documents from {path}")
+    return documents
+
+
+def write_markdown(rows: List[Dict[str, Any]], columns: List[str], path: str, title: Optional[str] = None):
+    """Write benchmark rows as a Markdown table."""
+    lines = [f"# {title}", ""] if title else []
+    lines.append("| " + " | ".join(columns) + " |")
+    lines.append("|" + "|".join("---" for _ in columns) + "|")
+    for row in rows:
+        lines.append("| " + " | ".join(str(row.get(column, "")) for column in columns) + " |")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    logging.info(f"Report written to {path}")
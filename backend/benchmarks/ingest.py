@@ -0,0 +1,111 @@
+"""
+Ingest-time benchmark for bulk-load collection builds.
+
+Documents are encoded once, then the same points are inserted into a collection
+created with and without `bulk_load`. For each run the benchmark reports upsert
+time, index build time and the total time until the collection is fully indexed.
+
+Usage (from the backend directory, with Qdrant reachable):
+    python -m benchmarks.ingest --host localhost --limit 20000
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+
+from qdrant_client.http import models
+
+from benchmarks.common import load_manager, load_documents, write_report
+from routes.collections.manager import QdrantDBManager
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare collection ingest time with and without bulk-load mode")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--dataset", type=str, default="macadeliccc/US-SupremeCourtVerdicts", help="Dataset to sample documents from")
+    parser.add_argument("--split", type=str, default="train", help="Dataset split")
+    parser.add_argument("--text-field", type=str, default="document", help="Field containing the text")
+    parser.add_argument("--limit", type=int, default=5000, help="Number of documents to insert")
+    parser.add_argument("--batch-size", type=int, default=64, help="Points per upsert")
+    parser.add_argument("--output", type=str, default="ingest_benchmark.json", help="Path of the JSON report")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections")
+    return parser.parse_args()
+
+
+def encode_points(dbms: QdrantDBManager, documents: List[Dict[str, Any]], batch_size: int) -> List[models.PointStruct]:
+    """Encode documents once so both runs insert identical points."""
+    points = []
+    for i in range(0, len(documents), batch_size):
+        batch = documents[i:i + batch_size]
+        texts = [doc["document"] for doc in batch]
+        dense = dbms.dense_model.encode(texts, batch_size=32, show_progress_bar=False)
+        sparse_indices, sparse_values = dbms.sparse_vectors(texts, is_query=False)
+        for doc, dense_emb, indices, values in zip(batch, dense, sparse_indices, sparse_values):
+            points.append(models.PointStruct(
+                id=doc["id"],
+                vector={
+                    "dense": dense_emb.tolist(),
+                    "sparse": models.SparseVector(indices=indices, values=values)
+                },
+                payload={k: v for k, v in doc.items() if k != "id"}
+            ))
+    return points
+
+
+async def run(dbms: QdrantDBManager, points: List[models.PointStruct], bulk_load: bool, batch_size: int, keep: bool) -> Dict[str, Any]:
+    collection_name = f"benchmark-ingest-{'bulk' if bulk_load else 'online'}"
+    dbms.recreate_collection(collection_name=collection_name, bulk_load=bulk_load)
+
+    started = time.perf_counter()
+    for i in range(0, len(points), batch_size):
+        dbms.client.upsert(collection_name=collection_name, points=points[i:i + batch_size])
+    upsert_seconds = time.perf_counter() - started
+
+    if bulk_load:
+        index_seconds = await dbms.finish_bulk_load(collection_name, poll_interval=0.5)
+    else:
+        index_seconds = await dbms.wait_for_indexing(collection_name, poll_interval=0.5)
+
+    info = dbms.client.get_collection(collection_name)
+    if not keep:
+        dbms.client.delete_collection(collection_name)
+
+    total = upsert_seconds + index_seconds
+    return {
+        "mode": "bulk_load" if bulk_load else "online",
+        "points": len(points),
+        "upsert_seconds": round(upsert_seconds, 2),
+        "index_seconds": round(index_seconds, 2),
+        "total_seconds": round(total, 2),
+        "points_per_second": round(len(points) / upsert_seconds, 1) if upsert_seconds else None,
+        "indexed_vectors_count": info.indexed_vectors_count,
+        "segments_count": info.segments_count,
+    }
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    dbms = load_manager(args.host, args.port)
+    documents = load_documents(args.dataset, args.split, args.text_field, args.limit)
+    points = encode_points(dbms, documents, args.batch_size)
+
+    results = [
+        await run(dbms, points, bulk_load=False, batch_size=args.batch_size, keep=args.keep),
+        await run(dbms, points, bulk_load=True, batch_size=args.batch_size, keep=args.keep),
+    ]
+
+    print(f"\n{'mode':<10} {'upsert s':>10} {'index s':>10} {'total s':>10} {'points/s':>10}")
+    for result in results:
+        print(
+            f"{result['mode']:<10} {result['upsert_seconds']:>10} {result['index_seconds']:>10} "
+            f"{result['total_seconds']:>10} {result['points_per_second']:>10}")
+
+    write_report({"dataset": args.dataset, "batch_size": args.batch_size, "results": results}, args.output)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+Search result path benchmark: lean payload projection versus full embeddings.
+
+Queries are encoded once up front, then each query is run against an existing
+collection in both result modes. For each mode the benchmark reports the mean
+serialized response size and the per-query CPU time spent issuing the query and
+converting the points into TextNodes.
+
+Usage (from the backend directory, with Qdrant reachable):
+    python -m benchmarks.result_path --collection picollm --queries queries.txt
+"""
+import argparse
+import logging
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import load_manager, write_report
+from routes.collections.manager import QdrantDBManager
+
+DEFAULT_QUERIES = [
+    "fourth amendment search and seizure",
+    "qualified immunity for police officers",
+    "first amendment free speech in public schools",
+    "interstate commerce clause regulation",
+    "due process in civil forfeiture",
+    "habeas corpus petition denied",
+    "equal protection and voting rights",
+    "copyright fair use",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare lean and full search result modes")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--collection", type=str, required=True, help="Collection or alias to search")
+    parser.add_argument("--queries", type=str, default=None, help="File with one query per line")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--payload-fields", type=str, nargs="*", default=None, help="Payload fields for the lean mode")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query and mode")
+    parser.add_argument("--output", type=str, default="result_path_benchmark.json", help="Path of the JSON report")
+    return parser.parse_args()
+
+
+def run_mode(
+    dbms: QdrantDBManager,
+    collection_name: str,
+    encoded: List[Any],
+    top_k: int,
+    repeat: int,
+    with_embeddings: bool,
+    payload_fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    search_params = dbms.get_collection_profile(collection_name).search_params()
+    sizes, cpu_times = [], []
+
+    for dense, indices, values in encoded:
+        requests = dbms._build_hybrid_query(
+            dense, indices, values,
+            top_k=top_k,
+            search_params=search_params,
+            payload_fields=payload_fields,
+            with_embeddings=with_embeddings
+        )
+        for _ in range(repeat):
+            started = time.process_time()
+            responses = dbms.client.query_batch_points(collection_name=collection_name, requests=requests)
+            points = dbms._fuse_responses(responses, top_k)
+            dbms._process_search_results(points, with_embeddings)
+            cpu_times.append((time.process_time() - started) * 1000)
+        sizes.append(sum(len(response.model_dump_json()) for response in responses))
+
+    return {
+        "mode": "full" if with_embeddings else "lean",
+        "mean_response_bytes": round(statistics.mean(sizes)),
+        "cpu_ms_p50": round(statistics.median(cpu_times), 3),
+        "cpu_ms_mean": round(statistics.mean(cpu_times), 3),
+    }
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    queries = DEFAULT_QUERIES
+    if args.queries:
+        with open(args.queries) as f:
+            queries = [line.strip() for line in f if line.strip()]
+
+    dbms = load_manager(args.host, args.port)
+    dense_vectors, sparse_indices, sparse_values = dbms._encode_queries(queries)
+    encoded = list(zip(dense_vectors, sparse_indices, sparse_values))
+
+    results = [
+        run_mode(dbms, args.collection, encoded, args.top_k, args.repeat, True, None),
+        run_mode(dbms, args.collection, encoded, args.top_k, args.repeat, False, args.payload_fields),
+    ]
+
+    print(f"\n{'mode':<6} {'bytes/response':>15} {'cpu ms p50':>11} {'cpu ms mean':>12}")
+    for result in results:
+        print(f"{result['mode']:<6} {result['mean_response_bytes']:>15} {result['cpu_ms_p50']:>11} {result['cpu_ms_mean']:>12}")
+
+    write_report({
+        "collection": args.collection,
+        "queries": len(queries),
+        "top_k": args.top_k,
+        "payload_fields": args.payload_fields,
+        "results": results
+    }, args.output)
+
+
+if __name__ == "__main__":
+    main()
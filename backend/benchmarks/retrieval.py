@@ -0,0 +1,435 @@
+"""
+Retrieval benchmark: recall@k, MRR and latency across vector layouts and search modes.
+
+A corpus is encoded once and loaded into one small collection per vector layout
+(plain dense, matryoshka, int8, pruned sparse, BM25 sparse, late interaction). Every search configuration then runs the same
+labeled query set against its layout and is compared with an exact
+(`exact=True`) full-precision hybrid search on the plain layout:
+
+- recall@k: overlap of the top k with the exact top k
+- MRR@k: reciprocal rank of the first labeled relevant document
+- p50/p95 latency of the Qdrant round trip and fusion, per query
+- query encoding time, in total and for the sparse encoder alone
+- an estimate of the vector and HNSW memory of the layout, and the on-disk
+  size of late-interaction multivectors
+
+Queries come from a JSONL file of `{"query": ..., "relevant": [ids]}` lines, or
+are sampled as sentences from the corpus with their source document labeled
+relevant. Everything runs on CPU; with `--documents` and cached models no
+network access is needed.
+
+Usage (from the backend directory, with Qdrant reachable or `--path :memory:`):
+    python -m benchmarks.retrieval --limit 2000 --num-queries 200
+    python -m benchmarks.retrieval --documents corpus.jsonl --labels queries.jsonl --top-k 10
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from qdrant_client.http import models
+
+from benchmarks.common import load_manager, load_documents, load_documents_file, write_markdown, write_report
+from routes.collections.manager import QdrantDBManager, LATE_INTERACTION_VECTOR
+from routes.collections.sparse import SparsePruning
+
+# Collection layouts built for the benchmark, as recreate_collection arguments
+LAYOUTS: Dict[str, Dict[str, Any]] = {
+    "plain": {},
+    "matryoshka": {"use_matryoshka": True, "matryoshka_levels": 3},
+    "int8": {"build_with_quantized": True},
+    "float16": {"dense_datatype": "float16"},
+    "on-disk": {"dense_on_disk": True},
+    # Pruning limits are replaced by the --sparse-* arguments
+    "pruned": {"document_sparse_pruning": SparsePruning(top_n=64), "query_sparse_pruning": SparsePruning()},
+    "bm25": {"sparse_mode": "bm25"},
+    "late-interaction": {"late_interaction": True},
+}
+
+# Search configurations: the layout each one runs on and the branches it queries
+CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    "hybrid": {"layout": "plain", "mode": "hybrid"},
+    "dense": {"layout": "plain", "mode": "dense"},
+    "sparse": {"layout": "plain", "mode": "sparse"},
+    "matryoshka": {"layout": "matryoshka", "mode": "hybrid"},
+    "int8": {"layout": "int8", "mode": "hybrid"},
+    "float16": {"layout": "float16", "mode": "hybrid"},
+    "on-disk": {"layout": "on-disk", "mode": "hybrid"},
+    "sparse-pruned": {"layout": "pruned", "mode": "sparse"},
+    "hybrid-pruned": {"layout": "pruned", "mode": "hybrid"},
+    "bm25-sparse": {"layout": "bm25", "mode": "sparse"},
+    "bm25-hybrid": {"layout": "bm25", "mode": "hybrid"},
+    "late-interaction": {"layout": "late-interaction", "mode": "hybrid"},
+}
+
+REPORT_COLUMNS = [
+    "config", "layout", "recall@k", "mrr@k", "p50_ms", "p95_ms", "encode_ms", "sparse_encode_ms", "sparse_terms_per_doc", "est_memory_mb",
+    "multivector_mb"
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure recall@k and latency across vector layouts")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--path", type=str, default=None, help="Run Qdrant embedded: a storage directory or :memory:")
+    parser.add_argument("--dataset", type=str, default="macadeliccc/US-SupremeCourtVerdicts", help="Dataset to sample documents from")
+    parser.add_argument("--split", type=str, default="train", help="Dataset split")
+    parser.add_argument("--documents", type=str, default=None, help="Local JSONL corpus used instead of the dataset")
+    parser.add_argument("--text-field", type=str, default="document", help="Field containing the text")
+    parser.add_argument("--limit", type=int, default=2000, help="Number of documents to index")
+    parser.add_argument("--labels", type=str, default=None, help="JSONL file of labeled queries")
+    parser.add_argument("--num-queries", type=int, default=100, help="Queries sampled from the corpus without --labels")
+    parser.add_argument("--top-k", type=int, default=10, help="Cutoff for recall and MRR")
+    parser.add_argument("--configs", type=str, nargs="*", default=list(CONFIGURATIONS), help="Configurations to run")
+    parser.add_argument("--sparse-top-n", type=int, default=64, help="Sparse weights kept per document in the pruned layout")
+    parser.add_argument("--sparse-mass", type=float, default=None, help="Weight mass kept per document in the pruned layout")
+    parser.add_argument("--query-sparse-top-n", type=int, default=None, help="Sparse weights kept per query in the pruned layout")
+    parser.add_argument("--query-sparse-mass", type=float, default=None, help="Weight mass kept per query in the pruned layout")
+    parser.add_argument("--indexing-threshold", type=int, default=1, help="Indexing threshold (KB) so small collections get an HNSW graph")
+    parser.add_argument("--batch-size", type=int, default=64, help="Points per upsert")
+    parser.add_argument("--seed", type=int, default=13, help="Seed for query sampling")
+    parser.add_argument("--output", type=str, default="retrieval_benchmark", help="Report path without extension")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark collections")
+    return parser.parse_args()
+
+
+def sample_queries(documents: List[Dict[str, Any]], count: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Use a sentence from the start of each sampled document as a query labeled with that document.
+
+    Sentences are taken from the first 2000 characters so they fall inside the
+    dense model's context window.
+    """
+    rng = random.Random(seed)
+    queries = []
+    for doc in rng.sample(documents, min(count, len(documents))):
+        sentences = [
+            s.strip() for s in re.split(r"(?<=[.!?])\s+", doc["document"][:2000])
+            if 8 <= len(s.split()) <= 40
+        ]
+        if sentences:
+            queries.append({"query": rng.choice(sentences), "relevant": [doc["id"]]})
+    return queries
+
+
+def load_labels(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def encode_corpus(dbms: QdrantDBManager, documents: List[Dict[str, Any]]) -> Tuple[np.ndarray, List[List[int]], List[List[float]]]:
+    """Encode the corpus once, shared by all layouts."""
+    texts = [doc["document"] for doc in documents]
+    dense = dbms.dense_model.encode(texts, batch_size=32, convert_to_numpy=True, show_progress_bar=True)
+    sparse_indices, sparse_values = [], []
+    for i in range(0, len(texts), 32):
+        indices, values = dbms.sparse_vectors(texts[i:i + 32], is_query=False)
+        sparse_indices.extend(indices)
+        sparse_values.extend(values)
+    return dense.astype(np.float32), sparse_indices, sparse_values
+
+
+def layout_encoded(
+    dbms: QdrantDBManager,
+    layout: Dict[str, Any],
+    documents: List[Dict[str, Any]],
+    encoded: Tuple[np.ndarray, List[List[int]], List[List[float]]]
+) -> Tuple[np.ndarray, List[List[int]], List[List[float]]]:
+    """The shared corpus encoding, with BM25 document vectors for BM25 layouts."""
+    if layout.get("sparse_mode") != "bm25":
+        return encoded
+    sparse_indices, sparse_values = dbms.sparse_vectors(
+        [doc["document"] for doc in documents], is_query=False, sparse_mode="bm25")
+    return encoded[0], sparse_indices, sparse_values
+
+
+def layout_sparse(
+    layout: Dict[str, Any],
+    sparse_indices: List[List[int]],
+    sparse_values: List[List[float]]
+) -> Tuple[List[List[int]], List[List[float]]]:
+    """Apply a layout's document sparse pruning."""
+    pruning = layout.get("document_sparse_pruning")
+    return pruning.apply_batch(sparse_indices, sparse_values) if pruning else (sparse_indices, sparse_values)
+
+
+def layout_vectors(
+    dbms: QdrantDBManager,
+    layout: Dict[str, Any],
+    dense: np.ndarray,
+    sparse_indices: List[List[int]],
+    sparse_values: List[List[float]]
+) -> List[Dict[str, Any]]:
+    """Build the named vectors of every point for a layout."""
+    named: Dict[str, np.ndarray] = {}
+    if layout.get("use_matryoshka"):
+        for i in range(layout.get("matryoshka_levels", 3)):
+            size = dense.shape[1] // (2 ** i)
+            named[f"matryoshka-{size}dim"] = dense[:, :size]
+    else:
+        named["dense"] = dense.astype(np.float16) if layout.get("dense_datatype") == "float16" else dense
+        if layout.get("build_with_quantized"):
+            named["dense-uint8"] = dbms.quantize_vector(dense, dense)
+
+    sparse_indices, sparse_values = layout_sparse(layout, sparse_indices, sparse_values)
+    vectors = []
+    for row, (indices, values) in enumerate(zip(sparse_indices, sparse_values)):
+        vector = {name: matrix[row].tolist() for name, matrix in named.items()}
+        vector["sparse"] = models.SparseVector(indices=indices, values=values)
+        vectors.append(vector)
+    return vectors
+
+
+def estimate_memory(layout: Dict[str, Any], points: int, dim: int, sparse_nnz: int, hnsw_m: int) -> int:
+    """
+    Rough RAM footprint in bytes of the vectors, HNSW links and sparse index of a layout.
+
+    Qdrant does not report memory per collection, so this counts float32 (or
+    float16) storage per named vector, one byte per dimension for int8
+    quantization, about 2m 4-byte links per point per HNSW graph and 8 bytes per
+    sparse weight. Vectors kept on disk are left out; they are served from the
+    page cache.
+    """
+    primary_bytes = 2 if layout.get("dense_datatype") == "float16" else 4
+    if layout.get("dense_on_disk"):
+        primary_bytes = 0
+
+    if layout.get("use_matryoshka"):
+        dims = [dim // (2 ** i) for i in range(layout.get("matryoshka_levels", 3))]
+        vector_bytes = sum(points * d * primary_bytes for d in dims)
+    elif layout.get("build_with_quantized"):
+        # "dense-uint8" keeps float32 originals next to its int8 quantized copy
+        dims = [dim, dim]
+        vector_bytes = points * dim * primary_bytes + points * dim * 4 + points * dim
+    else:
+        dims = [dim]
+        vector_bytes = points * dim * primary_bytes
+    graph_bytes = len(dims) * points * hnsw_m * 2 * 4
+    return vector_bytes + graph_bytes + sparse_nnz * 8
+
+
+async def build_layouts(
+    dbms: QdrantDBManager,
+    names: List[str],
+    documents: List[Dict[str, Any]],
+    encoded: Tuple[np.ndarray, List[List[int]], List[List[float]]],
+    args: argparse.Namespace
+) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    Create and fill one collection per layout, waiting until each is indexed.
+
+    Returns the collection of each layout and the number of late-interaction
+    token vectors stored by layouts that have them.
+    """
+    collections, token_counts = {}, {}
+    for name in names:
+        collection_name = f"benchmark-retrieval-{name}"
+        dbms.recreate_collection(collection_name=collection_name, bulk_load=True, **LAYOUTS[name])
+
+        vectors = layout_vectors(dbms, LAYOUTS[name], *layout_encoded(dbms, LAYOUTS[name], documents, encoded))
+        if LAYOUTS[name].get("late_interaction"):
+            multivectors = dbms.late_interaction_vectors([doc["document"] for doc in documents])
+            for vector, tokens in zip(vectors, multivectors):
+                vector[LATE_INTERACTION_VECTOR] = tokens
+            token_counts[name] = sum(len(tokens) for tokens in multivectors)
+        for i in range(0, len(documents), args.batch_size):
+            dbms.client.upsert(
+                collection_name=collection_name,
+                points=[
+                    models.PointStruct(id=doc["id"], vector=vector, payload={"document": doc["document"]})
+                    for doc, vector in zip(documents[i:i + args.batch_size], vectors[i:i + args.batch_size])
+                ]
+            )
+
+        # The default indexing threshold would leave a small benchmark collection unindexed
+        dbms.client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=args.indexing_threshold)
+        )
+        seconds = await dbms.wait_for_indexing(collection_name, poll_interval=0.5)
+        logging.info(f"Layout '{name}' indexed in {seconds:.1f}s")
+        collections[name] = collection_name
+    return collections, token_counts
+
+
+def encode_queries(dbms: QdrantDBManager, layout: Dict[str, Any], queries: List[str], calibration: np.ndarray):
+    """Encode the queries for a layout, returning them with the mean total and sparse-only encoding time."""
+    sparse_mode = layout.get("sparse_mode", "splade")
+    started = time.perf_counter()
+    encoded = dbms._encode_queries(
+        queries,
+        use_matryoshka=layout.get("use_matryoshka", False),
+        matryoshka_levels=layout.get("matryoshka_levels", 3),
+        build_with_quantized=layout.get("build_with_quantized", False),
+        calibration_embeddings=calibration,
+        sparse_pruning=layout.get("query_sparse_pruning"),
+        sparse_mode=sparse_mode,
+        late_interaction=layout.get("late_interaction", False)
+    )
+    encode_ms = (time.perf_counter() - started) * 1000 / max(len(queries), 1)
+
+    # Timed again on its own, it is the whole query encoding cost of a sparse-only search
+    started = time.perf_counter()
+    dbms.sparse_vectors(queries, is_query=True, sparse_mode=sparse_mode)
+    sparse_encode_ms = (time.perf_counter() - started) * 1000 / max(len(queries), 1)
+    return list(zip(*encoded)), encode_ms, sparse_encode_ms
+
+
+def run_query(
+    dbms: QdrantDBManager,
+    collection_name: str,
+    layout: Dict[str, Any],
+    mode: str,
+    query: Tuple[Dict[str, List[float]], List[int], List[float]],
+    top_k: int,
+    exact: bool = False
+) -> List[Any]:
+    """Run one search and return the ids of the top k points."""
+    dense, indices, values = query
+    profile = dbms.get_collection_profile(collection_name)
+    search_params = profile.search_params(exact=exact)
+
+    if mode == "dense":
+        response = dbms.client.query_points(
+            collection_name=collection_name, query=dense["dense"], using="dense",
+            limit=top_k, search_params=search_params, with_payload=False)
+        points = response.points
+    elif mode == "sparse":
+        response = dbms.client.query_points(
+            collection_name=collection_name, query=models.SparseVector(indices=indices, values=values),
+            using="sparse", limit=top_k, search_params=search_params, with_payload=False)
+        points = response.points
+    else:
+        fusion = profile.fusion_options(top_k)
+        requests = dbms._build_hybrid_query(
+            dense, indices, values,
+            top_k=top_k,
+            search_params=search_params,
+            use_matryoshka=layout.get("use_matryoshka", False),
+            build_with_quantized=layout.get("build_with_quantized", False),
+            fusion=fusion,
+            late_interaction_k=fusion.dense_limit + fusion.sparse_limit if layout.get("late_interaction") else None
+        )
+        for request in requests:
+            request.with_payload = False
+        responses = dbms.client.query_batch_points(collection_name=collection_name, requests=requests)
+        points = dbms._fuse_responses(responses, top_k, fusion)
+
+    return [point.id for point in points]
+
+
+def score(results: List[List[Any]], truth: List[List[Any]], labels: List[Dict[str, Any]], top_k: int) -> Dict[str, float]:
+    recalls, reciprocal_ranks = [], []
+    for ids, exact_ids, label in zip(results, truth, labels):
+        if exact_ids:
+            recalls.append(len(set(ids[:top_k]) & set(exact_ids[:top_k])) / len(exact_ids[:top_k]))
+        relevant = {str(r) for r in label.get("relevant", [])}
+        rank = next((i + 1 for i, point_id in enumerate(ids[:top_k]) if str(point_id) in relevant), None)
+        reciprocal_ranks.append(1 / rank if rank else 0.0)
+    return {
+        "recall@k": round(statistics.mean(recalls), 4) if recalls else None,
+        "mrr@k": round(statistics.mean(reciprocal_ranks), 4) if reciprocal_ranks else None,
+    }
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    unknown = set(args.configs) - set(CONFIGURATIONS)
+    if unknown:
+        raise SystemExit(f"Unknown configurations {sorted(unknown)}, expected {list(CONFIGURATIONS)}")
+    LAYOUTS["pruned"] = {
+        "document_sparse_pruning": SparsePruning(top_n=args.sparse_top_n, mass=args.sparse_mass),
+        "query_sparse_pruning": SparsePruning(top_n=args.query_sparse_top_n, mass=args.query_sparse_mass),
+    }
+
+    dbms = load_manager(args.host, args.port, args.path)
+    if args.documents:
+        documents = load_documents_file(args.documents, args.text_field, args.limit)
+    else:
+        documents = load_documents(args.dataset, args.split, args.text_field, args.limit)
+    labels = load_labels(args.labels) if args.labels else sample_queries(documents, args.num_queries, args.seed)
+    queries = [label["query"] for label in labels]
+
+    encoded = encode_corpus(dbms, documents)
+    dense = encoded[0]
+
+    # The exact plain-layout hybrid search is the reference for every configuration
+    layout_names = sorted({"plain", *(CONFIGURATIONS[name]["layout"] for name in args.configs)})
+    collections, token_counts = await build_layouts(dbms, layout_names, documents, encoded, args)
+
+    try:
+        plain_queries, _, _ = encode_queries(dbms, LAYOUTS["plain"], queries, dense)
+        truth = [
+            run_query(dbms, collections["plain"], LAYOUTS["plain"], "hybrid", query, args.top_k, exact=True)
+            for query in plain_queries
+        ]
+
+        rows = []
+        for name in args.configs:
+            config = CONFIGURATIONS[name]
+            layout = LAYOUTS[config["layout"]]
+            collection_name = collections[config["layout"]]
+            encoded_queries, encode_ms, sparse_encode_ms = encode_queries(dbms, layout, queries, dense)
+
+            # Warm up caches and connections before timing
+            for query in encoded_queries[:5]:
+                run_query(dbms, collection_name, layout, config["mode"], query, args.top_k)
+
+            results, latencies = [], []
+            for query in encoded_queries:
+                started = time.perf_counter()
+                results.append(run_query(dbms, collection_name, layout, config["mode"], query, args.top_k))
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            _, layout_indices, layout_values = layout_encoded(dbms, layout, documents, encoded)
+            sparse_nnz = sum(len(indices) for indices in layout_sparse(layout, layout_indices, layout_values)[0])
+            memory = estimate_memory(
+                layout, len(documents), dense.shape[1], sparse_nnz,
+                dbms.get_collection_profile(collection_name).hnsw_m)
+            rows.append({
+                "config": name,
+                "layout": config["layout"],
+                **score(results, truth, labels, args.top_k),
+                "p50_ms": round(statistics.median(latencies), 2),
+                "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+                "encode_ms": round(encode_ms, 2),
+                "sparse_encode_ms": round(sparse_encode_ms, 3),
+                "sparse_terms_per_doc": round(sparse_nnz / max(len(documents), 1), 1),
+                "est_memory_mb": round(memory / 2 ** 20, 1),
+                # float16 token vectors, kept on disk and read only for rescored candidates
+                "multivector_mb": round(
+                    token_counts[config["layout"]] * dbms.late_interaction_size() * 2 / 2 ** 20, 1
+                ) if config["layout"] in token_counts else 0.0,
+            })
+            logging.info(f"{name}: {rows[-1]}")
+    finally:
+        if not args.keep:
+            for collection_name in collections.values():
+                dbms.delete_collection_version(collection_name)
+
+    print()
+    print(" ".join(f"{column:>14}" for column in REPORT_COLUMNS))
+    for row in rows:
+        print(" ".join(f"{str(row[column]):>14}" for column in REPORT_COLUMNS))
+
+    write_report({
+        "documents": len(documents),
+        "queries": len(queries),
+        "labels": args.labels or "sampled",
+        "top_k": args.top_k,
+        "results": rows
+    }, f"{args.output}.json")
+    write_markdown(rows, REPORT_COLUMNS, f"{args.output}.md", title=f"Retrieval benchmark ({len(documents)} documents, k={args.top_k})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
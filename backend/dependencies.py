@@ -14,6 +14,14 @@ DENSE_MODEL = os.getenv("DENSE_MODEL", "mixedbread-ai/mxbai-embed-large-v1")
 SPARSE_MODEL_DOCS = os.getenv("SPARSE_MODEL_DOCS", "naver/efficient-splade-VI-BT-large-doc")
 SPARSE_MODEL_QUERY = os.getenv("SPARSE_MODEL_QUERY", "naver/efficient-splade-VI-BT-large-query")
 RERANK_MODEL = os.getenv("RERANK_MODEL", None)
+LATE_INTERACTION_MODEL = os.getenv("LATE_INTERACTION_MODEL", "answerdotai/answerai-colbert-small-v1")
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "1024"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD")) if os.getenv("SEMANTIC_CACHE_THRESHOLD") else None
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "1024"))
+QDRANT_PATH = os.getenv("QDRANT_PATH") or None
+# Who may set X-Tenant-ID: gateway addresses or networks, and/or the key signing X-Tenant-Signature
+TENANT_TRUSTED_PROXIES = [proxy for proxy in os.getenv("TENANT_TRUSTED_PROXIES", "").split(",") if proxy.strip()]
+TENANT_SIGNING_KEY = os.getenv("TENANT_SIGNING_KEY") or None
 
 # Global instances
 database: Optional[databases.Database] = None
@@ -0,0 +1,77 @@
+"""
+Move per-team collections into one collection shared by tenants.
+
+Points are copied with their vectors, so nothing is re-embedded. Each source
+collection becomes one tenant of the target, which is created with the first
+source's settings and vector layout when it does not exist. No embedding model
+is loaded.
+
+Usage (from the backend directory):
+    python -m deploy.qdrant.migrate_tenants --target shared --source legal-docs=legal hr-docs=hr
+    python -m deploy.qdrant.migrate_tenants --target shared --source legal-docs=legal --delete-sources
+"""
+import argparse
+import logging
+import sys
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+from routes.collections.manager import QdrantDBManager
+from routes.collections.tenancy import DEFAULT_TENANT_FIELD
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Copy per-team collections into a collection shared by tenants")
+    parser.add_argument("--target", type=str, required=True, help="Shared collection, created when missing")
+    parser.add_argument("--source", type=str, nargs="+", required=True,
+                        help="Source collections as COLLECTION=TENANT_ID")
+    parser.add_argument("--tenant-field", type=str, default=DEFAULT_TENANT_FIELD,
+                        help="Payload key holding the tenant when the target is created")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points copied per batch")
+    parser.add_argument("--delete-sources", action="store_true", help="Delete each source once copied")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    parser.add_argument("--path", type=str, default=None, help="Embedded Qdrant storage directory instead of a server")
+    return parser.parse_args()
+
+
+def parse_sources(sources: List[str]) -> Dict[str, str]:
+    parsed = {}
+    for source in sources:
+        collection, separator, tenant_id = source.partition("=")
+        if not separator or not collection or not tenant_id:
+            raise ValueError(f"Expected COLLECTION=TENANT_ID, got '{source}'")
+        parsed[collection] = tenant_id
+    return parsed
+
+
+def main():
+    args = parse_args()
+    load_dotenv(override=True)
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        sources = parse_sources(args.source)
+        # Points keep their vectors and a new target copies the source's vector layout, no model is loaded
+        dbms = QdrantDBManager(host=args.host, port=args.port, path=args.path)
+
+        copied = dbms.migrate_to_tenant_collection(
+            sources,
+            args.target,
+            tenant_field=args.tenant_field,
+            batch_size=args.batch_size,
+            delete_sources=args.delete_sources
+        )
+    except Exception as e:
+        print("\nError: Migration failed")
+        print(f"Details: {str(e)}")
+        sys.exit(1)
+
+    print(f"\nMigrated into '{args.target}':")
+    for source, count in copied.items():
+        print(f"• {source} → tenant '{sources[source]}': {count} points")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Back up, restore and clone collections with Qdrant snapshots instead of rebuilding them.
+
+Snapshot files are streamed in chunks, so memory stays bounded whatever the
+collection size. Collection settings (profile, sparse mode, tenant field, ...)
+are kept outside Qdrant, so `download` writes them next to the snapshot as
+`<file>.settings.json` and `upload` reads them back. Restoring requires
+the settings; `--settings` may name a file holding `{}` to restore with defaults.
+
+Usage (from the backend directory):
+    python -m deploy.qdrant.snapshots download picollm --output picollm.snapshot
+    python -m deploy.qdrant.snapshots upload picollm --file picollm.snapshot --host qdrant.staging
+    python -m deploy.qdrant.snapshots recover picollm --location https://bucket.example/picollm.snapshot \
+        --settings picollm.snapshot.settings.json
+    python -m deploy.qdrant.snapshots clone picollm --target picollm-experiment
+    python -m deploy.qdrant.snapshots list picollm
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+
+from routes.collections.manager import QdrantDBManager
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage Qdrant collection snapshots")
+    parser.add_argument("--host", type=str, default="localhost", help="Qdrant host")
+    parser.add_argument("--port", type=int, default=6333, help="Qdrant port")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Create a snapshot on the Qdrant server")
+    create.add_argument("collection", help="Collection or alias")
+
+    listing = commands.add_parser("list", help="List the snapshots of a collection")
+    listing.add_argument("collection", help="Collection or alias")
+
+    download = commands.add_parser("download", help="Stream a snapshot to a local file")
+    download.add_argument("collection", help="Collection or alias")
+    download.add_argument("--output", type=str, required=True, help="Snapshot file to write")
+    download.add_argument("--snapshot", type=str, default=None,
+                          help="Existing snapshot name (a new snapshot is created and removed from the server by default)")
+
+    upload = commands.add_parser("upload", help="Restore a local snapshot file as a new version of a collection")
+    upload.add_argument("collection", help="Alias to serve the restored collection under")
+    upload.add_argument("--file", type=str, required=True, help="Snapshot file")
+    upload.add_argument("--settings", type=str, default=None, help="Settings JSON (defaults to <file>.settings.json)")
+    upload.add_argument("--keep-versions", type=int, default=2, help="Versions kept for rollback")
+
+    recover = commands.add_parser("recover", help="Restore a snapshot Qdrant downloads from a URL")
+    recover.add_argument("collection", help="Alias to serve the restored collection under")
+    recover.add_argument("--location", type=str, required=True, help="Snapshot URL reachable by the Qdrant server")
+    recover.add_argument("--checksum", type=str, default=None, help="Expected SHA-256 of the snapshot")
+    recover.add_argument("--settings", type=str, required=True, help="Settings JSON file")
+    recover.add_argument("--keep-versions", type=int, default=2, help="Versions kept for rollback")
+
+    clone = commands.add_parser("clone", help="Copy a collection under a new name")
+    clone.add_argument("collection", help="Collection or alias to copy")
+    clone.add_argument("--target", type=str, required=True, help="Name of the copy")
+    clone.add_argument("--keep-versions", type=int, default=2, help="Versions of the target kept for rollback")
+
+    delete = commands.add_parser("delete", help="Delete a snapshot from the Qdrant server")
+    delete.add_argument("collection", help="Collection or alias")
+    delete.add_argument("--snapshot", type=str, required=True, help="Snapshot name")
+
+    return parser.parse_args()
+
+
+def read_settings(path: str):
+    if not os.path.exists(path):
+        raise ValueError(f"Settings file '{path}' not found, pass the settings saved with the snapshot with --settings")
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    args = parse_args()
+    load_dotenv(override=True)
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        # Snapshots move stored vectors, no embedding model is loaded
+        dbms = QdrantDBManager(host=args.host, port=args.port)
+
+        if args.command == "create":
+            result = dbms.create_snapshot(args.collection)
+        elif args.command == "list":
+            result = dbms.list_snapshots(args.collection)
+        elif args.command == "download":
+            snapshot = dbms.create_snapshot(args.collection) if args.snapshot is None else None
+            name = args.snapshot or snapshot["name"]
+            try:
+                size = dbms.download_snapshot(args.collection, name, args.output)
+            finally:
+                if snapshot:
+                    dbms.delete_snapshot(args.collection, name)
+            settings = dbms.get_collection_settings(dbms.resolve_collection(args.collection))
+            with open(f"{args.output}.settings.json", "w") as f:
+                json.dump(settings, f, indent=2)
+            result = {"snapshot": name, "path": args.output, "size": size}
+        elif args.command == "upload":
+            with open(args.file, "rb") as f:
+                physical = dbms.restore_snapshot(
+                    args.collection,
+                    fileobj=f,
+                    filename=os.path.basename(args.file),
+                    settings=read_settings(args.settings or f"{args.file}.settings.json"),
+                    keep_versions=args.keep_versions
+                )
+            result = {"collection": args.collection, "physical_collection": physical}
+        elif args.command == "recover":
+            physical = dbms.restore_snapshot(
+                args.collection,
+                location=args.location,
+                checksum=args.checksum,
+                settings=read_settings(args.settings),
+                keep_versions=args.keep_versions
+            )
+            result = {"collection": args.collection, "physical_collection": physical}
+        elif args.command == "clone":
+            result = dbms.clone_collection(args.collection, args.target, keep_versions=args.keep_versions)
+        else:
+            dbms.delete_snapshot(args.collection, args.snapshot)
+            result = {"deleted": args.snapshot}
+    except Exception as e:
+        print(f"\nError: Snapshot {args.command} failed")
+        print(f"Details: {str(e)}")
+        sys.exit(1)
+
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
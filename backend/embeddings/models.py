@@ -29,6 +29,7 @@ class EmbeddingModels:
             self.dense = None
             self.query_sparse = None
             self.doc_sparse = None
+            self.late_interaction = None
             self._configs = {}
             self._initialized = True
             self._log_system_info()
@@ -46,7 +47,7 @@ class EmbeddingModels:
     
     def configure(self, **kwargs):
         """Configure models from kwargs or environment"""
-        model_types = ['query', 'doc', 'dense']
+        model_types = ['query', 'doc', 'dense', 'late']
         for t in model_types:
             key = f"{t}_model_name"
             self._configs[t] = kwargs.get(key) or os.environ.get(key.upper())
@@ -72,7 +73,7 @@ class EmbeddingModels:
         return SparseEncoder(model_name)
     
     @staticmethod
-    @lru_cache(maxsize=2)
+    @lru_cache(maxsize=3)
     def _load_dense(model_name: str, device: str) -> SentenceTransformer:
         """Load sentence transformer with optional ONNX backend"""
         backend = os.environ.get('SENTENCE_TRANSFORMER_BACKEND')
@@ -128,6 +129,20 @@ class EmbeddingModels:
                 self.dense = self.dense.to(self.device)
         
         self._log_model_status()
+
+    def get_late_interaction(self) -> SentenceTransformer:
+        """
+        Token embedding model for late-interaction vectors, loaded on first use.
+
+        It is kept out of `initialize` so deployments without late-interaction
+        collections never load it.
+        """
+        if self.late_interaction is None:
+            if not self._configs.get('late'):
+                raise ValueError("No late interaction model configured (set LATE_INTERACTION_MODEL)")
+            device_str = "cuda" if self._check_gpu_memory() else "cpu"
+            self.late_interaction = self._load_dense(self._configs['late'], device_str)
+        return self.late_interaction
     
     def _log_model_status(self):
         """Log model placement summary"""
@@ -151,7 +166,7 @@ class EmbeddingModels:
         """Release all resources"""
         logger.info("Cleaning up models")
         
-        for attr in ['dense', 'query_sparse', 'doc_sparse']:
+        for attr in ['dense', 'query_sparse', 'doc_sparse', 'late_interaction']:
             if hasattr(self, attr):
                 setattr(self, attr, None)
         
@@ -10,6 +10,7 @@ import databases
 from dependencies import QdrantDBManager
 from routes.sessions import chat_sessions, export
 from routes.collections import qdrant
+from routes.collections.tenancy import TenantMiddleware
 from routes.tools import tools
 from routes.providers import anthropic, openai
 from routes.models import models
@@ -60,11 +61,16 @@ async def lifespan(app: FastAPI):
         embedding_models.configure(
             query_model_name=dependencies.SPARSE_MODEL_QUERY,
             doc_model_name=dependencies.SPARSE_MODEL_DOCS,
-            dense_model_name=dependencies.DENSE_MODEL
+            dense_model_name=dependencies.DENSE_MODEL,
+            late_model_name=dependencies.LATE_INTERACTION_MODEL
         )
         
         qdrant_manager = QdrantDBManager(
-            embeddings=embedding_models
+            embeddings=embedding_models,
+            result_cache_size=dependencies.RESULT_CACHE_SIZE,
+            semantic_cache_threshold=dependencies.SEMANTIC_CACHE_THRESHOLD,
+            semantic_cache_size=dependencies.SEMANTIC_CACHE_SIZE,
+            path=dependencies.QDRANT_PATH
         )
         
         # Initialize Ollama client
@@ -113,6 +119,13 @@ middleware = [
         allow_credentials=True,
         allow_methods=['*'],
         allow_headers=['*']
+    ),
+    # Searches, builds and tool calls on shared collections are scoped to the X-Tenant-ID header,
+    # accepted only from the trusted gateway or with a valid signature
+    Middleware(
+        TenantMiddleware,
+        trusted_proxies=dependencies.TENANT_TRUSTED_PROXIES,
+        signing_key=dependencies.TENANT_SIGNING_KEY
     )
 ]
 
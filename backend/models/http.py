@@ -363,6 +363,81 @@ class CollectionBuildRequest(BaseModel):
     batch_size: int = Field(32, description="Processing batch size")
     use_quantization: bool = Field(False, description="Enable vector quantization")
     use_matryoshka: bool = Field(False, description="Enable matryoshka embeddings")
+    enable_chunking: bool = Field(True, description="Split documents longer than the embedding model's context window")
+    chunk_size: Optional[int] = Field(None, description="Chunk length in tokens (defaults to the dense model's max sequence length)", gt=8)
+    chunk_overlap: int = Field(64, description="Tokens shared between consecutive chunks", ge=0)
+    keep_versions: int = Field(2, description="Number of collection versions to keep for rollback", ge=1)
+    bulk_load: bool = Field(True, description="Defer HNSW indexing until all documents are inserted")
+    profile: Literal["low-latency-ram", "balanced", "large-mmap"] = Field(
+        "balanced", description="Storage/latency profile for HNSW, on-disk storage and default search ef"
+    )
+    dense_datatype: Literal["float32", "float16"] = Field(
+        "float32", description="Storage type of the dense vectors. float16 halves their memory"
+    )
+    dense_on_disk: Optional[bool] = Field(
+        None, description="Keep the dense vectors memory-mapped on disk. Defaults to the profile's setting"
+    )
+    sparse_mode: Literal["splade", "bm25"] = Field(
+        "splade", description="Sparse encoder. bm25 needs no model at query time and lets Qdrant apply IDF"
+    )
+    late_interaction: bool = Field(
+        False, description="Store per-token embeddings as a multivector used to rescore search candidates"
+    )
+    schema_sample_size: int = Field(
+        5000, ge=1, description="Points kept in the reservoir sample used to type payload indexes"
+    )
+    sparse_top_n: Optional[int] = Field(None, ge=1, description="Keep at most this many sparse weights per document")
+    sparse_mass: Optional[float] = Field(
+        None, gt=0.0, le=1.0, description="Keep the highest sparse weights covering this fraction of each document's total weight"
+    )
+    query_sparse_top_n: Optional[int] = Field(None, ge=1, description="Keep at most this many sparse weights per query")
+    query_sparse_mass: Optional[float] = Field(
+        None, gt=0.0, le=1.0, description="Keep the highest sparse weights covering this fraction of each query's total weight"
+    )
+
+class IndexAdviceApplyRequest(BaseModel):
+    fields: Optional[List[str]] = Field(None, description="Only apply advice for these fields (all recommendations when omitted)")
+    drop: bool = Field(False, description="Also drop indexes no observed search used")
+    min_searches: int = Field(100, ge=1, description="Searches to observe before recommending anything")
+    min_observed_seconds: float = Field(
+        86400, ge=0, description="Time to observe searches before recommending a drop"
+    )
+
+class TenantCollectionRequest(BaseModel):
+    collection_name: str = Field(..., description="Name of the shared collection")
+    tenant_field: str = Field("tenant_id", description="Payload key holding each point's tenant")
+    enable_chunking: bool = Field(True, description="Create the chunk payload indexes")
+    profile: Literal["low-latency-ram", "balanced", "large-mmap"] = Field(
+        "balanced", description="Storage/latency profile for HNSW, on-disk storage and default search ef"
+    )
+    dense_datatype: Literal["float32", "float16"] = Field("float32", description="Storage type of the dense vectors")
+    sparse_mode: Literal["splade", "bm25"] = Field("splade", description="Sparse encoder")
+    late_interaction: bool = Field(False, description="Store per-token embeddings as a multivector")
+
+class TenantMigrationRequest(BaseModel):
+    target_collection: str = Field(..., description="Shared collection to copy into, created when missing")
+    sources: Dict[str, str] = Field(..., min_length=1, description="Per-team collection -> tenant id")
+    tenant_field: str = Field("tenant_id", description="Payload key holding the tenant when the target is created")
+    batch_size: int = Field(256, ge=1, le=4096, description="Points copied per batch")
+    delete_sources: bool = Field(False, description="Delete each source collection once copied")
+
+class SnapshotRecoverRequest(BaseModel):
+    location: str = Field(..., description="URL (or file:// path on the Qdrant server) of the snapshot to recover")
+    checksum: Optional[str] = Field(None, description="Expected SHA-256 of the snapshot file")
+    settings: Dict[str, Any] = Field(..., description="Collection settings returned when the snapshot was created ({} for default settings)")
+    keep_versions: int = Field(2, ge=1, description="Number of collection versions to keep for rollback")
+
+class CollectionCloneRequest(BaseModel):
+    target_collection: str = Field(..., description="Name the copy is served under")
+    keep_versions: int = Field(2, ge=1, description="Number of versions of the target to keep for rollback")
+
+class CollectionRollbackRequest(BaseModel):
+    version: Optional[str] = Field(None, description="Physical collection to activate (defaults to the previous version)")
+
+class CollectionVersionsResponse(BaseModel):
+    alias: str
+    active: str
+    versions: List[str]
 
 class SearchResult(BaseModel):
     content: str
@@ -383,12 +458,114 @@ class FilteredSearchRequest(BaseModel):
         description="Filter criteria to refine search results. Can include 'must', 'should', and 'must_not' conditions."
     )
     top_k: int = Field(default=5, description="Number of top results to retrieve")
-    alpha: float = Field(default=0.5, description="Alpha value for relative score fusion")
+    alpha: Optional[float] = Field(
+        default=None, ge=0.0, le=1.0,
+        description="Weight of the dense branch for weighted fusion. The collection profile's default when omitted."
+    )
     rerank: bool = Field(default=False, description="Whether to rerank the results")
+    use_cache: bool = Field(default=True, description="Serve repeated searches from the result cache")
+    use_semantic_cache: bool = Field(default=True, description="Also serve reworded repeats of a search when the semantic cache is enabled")
+    payload_fields: Optional[List[str]] = Field(
+        default=None,
+        description="Payload fields to return besides the document text. All fields except sparse weights when omitted."
+    )
+    fusion: Optional[Literal["rrf", "dbsf", "weighted"]] = Field(
+        default=None,
+        description="Fusion of the dense and sparse branches. The collection profile's default when omitted."
+    )
+    dense_limit: Optional[int] = Field(default=None, ge=1, description="Candidates fetched by the dense branch")
+    sparse_limit: Optional[int] = Field(default=None, ge=1, description="Candidates fetched by the sparse branch")
+    hnsw_ef: Optional[int] = Field(default=None, ge=1, description="HNSW ef for this search. The collection profile's default when omitted.")
+    exact: bool = Field(default=False, description="Score every matching point instead of using the HNSW index")
+    use_planner: bool = Field(
+        default=True,
+        description="Count the points matching the filters and score them exhaustively when few match"
+    )
+    group_by: Optional[str] = Field(
+        default=None,
+        description="Payload field to group results by, e.g. parent_id. Returns top_k groups instead of top_k points."
+    )
+    group_size: int = Field(default=1, ge=1, le=10, description="Hits returned per group when grouping")
+    diversify: bool = Field(default=False, description="Rerank over-fetched candidates with maximal marginal relevance")
+    mmr_lambda: float = Field(default=0.5, ge=0.0, le=1.0, description="MMR trade-off, 1.0 ranks by relevance only")
+    fetch_k: Optional[int] = Field(default=None, ge=1, le=200, description="Candidates reranked by MMR, 4 x top_k when omitted")
+    duplicate_threshold: Optional[float] = Field(
+        default=0.95, ge=0.0, le=1.0,
+        description="Drop results whose cosine similarity to a kept result reaches this value when diversifying"
+    )
+    late_interaction: Optional[bool] = Field(
+        default=None,
+        description="Rescore fused candidates with MaxSim on token embeddings. On when the collection has them, if omitted."
+    )
+    rescore_k: Optional[int] = Field(default=None, ge=1, le=1000, description="Fused candidates rescored by late interaction, all of them when omitted")
 
 class SearchResponse(BaseModel):
     results: List[SearchResult]
 
+class MultiCollectionSearchRequest(BaseModel):
+    query: str
+    collection_names: List[str] = Field(..., description="Collections to search", min_length=1, max_length=32)
+    filters: Optional[Dict[str, List[Dict[str, Any]]]] = Field(
+        default=None,
+        description="Filter criteria applied in every collection. Can include 'must', 'should', and 'must_not' conditions."
+    )
+    top_k: int = Field(default=5, description="Number of top results to retrieve across all collections")
+    collection_fusion: Literal["rrf", "normalized"] = Field(
+        default="rrf",
+        description="Merge per-collection rankings by rank (rrf) or by min-max normalized score"
+    )
+    use_cache: bool = Field(default=True, description="Serve repeated searches from the result cache")
+    payload_fields: Optional[List[str]] = Field(
+        default=None,
+        description="Payload fields to return besides the document text. All fields except sparse weights when omitted."
+    )
+    group_by: Optional[str] = Field(
+        default=None,
+        description="Payload field to group results by, e.g. parent_id. Returns top_k groups instead of top_k points."
+    )
+    group_size: int = Field(default=1, ge=1, le=10, description="Hits returned per group when grouping")
+
+class BatchSearchQuery(BaseModel):
+    query: str
+    filters: Optional[Dict[str, List[Dict[str, Any]]]] = Field(
+        default=None,
+        description="Filter criteria for this query. Can include 'must', 'should', and 'must_not' conditions."
+    )
+    top_k: int = Field(default=5, description="Number of top results to retrieve for this query")
+
+class BatchSearchRequest(BaseModel):
+    collection_name: str = Field(..., description="Name of the collection to search")
+    searches: List[BatchSearchQuery] = Field(..., description="Queries to run", min_length=1, max_length=256)
+    use_cache: bool = Field(default=True, description="Serve repeated searches from the result cache")
+    payload_fields: Optional[List[str]] = Field(
+        default=None,
+        description="Payload fields to return besides the document text. All fields except sparse weights when omitted."
+    )
+    alpha: Optional[float] = Field(
+        default=None, ge=0.0, le=1.0,
+        description="Weight of the dense branch for weighted fusion. The collection profile's default when omitted."
+    )
+    fusion: Optional[Literal["rrf", "dbsf", "weighted"]] = Field(
+        default=None,
+        description="Fusion of the dense and sparse branches. The collection profile's default when omitted."
+    )
+    dense_limit: Optional[int] = Field(default=None, ge=1, description="Candidates fetched by the dense branch")
+    sparse_limit: Optional[int] = Field(default=None, ge=1, description="Candidates fetched by the sparse branch")
+    hnsw_ef: Optional[int] = Field(default=None, ge=1, description="HNSW ef for this search. The collection profile's default when omitted.")
+    exact: bool = Field(default=False, description="Score every matching point instead of using the HNSW index")
+    use_semantic_cache: bool = Field(default=True, description="Also serve reworded repeats of a search when the semantic cache is enabled")
+    use_planner: bool = Field(
+        default=True,
+        description="Count the points matching the filters and score them exhaustively when few match"
+    )
+    late_interaction: Optional[bool] = Field(
+        default=None,
+        description="Rescore fused candidates with MaxSim on token embeddings. On when the collection has them, if omitted."
+    )
+
+class BatchSearchResponse(BaseModel):
+    results: List[SearchResponse] = Field(..., description="Results per query, in request order")
+
 
 class ConversationExportFormat(str, Enum):
     DEFAULT = "default"
@@ -0,0 +1,225 @@
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+from qdrant_client.http import models
+
+# Operators whose condition reads a payload value, mapped to the index type they need
+OPERATOR_SCHEMAS = {
+    "match_text": "text",
+    "datetime_range": "datetime",
+}
+
+# Operators answered from point ids or payload presence, which payload indexes do not speed up
+UNINDEXED_OPERATORS = {"has_id", "is_empty", "is_null", "values_count"}
+
+# Searches observed before anything is recommended; a handful of searches says little about a workload
+DEFAULT_MIN_SEARCHES = 100
+
+# Observation window before an unused index is proposed for removal, so daily jobs and reports are seen
+DEFAULT_MIN_OBSERVED_SECONDS = 24 * 3600
+
+
+class FieldUsage(BaseModel):
+    """How often searches of one collection filtered or grouped on a payload field."""
+    searches: int = 0
+    operators: Dict[str, int] = Field(default_factory=dict)
+    total_ms: float = 0.0
+    last_used: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.searches if self.searches else 0.0
+
+
+class IndexRecommendation(BaseModel):
+    """A payload index to create or drop, with the evidence behind it."""
+    action: Literal["create", "drop"]
+    field: str
+    schema_type: Optional[str] = Field(None, description="Index type to create: keyword, integer, float, bool, datetime or text")
+    is_tenant: bool = Field(False, description="Co-locate points by this keyword so per-value searches read fewer segments")
+    is_principal: bool = Field(False, description="Order storage by this numeric or datetime field for range filters")
+    reason: str
+
+
+class FilterUsageTracker:
+    """
+    Records which payload fields searches filter and group on, per collection.
+
+    Usage is kept in memory since process start, or since the collection's
+    usage was reset, which is the observation window the advisor bases drop
+    recommendations on.
+    """
+
+    def __init__(self):
+        self._usage: Dict[str, Dict[str, FieldUsage]] = {}
+        self._searches: Dict[str, int] = {}
+        self._started = time.time()
+        self._reset_at: Dict[str, float] = {}
+
+    def record(
+        self,
+        collection_name: str,
+        filter_params: Optional[Dict[str, Any]],
+        seconds: float,
+        group_by: Optional[str] = None
+    ):
+        """Record one search: every field its filter references and its latency."""
+        fields = Counter()
+        operators: Dict[str, set] = {}
+        for key, operator in self.fields(filter_params or {}):
+            fields[key] += 1
+            operators.setdefault(key, set()).add(operator)
+        if group_by:
+            fields[group_by] += 1
+            operators.setdefault(group_by, set()).add("group_by")
+
+        self._searches[collection_name] = self._searches.get(collection_name, 0) + 1
+        usage = self._usage.setdefault(collection_name, {})
+        now = time.time()
+        for key in fields:
+            field = usage.setdefault(key, FieldUsage())
+            field.searches += 1
+            field.total_ms += seconds * 1000
+            field.last_used = now
+            for operator in operators[key]:
+                field.operators[operator] = field.operators.get(operator, 0) + 1
+
+    @classmethod
+    def fields(cls, filter_params: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, str]]:
+        """Yield (payload key, operator) for every condition of a filter, nested keys as `parent[].child`."""
+        for clause in ("must", "should", "must_not", "nested"):
+            for condition in filter_params.get(clause) or []:
+                operator = condition.get("operator", "match")
+                key = condition.get("key")
+                if operator == "nested" and key:
+                    yield from cls.fields(condition.get("value") or {}, prefix=f"{prefix}{key}[].")
+                elif key and operator not in UNINDEXED_OPERATORS:
+                    yield f"{prefix}{key}", operator
+
+    def searches(self, collection_name: str) -> int:
+        return self._searches.get(collection_name, 0)
+
+    def usage(self, collection_name: str) -> Dict[str, FieldUsage]:
+        return self._usage.get(collection_name, {})
+
+    def observed_seconds(self, collection_name: Optional[str] = None) -> float:
+        return time.time() - self._reset_at.get(collection_name, self._started)
+
+    def reset(self, collection_name: str):
+        self._usage.pop(collection_name, None)
+        self._searches.pop(collection_name, None)
+        self._reset_at[collection_name] = time.time()
+
+
+def payload_values(payload: Dict[str, Any], key: str) -> List[Any]:
+    """Values at a payload key, following `a.b` objects and `a[].b` arrays."""
+    values = [payload]
+    for part in key.replace("[]", "").split("."):
+        found = []
+        for value in values:
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict) and part in item:
+                    found.append(item[part])
+        values = found
+    return values
+
+
+def infer_schema_type(operators: Dict[str, int], values: List[Any]) -> str:
+    """Pick the index type for a field from how it is filtered and from sampled payload values."""
+    for operator, schema_type in OPERATOR_SCHEMAS.items():
+        if operator in operators:
+            return schema_type
+
+    values = [v for value in values for v in (value if isinstance(value, list) else [value]) if v is not None]
+    if values and all(isinstance(v, bool) for v in values):
+        return "bool"
+    if values and all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return "integer"
+    if values and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return "float"
+    return "keyword"
+
+
+def index_params(recommendation: IndexRecommendation) -> Any:
+    """Qdrant index parameters for a create recommendation."""
+    schema_type = recommendation.schema_type
+    if schema_type == "keyword":
+        return models.KeywordIndexParams(type="keyword", is_tenant=recommendation.is_tenant or None)
+    if schema_type == "integer":
+        return models.IntegerIndexParams(type="integer", is_principal=recommendation.is_principal or None)
+    if schema_type == "float":
+        return models.FloatIndexParams(type="float", is_principal=recommendation.is_principal or None)
+    if schema_type == "datetime":
+        return models.DatetimeIndexParams(type="datetime", is_principal=recommendation.is_principal or None)
+    if schema_type == "text":
+        return models.TextIndexParams(type="text", tokenizer=models.TokenizerType.WORD, lowercase=True)
+    return schema_type
+
+
+def advise(
+    usage: Dict[str, FieldUsage],
+    searches: int,
+    indexed: Dict[str, Any],
+    samples: Dict[str, List[Any]],
+    min_searches: int = DEFAULT_MIN_SEARCHES,
+    min_share: float = 0.05,
+    partition_share: float = 0.5,
+    keep: Optional[List[str]] = None,
+    observed_seconds: float = 0.0,
+    min_observed_seconds: float = DEFAULT_MIN_OBSERVED_SECONDS
+) -> List[IndexRecommendation]:
+    """
+    Recommend payload indexes to create and drop from observed search usage.
+
+    Args:
+        usage: Field usage of the collection
+        searches: Searches observed for the collection
+        indexed: Payload schema of the collection (field name -> index info)
+        samples: Sampled payload values per used field
+        min_searches: Searches observed before any recommendation is made
+        min_share: Share of searches a field must appear in to be worth an index
+        partition_share: Share of searches filtering a field by equality (keyword) or
+            range (numeric, datetime) above which it is flagged as a partition key
+        keep: Indexed fields never recommended for removal
+        observed_seconds: How long usage has been recorded for
+        min_observed_seconds: Observation window required before recommending a drop
+    """
+    if searches < min_searches:
+        return []
+
+    recommendations = []
+    for field, field_usage in sorted(usage.items(), key=lambda item: -item[1].searches):
+        share = field_usage.searches / searches
+        if field in indexed or share < min_share:
+            continue
+
+        schema_type = infer_schema_type(field_usage.operators, samples.get(field, []))
+        equality = sum(field_usage.operators.get(op, 0) for op in ("match", "match_any")) / searches
+        ranged = sum(field_usage.operators.get(op, 0) for op in ("range", "datetime_range")) / searches
+        distinct = len({str(v) for v in samples.get(field, []) if v is not None})
+
+        is_tenant = schema_type == "keyword" and equality >= partition_share and distinct > 1
+        is_principal = schema_type in ("integer", "float", "datetime") and ranged >= partition_share
+        reason = (f"Filtered in {field_usage.searches}/{searches} searches "
+                  f"({field_usage.mean_ms:.1f}ms mean) without an index")
+        if is_tenant:
+            reason += f"; equality filter in {equality:.0%} of searches over {distinct}+ values, used as a partition key"
+        if is_principal:
+            reason += f"; range filter in {ranged:.0%} of searches"
+        recommendations.append(IndexRecommendation(
+            action="create", field=field, schema_type=schema_type,
+            is_tenant=is_tenant, is_principal=is_principal, reason=reason))
+
+    for field in sorted(indexed) if observed_seconds >= min_observed_seconds else []:
+        if field in usage or field in (keep or []):
+            continue
+        recommendations.append(IndexRecommendation(
+            action="drop", field=field,
+            reason=f"Not filtered or grouped on in {searches} searches over {observed_seconds / 3600:.1f}h"))
+
+    if recommendations:
+        logging.info(f"Payload index advice: {[(r.action, r.field) for r in recommendations]}")
+    return recommendations
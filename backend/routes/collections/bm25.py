@@ -0,0 +1,94 @@
+import re
+import zlib
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+# Common English function words that carry no lexical signal
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her
+here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
+def _singular(token: str) -> str:
+    """
+    Strip regular English plural endings so "searches" and "search" share a term.
+
+    "es" plurals of words ending in ch, sh, x or z are ambiguous ("searches" but
+    "caches"), so a final "e" after those letters is dropped from singulars too
+    and both forms meet on one stem ("cach", "siz").
+    """
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        if token.endswith("ies") and len(token) > 4:
+            return token[:-3] + "y"
+        token = token[:-2] if token.endswith(("ches", "shes", "xes", "zes", "sses")) else token[:-1]
+    if len(token) > 2 and token.endswith(("che", "she", "xe", "ze")):
+        token = token[:-1]
+    return token
+
+
+class BM25Encoder:
+    """
+    Lexical sparse encoder producing BM25 term weights, an alternative to SPLADE.
+
+    Terms are hashed to sparse indices, so there is no vocabulary to build or
+    store. Document vectors carry the BM25 term-frequency component; the inverse
+    document frequency is applied by Qdrant at query time through the IDF
+    modifier on the sparse vector, so it always reflects the current collection.
+    Query vectors weight each distinct term 1.0.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_length: float = 256.0):
+        """
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization strength
+            avg_doc_length: Expected document length in tokens after stopword removal
+        """
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_length = avg_doc_length
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """Lowercase word tokens without stopwords, with possessives and regular plurals stripped."""
+        tokens = []
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            token = token.split("'", 1)[0]
+            if token in STOPWORDS or len(token) < 2:
+                continue
+            tokens.append(_singular(token))
+        return tokens
+
+    @staticmethod
+    def term_index(term: str) -> int:
+        return zlib.crc32(term.encode("utf-8"))
+
+    def _encode(self, counts: Counter, weight) -> Tuple[List[int], List[float]]:
+        # Hash collisions are merged by summing their weights
+        vector = {}
+        for term, tf in counts.items():
+            index = self.term_index(term)
+            vector[index] = vector.get(index, 0.0) + weight(tf)
+        indices = sorted(vector)
+        return indices, [vector[i] for i in indices]
+
+    def encode_document(self, text: str) -> Tuple[List[int], List[float]]:
+        tokens = self.tokenize(text)
+        norm = self.k1 * (1 - self.b + self.b * len(tokens) / self.avg_doc_length)
+        return self._encode(Counter(tokens), lambda tf: tf * (self.k1 + 1) / (tf + norm))
+
+    def encode_query(self, text: str) -> Tuple[List[int], List[float]]:
+        return self._encode(Counter(set(self.tokenize(text))), lambda tf: 1.0)
+
+    def encode(self, texts: Iterable[str], is_query: bool = False) -> Tuple[List[List[int]], List[List[float]]]:
+        """Encode a batch of texts into sparse indices and values."""
+        encode = self.encode_query if is_query else self.encode_document
+        pairs = [encode(text) for text in texts]
+        return [indices for indices, _ in pairs], [values for _, values in pairs]
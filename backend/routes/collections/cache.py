@@ -0,0 +1,254 @@
+import copy
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SearchResultCache:
+    """
+    Bounded LRU cache of search results, invalidated by per-collection write versions.
+
+    Every entry is tagged with the write version of its collection when it was
+    stored. Writes bump the version, so entries cached before the write are never
+    served again and are dropped from memory right away.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: Maximum number of cached result lists
+            max_bytes: Approximate upper bound on cached text and metadata size
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, int, int, List[Any]]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(collection_name: str, query: str, filter_params: Optional[Dict[str, Any]], top_k: int, **params) -> str:
+        """
+        Build a cache key from the collection, normalized query, canonical filter and search options.
+        """
+        normalized_query = " ".join(query.lower().split())
+        return json.dumps(
+            [collection_name, normalized_query, filter_params or {}, top_k, params],
+            sort_keys=True,
+            default=str
+        )
+
+    def version(self, collection_name: str) -> int:
+        return self._versions.get(collection_name, 0)
+
+    def get(self, collection_name: str, key: str) -> Optional[List[Any]]:
+        """Return cached results for a key if they are still current."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        _, version, _, results = entry
+        if version != self.version(collection_name):
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Callers own the returned nodes, so mutating them never corrupts a later hit
+        return copy.deepcopy(results)
+
+    def put(self, collection_name: str, key: str, results: List[Any], version: Optional[int] = None):
+        """
+        Store results under a write version.
+
+        Pass the version read before the search was executed so results that
+        raced with a write are stored as already stale.
+        """
+        version = self.version(collection_name) if version is None else version
+        size = len(key) + sum(self._result_size(result) for result in results)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (collection_name, version, size, copy.deepcopy(results))
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def bump(self, collection_name: str):
+        """Record a write to a collection, invalidating its cached results."""
+        self._versions[collection_name] = self.version(collection_name) + 1
+        stale = [key for key, entry in self._entries.items() if entry[0] == collection_name]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        if stale:
+            logging.debug(f"Invalidated {len(stale)} cached searches for '{collection_name}'")
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry[2]
+
+    @staticmethod
+    def _result_size(result: Any) -> int:
+        text = getattr(result, "text", "") or ""
+        metadata = getattr(result, "metadata", None) or {}
+        return len(text) + sum(len(str(k)) + len(str(v)) for k, v in metadata.items())
+
+
+class SemanticQueryCache:
+    """
+    Bounded LRU cache serving results of earlier queries whose dense embedding is close enough.
+
+    Entries are grouped by context: the collection plus every search option
+    except the query text (filter, top_k, fusion, ...), so a cached result is
+    only reused for an identical search with reworded query. Each context keeps
+    a matrix of normalized query embeddings, and a lookup is one matrix-vector
+    product against it. Writes to a collection drop its entries, as in
+    `SearchResultCache`.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024):
+        """
+        Args:
+            threshold: Minimum cosine similarity between query embeddings for a hit
+            max_entries: Maximum number of cached queries across all collections
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[str, str, int, np.ndarray, str, List[Any]]]" = OrderedDict()
+        self._contexts: Dict[str, List[int]] = {}
+        self._matrices: Dict[str, np.ndarray] = {}
+        self._versions: Dict[str, int] = {}
+        self._next_id = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def version(self, collection_name: str) -> int:
+        return self._versions.get(collection_name, 0)
+
+    def get(self, collection_name: str, context: str, vector: np.ndarray) -> Optional[List[Any]]:
+        """Return the results of the most similar cached query in the context, if similar enough."""
+        ids = self._contexts.get(context)
+        if not ids:
+            self.misses += 1
+            return None
+
+        matrix = self._matrices.get(context)
+        if matrix is None:
+            matrix = self._matrices[context] = np.stack([self._entries[i][3] for i in ids])
+        similarities = matrix @ self._normalize(vector)
+        best = int(np.argmax(similarities))
+
+        entry_id = ids[best]
+        _, _, version, _, query, results = self._entries[entry_id]
+        if similarities[best] < self.threshold or version != self.version(collection_name):
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        logging.debug(f"Semantic cache hit on '{query}' (similarity {similarities[best]:.3f})")
+        return copy.deepcopy(results)
+
+    def put(
+        self,
+        collection_name: str,
+        context: str,
+        vector: np.ndarray,
+        query: str,
+        results: List[Any],
+        version: Optional[int] = None
+    ):
+        """Store the results of a query under its embedding and the collection write version."""
+        version = self.version(collection_name) if version is None else version
+        if version != self.version(collection_name):
+            return
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (collection_name, context, version, self._normalize(vector), query, copy.deepcopy(results))
+        self._contexts.setdefault(context, []).append(entry_id)
+        self._matrices.pop(context, None)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def bump(self, collection_name: str):
+        """Record a write to a collection, dropping its cached queries."""
+        self._versions[collection_name] = self.version(collection_name) + 1
+        stale = [entry_id for entry_id, entry in self._entries.items() if entry[0] == collection_name]
+        for entry_id in stale:
+            self._remove(entry_id)
+        self.invalidations += len(stale)
+
+    def clear(self):
+        self._entries.clear()
+        self._contexts.clear()
+        self._matrices.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, entry_id: int):
+        entry = self._entries.pop(entry_id, None)
+        if not entry:
+            return
+        context = entry[1]
+        ids = self._contexts[context]
+        ids.remove(entry_id)
+        if not ids:
+            del self._contexts[context]
+        self._matrices.pop(context, None)
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
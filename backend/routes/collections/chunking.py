@@ -0,0 +1,170 @@
+import logging
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from qdrant_client.http import models
+
+# Payload fields written on every chunk so results can be traced back to their source document
+CHUNK_PAYLOAD_INDEXES = {
+    "parent_id": models.PayloadSchemaType.KEYWORD,
+    "chunk_index": models.PayloadSchemaType.INTEGER,
+}
+
+# Every bookkeeping field DocumentChunker adds to a chunk; offsets and counts are not worth indexing
+CHUNK_FIELDS = ("parent_id", "chunk_index", "chunk_count", "chunk_start", "chunk_end")
+
+
+class DocumentChunker:
+    """
+    Splits documents into overlapping token windows sized for the embedding model.
+
+    Windows are measured with the dense model's tokenizer so no text falls outside
+    the model's context, and chunk boundaries are mapped back to character offsets
+    in the source document.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Any,
+        max_tokens: int = 512,
+        overlap: int = 64,
+        reserved_tokens: int = 2,
+        text_field: str = "document"
+    ):
+        """
+        Args:
+            tokenizer: HuggingFace fast tokenizer used by the dense model
+            max_tokens: Model context window in tokens
+            overlap: Number of tokens shared between consecutive chunks
+            reserved_tokens: Tokens kept free for special tokens ([CLS], [SEP])
+            text_field: Document field holding the text to split
+
+        Raises:
+            ValueError: If the tokenizer is not a fast tokenizer, or the window
+                cannot hold the overlap plus at least one new token
+        """
+        if not getattr(tokenizer, "is_fast", False):
+            raise ValueError("DocumentChunker requires a fast tokenizer with offset mapping support")
+
+        self.tokenizer = tokenizer
+        self.window = max_tokens - reserved_tokens
+        if self.window <= 0:
+            raise ValueError(
+                f"max_tokens ({max_tokens}) must be greater than the {reserved_tokens} reserved special tokens")
+        # Each chunk must advance past the previous one, so the overlap is smaller than the text window
+        if not 0 <= overlap < self.window:
+            raise ValueError(
+                f"overlap ({overlap}) must be at least 0 and smaller than the {self.window}-token text window "
+                f"(max_tokens {max_tokens} minus {reserved_tokens} reserved tokens)")
+
+        self.overlap = overlap
+        self.stride = self.window - overlap
+        self.text_field = text_field
+
+        self.documents = 0
+        self.chunks = 0
+        self.elapsed = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Chunking throughput since the chunker was created."""
+        return self.chunks / self.elapsed if self.elapsed > 0 else 0.0
+
+    def chunk(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a single document into chunk documents.
+
+        Each chunk keeps the parent's metadata and records `parent_id`, `chunk_index`,
+        `chunk_count` and the `[chunk_start, chunk_end)` character offsets.
+        """
+        text = doc.get(self.text_field, "")
+        parent_id = str(doc.get("id") or uuid.uuid4())
+
+        if not isinstance(text, str) or not text.strip():
+            return []
+
+        offsets = self.tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            truncation=False,
+            verbose=False
+        )["offset_mapping"]
+
+        spans = []
+        for start in range(0, max(len(offsets), 1), self.stride):
+            window = offsets[start:start + self.window]
+            if not window:
+                break
+            spans.append((window[0][0], window[-1][1]))
+            if start + self.window >= len(offsets):
+                break
+
+        if len(spans) <= 1:
+            spans = [(0, len(text))]
+
+        chunks = []
+        for index, (char_start, char_end) in enumerate(spans):
+            chunk = {k: v for k, v in doc.items() if k not in ("id", self.text_field)}
+            chunk.update({
+                "id": str(uuid.uuid5(uuid.NAMESPACE_URL, f"{parent_id}:{index}")),
+                self.text_field: text[char_start:char_end],
+                "parent_id": parent_id,
+                "chunk_index": index,
+                "chunk_count": len(spans),
+                "chunk_start": char_start,
+                "chunk_end": char_end,
+            })
+            chunks.append(chunk)
+
+        return chunks
+
+    def stream(self, docs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily chunk an iterable of documents, one document in memory at a time.
+        """
+        for doc in docs:
+            started = time.perf_counter()
+            chunks = self.chunk(doc)
+            self.elapsed += time.perf_counter() - started
+            self.documents += 1
+            self.chunks += len(chunks)
+
+            if len(chunks) > 1:
+                logging.debug(f"Split document {chunks[0]['parent_id']} into {len(chunks)} chunks")
+
+            yield from chunks
+
+    def stats(self) -> Dict[str, Any]:
+        """Chunking counters suitable for progress events."""
+        return {
+            "documents": self.documents,
+            "chunks": self.chunks,
+            "chunks_per_second": round(self.chunks_per_second, 2),
+        }
+
+
+def create_chunker(
+    dense_model: Any,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: int = 64
+) -> DocumentChunker:
+    """
+    Build a chunker matching a SentenceTransformer's tokenizer and context window.
+
+    Args:
+        dense_model: Loaded SentenceTransformer
+        chunk_size: Chunk length in tokens, capped at the model's max_seq_length
+        chunk_overlap: Overlap between consecutive chunks in tokens
+
+    Raises:
+        ValueError: If the overlap does not fit in the chunk size
+    """
+    model_window = getattr(dense_model, "max_seq_length", None) or 512
+    max_tokens = min(chunk_size, model_window) if chunk_size else model_window
+    return DocumentChunker(
+        tokenizer=dense_model.tokenizer,
+        max_tokens=max_tokens,
+        overlap=chunk_overlap
+    )
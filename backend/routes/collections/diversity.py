@@ -0,0 +1,66 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def mmr_select(
+    query_vector: np.ndarray,
+    candidate_vectors: np.ndarray,
+    k: int,
+    lambda_mult: float = 0.5,
+    duplicate_threshold: Optional[float] = None
+) -> Tuple[List[int], int]:
+    """
+    Pick a relevant but diverse subset of candidates with maximal marginal relevance.
+
+    Each step selects the candidate maximizing
+    `lambda_mult * sim(query, c) - (1 - lambda_mult) * max(sim(c, selected))`
+    using cosine similarity. Candidates whose similarity to an already selected
+    one reaches `duplicate_threshold` are collapsed into it and never selected,
+    so fewer than `k` indices may be returned.
+
+    Args:
+        query_vector: Query embedding, shape (dim,)
+        candidate_vectors: Candidate embeddings, shape (n, dim)
+        k: Maximum number of candidates to select
+        lambda_mult: 1.0 ranks by relevance only, 0.0 by diversity only
+        duplicate_threshold: Cosine similarity at which candidates count as duplicates
+
+    Returns:
+        Tuple[List[int], int]: Selected candidate indices in selection order and
+            the number of candidates collapsed as near-duplicates
+    """
+    candidates = np.asarray(candidate_vectors, dtype=np.float32)
+    if candidates.ndim != 2 or not len(candidates) or k <= 0:
+        return [], 0
+
+    candidates = candidates / np.maximum(np.linalg.norm(candidates, axis=1, keepdims=True), 1e-12)
+    query = np.asarray(query_vector, dtype=np.float32)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = candidates @ query
+    similarity = candidates @ candidates.T
+
+    remaining = np.ones(len(candidates), dtype=bool)
+    redundancy = np.full(len(candidates), -np.inf, dtype=np.float32)
+    selected: List[int] = []
+    collapsed = 0
+
+    while len(selected) < k and remaining.any():
+        if selected:
+            scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        else:
+            scores = relevance.copy()
+        scores[~remaining] = -np.inf
+
+        best = int(np.argmax(scores))
+        selected.append(best)
+        remaining[best] = False
+        redundancy = np.maximum(redundancy, similarity[best])
+
+        if duplicate_threshold is not None:
+            duplicates = remaining & (similarity[best] >= duplicate_threshold)
+            collapsed += int(duplicates.sum())
+            remaining &= ~duplicates
+
+    return selected, collapsed
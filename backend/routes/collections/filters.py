@@ -1,5 +1,7 @@
+import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any
 
 from qdrant_client.http import models
@@ -41,16 +43,44 @@ class FilterBuilder:
         self.filter.must.append(nested_filter.build())
         return self
 
-    def _create_field_condition(self, condition: Dict[str, Any]) -> models.FieldCondition:
-        key = condition['key']
-        value = condition['value']
+    def _create_field_condition(self, condition: Dict[str, Any]) -> models.Condition:
+        """
+        Convert one JSON condition to a Qdrant condition.
+
+        Supported operators: match, match_any, match_except, match_text, range,
+        datetime_range, values_count, is_empty, is_null, has_id, nested,
+        geo_radius and geo_bounding_box. `has_id` takes no key, and `is_empty`
+        and `is_null` take no value.
+        """
         operator = condition.get('operator', 'match')
+        key = condition.get('key')
+        value = condition.get('value')
+
+        if operator == 'has_id':
+            return models.HasIdCondition(has_id=value if isinstance(value, list) else [value])
+        if not key:
+            raise ValueError(f"Operator '{operator}' requires a key")
 
         if operator == 'match':
             return models.FieldCondition(
                 key=key,
                 match=models.MatchValue(value=value)
             )
+        elif operator == 'match_any':
+            return models.FieldCondition(
+                key=key,
+                match=models.MatchAny(any=self._as_list(value, operator))
+            )
+        elif operator == 'match_except':
+            return models.FieldCondition(
+                key=key,
+                match=models.MatchExcept(**{"except": self._as_list(value, operator)})
+            )
+        elif operator == 'match_text':
+            return models.FieldCondition(
+                key=key,
+                match=models.MatchText(text=value)
+            )
         elif operator == 'range':
             range_params = {}
             for range_op, range_value in value.items():
@@ -62,6 +92,26 @@ class FilterBuilder:
                 key=key,
                 range=models.Range(**range_params)
             )
+        elif operator == 'datetime_range':
+            # RFC 3339 strings compared against datetime payload indexes
+            return models.FieldCondition(
+                key=key,
+                range=models.DatetimeRange(**value)
+            )
+        elif operator == 'values_count':
+            return models.FieldCondition(
+                key=key,
+                values_count=models.ValuesCount(**value)
+            )
+        elif operator == 'is_empty':
+            return models.IsEmptyCondition(is_empty=models.PayloadField(key=key))
+        elif operator == 'is_null':
+            return models.IsNullCondition(is_null=models.PayloadField(key=key))
+        elif operator == 'nested':
+            # Every condition of `value` must hold for the same element of the array at `key`
+            return models.NestedCondition(
+                nested=models.Nested(key=key, filter=create_filter(value))
+            )
         elif operator == 'geo_radius':
             return models.FieldCondition(
                 key=key,
@@ -75,6 +125,12 @@ class FilterBuilder:
         else:
             raise ValueError(f"Unsupported operator: {operator}")
 
+    @staticmethod
+    def _as_list(value: Any, operator: str) -> List[Any]:
+        if not isinstance(value, list) or not value:
+            raise ValueError(f"Operator '{operator}' requires a non-empty list value")
+        return value
+
     def _is_date(self, value: str) -> bool:
         try:
             datetime.strptime(value, '%Y-%m-%d')
@@ -86,7 +142,12 @@ class FilterBuilder:
         return datetime.strptime(date_string, '%Y-%m-%d').timestamp()
 
     def build(self) -> models.Filter:
-        return self.filter
+        # Empty clauses are left unset: local mode evaluates an empty `should` as matching nothing
+        return models.Filter(
+            must=self.filter.must or None,
+            should=self.filter.should or None,
+            must_not=self.filter.must_not or None
+        )
 
 def create_filter(filter_params: Dict[str, Any]) -> models.Filter:
     """
@@ -114,4 +175,24 @@ def create_filter(filter_params: Dict[str, Any]) -> models.Filter:
         nested_builder.add_must(filter_params['nested'])
         builder.add_nested(nested_builder)
 
-    return builder.build()
\ No newline at end of file
+    return builder.build()
+
+
+def compile_filter(filter_params: Dict[str, Any]) -> models.Filter:
+    """
+    Create a Qdrant filter, reusing the compiled filter of an identical filter JSON.
+
+    Filters are cached by their canonical JSON, so key order does not matter.
+    The returned filter is shared between callers and must not be modified.
+    """
+    try:
+        canonical = json.dumps(filter_params, sort_keys=True)
+    except TypeError:
+        # Values JSON cannot represent are compiled without caching
+        return create_filter(filter_params)
+    return _compile_canonical(canonical)
+
+
+@lru_cache(maxsize=1024)
+def _compile_canonical(canonical: str) -> models.Filter:
+    return create_filter(json.loads(canonical))
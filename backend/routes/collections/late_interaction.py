@@ -0,0 +1,128 @@
+from typing import Dict, List
+
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+from sentence_transformers.models import Dense, Normalize, Pooling
+
+# ColBERT marks queries and documents with these vocabulary tokens, placed right after [CLS]
+QUERY_MARKER = "[unused0]"
+DOCUMENT_MARKER = "[unused1]"
+
+# ColBERT pads queries with [MASK] tokens up to this length, each of them becoming a query vector
+QUERY_LENGTH = 32
+
+
+def projection_layers(model: SentenceTransformer) -> List[Dense]:
+    """
+    Dense layers projecting the token states of a late-interaction model.
+
+    ColBERT checkpoints saved for sentence-transformers (e.g. with PyLate)
+    store their projection as Dense modules after pooling. `encode` only
+    applies them to the pooled embedding, so token embeddings are projected
+    here. Models made of other modules are rejected, their token embeddings
+    would not be the ones they were trained to compare.
+
+    Raises:
+        ValueError: If the model has modules other than pooling, normalization and Dense layers
+    """
+    layers = []
+    for module in list(model)[1:]:
+        if isinstance(module, Dense):
+            layers.append(module)
+        elif not isinstance(module, (Pooling, Normalize)):
+            raise ValueError(
+                f"Unsupported late interaction model: {type(module).__name__} modules cannot be applied "
+                "to token embeddings. Use a ColBERT checkpoint or a model that outputs per-token embeddings")
+    return layers
+
+
+def token_dimension(model: SentenceTransformer) -> int:
+    """Size of the token vectors `encode_tokens` returns."""
+    layers = projection_layers(model)
+    return layers[-1].out_features if layers else model[0].get_word_embedding_dimension()
+
+
+def _insert_marker(features: Dict[str, torch.Tensor], marker_id: int, max_length: int, sep_id: int):
+    """Insert the marker token after [CLS], keeping sequences within `max_length` and ending in [SEP]."""
+    inserted = {}
+    for key, values in features.items():
+        value = {"input_ids": marker_id, "attention_mask": 1}.get(key, 0)
+        column = torch.full((values.shape[0], 1), value, dtype=values.dtype)
+        inserted[key] = torch.cat([values[:, :1], column, values[:, 1:]], dim=1)
+    if inserted["input_ids"].shape[1] > max_length:
+        inserted = {key: values[:, :max_length] for key, values in inserted.items()}
+        truncated = inserted["attention_mask"][:, -1].bool()
+        inserted["input_ids"][truncated, -1] = sep_id
+    return inserted
+
+
+def _augment_query(features: Dict[str, torch.Tensor], mask_id: int, pad_id: int, sep_id: int):
+    """Pad or cut queries to QUERY_LENGTH tokens, padding with [MASK] instead of [PAD]."""
+    length = features["input_ids"].shape[1]
+    if length < QUERY_LENGTH:
+        features = {
+            key: torch.cat([values, torch.full(
+                (values.shape[0], QUERY_LENGTH - length), pad_id if key == "input_ids" else 0,
+                dtype=values.dtype)], dim=1)
+            for key, values in features.items()
+        }
+    elif length > QUERY_LENGTH:
+        features = {key: values[:, :QUERY_LENGTH] for key, values in features.items()}
+        truncated = features["attention_mask"][:, -1].bool()
+        features["input_ids"][truncated, -1] = sep_id
+    # Masks are not attended to, but their outputs are kept as query expansion vectors
+    features["input_ids"][features["input_ids"] == pad_id] = mask_id
+    return features
+
+
+def encode_tokens(
+    model: SentenceTransformer,
+    texts: List[str],
+    is_query: bool = False,
+    batch_size: int = 16
+) -> List[np.ndarray]:
+    """
+    Per-token embeddings of each text, as a ColBERT model computes them.
+
+    For ColBERT checkpoints (models with a Dense projection) the query or
+    document marker is inserted after [CLS], queries are padded with [MASK]
+    tokens to QUERY_LENGTH, and the token states are projected. Other models
+    return their token embeddings unchanged. Padding tokens are dropped.
+
+    Args:
+        model: Late-interaction model
+        texts: Texts to encode
+        is_query: Encode queries rather than documents
+        batch_size: Texts per forward pass
+
+    Returns:
+        List[np.ndarray]: One (tokens, dimension) float32 matrix per text
+    """
+    layers = projection_layers(model)
+    tokenizer = model.tokenizer
+    colbert = bool(layers)
+    marker_id = None
+    if colbert:
+        marker_id = tokenizer.convert_tokens_to_ids(QUERY_MARKER if is_query else DOCUMENT_MARKER)
+        if marker_id is None or marker_id == tokenizer.unk_token_id:
+            marker_id = None
+    augment = colbert and is_query and tokenizer.mask_token_id is not None
+
+    matrices = []
+    for start in range(0, len(texts), batch_size):
+        features = model.tokenize(texts[start:start + batch_size])
+        features = {key: features[key] for key in ("input_ids", "attention_mask", "token_type_ids") if key in features}
+        if marker_id is not None:
+            features = _insert_marker(features, marker_id, model.max_seq_length, tokenizer.sep_token_id)
+        if augment:
+            features = _augment_query(features, tokenizer.mask_token_id, tokenizer.pad_token_id, tokenizer.sep_token_id)
+        keep = features["input_ids"] != tokenizer.pad_token_id if augment else features["attention_mask"].bool()
+
+        with torch.no_grad():
+            tokens = model[0]({key: values.to(model.device) for key, values in features.items()})["token_embeddings"]
+            for layer in layers:
+                tokens = layer({"sentence_embedding": tokens})["sentence_embedding"]
+        for row, row_keep in zip(tokens, keep):
+            matrices.append(row[row_keep.to(row.device)].float().cpu().numpy())
+    return matrices
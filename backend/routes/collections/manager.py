@@ -1,9 +1,13 @@
-from typing import List, Tuple, Dict, Any, Union, Optional
+from typing import List, Tuple, Dict, Any, Union, Optional, Callable, BinaryIO, Iterable
 import traceback
 import logging
 import asyncio
 import uuid
-import re
+import json
+import time
+import tempfile
+from functools import partial
+from datetime import datetime, timezone
 
 from sentence_transformers.quantization import quantize_embeddings
 
@@ -14,7 +18,22 @@ import numpy as np
 
 from utils.nodes import TextNode
 from embeddings.models import EmbeddingModels 
-from routes.collections.filters import FilterBuilder
+from routes.collections.filters import compile_filter
+from routes.collections.chunking import DocumentChunker, create_chunker, CHUNK_FIELDS
+from routes.collections.profiles import CollectionProfile, FusionOptions, DEFAULT_PROFILE, get_profile
+from routes.collections.cache import SearchResultCache, SemanticQueryCache
+from routes.collections.planner import SearchPlan, SearchPlanner
+from routes.collections.advisor import (
+    DEFAULT_MIN_OBSERVED_SECONDS, DEFAULT_MIN_SEARCHES, FilterUsageTracker, IndexRecommendation, advise, index_params,
+    payload_values
+)
+from routes.collections.diversity import mmr_select
+from routes.collections.sparse import SparsePruning
+from routes.collections.bm25 import BM25Encoder
+from routes.collections.late_interaction import encode_tokens, token_dimension
+from routes.collections.profiler import SchemaProfiler
+from routes.collections.snapshots import SnapshotTransfer
+from routes.collections.tenancy import DEFAULT_TENANT_FIELD, TENANT_BUILD_FIELD, current_tenant, scope_filter, tenant_index_params
 
 import warnings
 warnings.filterwarnings(
@@ -26,6 +45,33 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Physical collections built behind an alias are named "<alias>__v<timestamp>"
+COLLECTION_VERSION_SEPARATOR = "__v"
+
+# Per-collection settings (profile, vector layout) live as points in this vectorless collection
+SETTINGS_COLLECTION = "picollm_collection_settings"
+
+# Seconds an alias resolution is reused before asking Qdrant again
+ALIAS_CACHE_TTL = 30.0
+
+# Grouped searches fetch this many more candidates per branch so enough distinct groups survive fusion
+GROUP_PREFETCH_FACTOR = 4
+
+# Diversified searches rerank this many times top_k candidates with MMR
+MMR_FETCH_FACTOR = 4
+
+# Storage datatypes accepted for the primary dense vectors
+DENSE_DATATYPES = {
+    "float32": models.Datatype.FLOAT32,
+    "float16": models.Datatype.FLOAT16,
+}
+
+# Named multivector holding per-token embeddings for late-interaction (MaxSim) rescoring
+LATE_INTERACTION_VECTOR = "late-interaction"
+
+# Sparse encoders a collection can be built with: learned SPLADE weights or lexical BM25
+SPARSE_MODES = ("splade", "bm25")
+
 
 class QdrantDBManager:
     """Qdrant database manager with lazy model initialization"""
@@ -34,7 +80,11 @@ class QdrantDBManager:
         self,
         embeddings: Optional[EmbeddingModels] = None,
         host: str = "qdrant",
-        port: int = 6333
+        port: int = 6333,
+        result_cache_size: int = 1024,
+        path: Optional[str] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        semantic_cache_size: int = 1024
     ):
         """
         Initialize QdrantDBManager with optional deferred model loading.
@@ -43,9 +93,34 @@ class QdrantDBManager:
             embeddings: EmbeddingModels instance containing all necessary models (optional)
             host: Qdrant server host
             port: Qdrant server port
+            result_cache_size: Maximum number of cached search result lists
+            path: Run Qdrant embedded in this process instead of connecting to a server,
+                storing collections in this directory, or in memory for ":memory:"
+            semantic_cache_threshold: Serve searches from earlier queries whose dense
+                embedding has at least this cosine similarity (disabled when None)
+            semantic_cache_size: Maximum number of queries kept by the semantic cache
         """
-        self.client = QdrantClient(host, port=port)
+        self.embedded = path is not None
+        if path == ":memory:":
+            self.client = QdrantClient(location=":memory:")
+        elif path:
+            self.client = QdrantClient(path=path)
+        else:
+            self.client = QdrantClient(host, port=port)
+        if self.embedded:
+            logging.info(f"Using embedded Qdrant storage at '{path}'")
         self.embeddings = embeddings
+        self._settings_cache: Dict[str, Dict[str, Any]] = {}
+        self._alias_cache: Dict[str, Tuple[str, float]] = {}
+        self.result_cache = SearchResultCache(max_entries=result_cache_size)
+        self.semantic_cache = SemanticQueryCache(
+            threshold=semantic_cache_threshold, max_entries=semantic_cache_size
+        ) if semantic_cache_threshold else None
+        self.planner = SearchPlanner(self.client)
+        self.filter_usage = FilterUsageTracker()
+        self.bm25 = BM25Encoder()
+        # Snapshot files are moved over the REST API, which embedded storage does not have
+        self.snapshots = None if self.embedded else SnapshotTransfer(f"http://{host}:{port}")
         
         # Initialize model components if embeddings are provided
         if self.embeddings:
@@ -75,7 +150,11 @@ class QdrantDBManager:
         self, 
         build_with_quantized: bool = False,
         use_matryoshka: bool = False,
-        matryoshka_levels: int = 3
+        matryoshka_levels: int = 3,
+        on_disk: bool = False,
+        datatype: str = "float32",
+        dense_on_disk: Optional[bool] = None,
+        late_interaction_size: Optional[int] = None
     ) -> Dict[str, models.VectorParams]:
         """
         Build the vectors configuration for the Qdrant collection.
@@ -84,6 +163,10 @@ class QdrantDBManager:
             build_with_quantized: Whether to include quantized vectors
             use_matryoshka: Whether to use matryoshka embeddings
             matryoshka_levels: Number of matryoshka embedding levels
+            on_disk: Store the vectors as memory-mapped files
+            datatype: Storage type of the primary dense vectors, "float32" or "float16"
+            dense_on_disk: Override `on_disk` for the primary dense vectors
+            late_interaction_size: Add a late-interaction multivector of this token embedding size
 
         Returns:
             Dict[str, models.VectorParams]: The vectors configuration.
@@ -92,6 +175,10 @@ class QdrantDBManager:
         if not hasattr(self, 'dense_model') or self.dense_model is None:
             self._load_model_components()
             
+        if datatype not in DENSE_DATATYPES:
+            raise ValueError(f"Unknown dense datatype '{datatype}', expected one of {list(DENSE_DATATYPES)}")
+        primary_on_disk = on_disk if dense_on_disk is None else dense_on_disk
+
         vectors_config = {}
 
         if use_matryoshka:
@@ -100,18 +187,23 @@ class QdrantDBManager:
                 vectors_config[f"matryoshka-{size}dim"] = models.VectorParams(
                     size=size,
                     distance=models.Distance.COSINE,
+                    on_disk=primary_on_disk,
+                    datatype=DENSE_DATATYPES[datatype],
                 )
         else:
             # Always include the original dense vector
             vectors_config["dense"] = models.VectorParams(
                 size=self.dense_model.get_sentence_embedding_dimension(),
                 distance=models.Distance.COSINE,
+                on_disk=primary_on_disk,
+                datatype=DENSE_DATATYPES[datatype],
             )
             # Conditionally include the quantized dense vector
             if build_with_quantized:
                 vectors_config["dense-uint8"] = models.VectorParams(
                     size=self.dense_model.get_sentence_embedding_dimension(),
                     distance=models.Distance.COSINE,
+                    on_disk=on_disk,
                     quantization_config=models.ScalarQuantization(
                         scalar=models.ScalarQuantizationConfig(
                             type=models.ScalarType.INT8,
@@ -121,10 +213,24 @@ class QdrantDBManager:
                     ),
                 )
 
+        if late_interaction_size:
+            # Only read when rescoring a query's candidates: no HNSW graph, float16 on disk
+            vectors_config[LATE_INTERACTION_VECTOR] = models.VectorParams(
+                size=late_interaction_size,
+                distance=models.Distance.COSINE,
+                on_disk=True,
+                datatype=models.Datatype.FLOAT16,
+                multivector_config=models.MultiVectorConfig(
+                    comparator=models.MultiVectorComparator.MAX_SIM
+                ),
+                hnsw_config=models.HnswConfigDiff(m=0),
+            )
+
         # Log vector configurations for verification
         for name, config in vectors_config.items():
             logging.info(
-                f"Vector '{name}': size={config.size}, distance={config.distance}")
+                f"Vector '{name}': size={config.size}, distance={config.distance}, "
+                f"on_disk={config.on_disk}, datatype={config.datatype}")
 
         return vectors_config
 
@@ -136,7 +242,19 @@ class QdrantDBManager:
         sample_size: int = 5,
         build_with_quantized: bool = False,
         use_matryoshka: bool = False,
-        matryoshka_levels: int = 3
+        matryoshka_levels: int = 3,
+        payload_indexes: Optional[Dict[str, models.PayloadSchemaType]] = None,
+        bulk_load: bool = False,
+        profile: str = DEFAULT_PROFILE,
+        store_sparse_payload: bool = False,
+        document_sparse_pruning: Optional[SparsePruning] = None,
+        query_sparse_pruning: Optional[SparsePruning] = None,
+        dense_datatype: str = "float32",
+        dense_on_disk: Optional[bool] = None,
+        sparse_mode: str = "splade",
+        late_interaction: bool = False,
+        tenant_field: Optional[str] = None,
+        vectors_config: Optional[Dict[str, models.VectorParams]] = None
     ):
         """
         Create a Qdrant collection with automatic schema inference and proper payload indexing.
@@ -149,38 +267,97 @@ class QdrantDBManager:
             build_with_quantized (bool): Whether to include quantized vectors
             use_matryoshka (bool): Whether to use matryoshka embeddings
             matryoshka_levels (int): Number of matryoshka embedding levels
+            payload_indexes (Dict[str, PayloadSchemaType], optional): Extra payload indexes to create
+                regardless of inference, e.g. chunk parent ids
+            bulk_load (bool): Defer HNSW indexing until finish_bulk_load is called
+            profile (str): Name of the storage/latency profile (see routes.collections.profiles)
+            store_sparse_payload (bool): Also keep sparse weights in the point payload (legacy layout)
+            document_sparse_pruning (SparsePruning, optional): Limit on the sparse weights indexed per document
+            query_sparse_pruning (SparsePruning, optional): Limit on the sparse weights used per query
+            dense_datatype (str): Storage type of the primary dense vectors, "float32" or "float16"
+            dense_on_disk (bool, optional): Keep the primary dense vectors on disk regardless of the profile
+            sparse_mode (str): Sparse encoder, "splade" or "bm25" (term frequencies weighted by
+                Qdrant's IDF modifier at query time)
+            late_interaction (bool): Also store per-token embeddings as a multivector
+                used by advanced_search to rescore fused candidates with MaxSim
+            tenant_field (str, optional): Make the collection shared by tenants: points
+                are tagged with their tenant in this payload key, which gets an
+                `is_tenant` keyword index, and every search is scoped to one tenant
+            vectors_config (Dict[str, VectorParams], optional): Dense and late-interaction vectors
+                copied from another collection instead of sized from the models, which are then not loaded
         """
+        if sparse_mode not in SPARSE_MODES:
+            raise ValueError(f"Unknown sparse mode '{sparse_mode}'. Available: {', '.join(SPARSE_MODES)}")
         # At the beginning of any method that needs models
-        if not hasattr(self, 'dense_model') or self.dense_model is None:
+        if vectors_config is None and (not hasattr(self, 'dense_model') or self.dense_model is None):
             self._load_model_components()
+        collection_profile = get_profile(profile)
         try:
             # Collection existence check and deletion if needed
             if self.client.collection_exists(collection_name):
                 logging.info(
                     f"Collection '{collection_name}' already exists. Deleting it...")
                 self.client.delete_collection(collection_name)
+                self._delete_collection_settings(collection_name)
+                self._bump_collection_version(collection_name)
                 logging.info(
                     f"Collection '{collection_name}' deleted successfully.")
 
             # Create base collection first
             creation_params = {
                 "collection_name": collection_name,
-                "vectors_config": self._build_vectors_config(
+                "vectors_config": vectors_config or self._build_vectors_config(
                     build_with_quantized=build_with_quantized,
                     use_matryoshka=use_matryoshka,
-                    matryoshka_levels=matryoshka_levels
+                    matryoshka_levels=matryoshka_levels,
+                    on_disk=collection_profile.vectors_on_disk,
+                    datatype=dense_datatype,
+                    dense_on_disk=dense_on_disk,
+                    late_interaction_size=self.late_interaction_size() if late_interaction else None
                 ),
-                "on_disk_payload": True,
+                "on_disk_payload": collection_profile.payload_on_disk,
                 "sparse_vectors_config": {
                     "sparse": models.SparseVectorParams(
-                        index=models.SparseIndexParams(on_disk=False)
+                        index=models.SparseIndexParams(on_disk=collection_profile.sparse_on_disk),
+                        modifier=models.Modifier.IDF if sparse_mode == "bm25" else None
                     )
-                }
+                },
+                "hnsw_config": collection_profile.hnsw_config(tenant_partitioned=bool(tenant_field)),
+                "optimizers_config": collection_profile.optimizers_config()
             }
 
+            if bulk_load:
+                # No HNSW graphs are built while points stream in
+                creation_params["optimizers_config"].indexing_threshold = 0
+                logging.info(f"Collection '{collection_name}' created in bulk-load mode, indexing deferred")
+
             self.client.recreate_collection(**creation_params)
             logging.info(
-                f"Collection '{collection_name}' created successfully.")
+                f"Collection '{collection_name}' created successfully with profile '{collection_profile.name}'.")
+
+            self.save_collection_settings(collection_name, {
+                "profile": collection_profile.name,
+                "use_matryoshka": use_matryoshka,
+                "matryoshka_levels": matryoshka_levels,
+                "build_with_quantized": build_with_quantized,
+                "store_sparse_payload": store_sparse_payload,
+                "dense_datatype": dense_datatype,
+                "sparse_mode": sparse_mode,
+                "late_interaction": late_interaction,
+                "tenant_field": tenant_field,
+                "sparse_pruning": {
+                    "document": (document_sparse_pruning or SparsePruning()).model_dump(),
+                    "query": (query_sparse_pruning or SparsePruning()).model_dump(),
+                },
+            })
+
+            if tenant_field:
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=tenant_field,
+                    field_schema=tenant_index_params()
+                )
+                logging.info(f"Collection '{collection_name}' partitioned by tenant field '{tenant_field}'")
 
             # Infer and create payload indexes if datasets provided
             if datasets and text_field:
@@ -191,11 +368,702 @@ class QdrantDBManager:
                     sample_size=sample_size
                 )
 
+            for field_name, field_type in (payload_indexes or {}).items():
+                if field_name == tenant_field:
+                    continue
+                self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_type
+                )
+                logging.info(
+                    f"Created index for field '{field_name}' with type '{field_type}'")
+
         except Exception as e:
             logging.error(f"Failed during collection creation: {e}")
             logging.error(traceback.format_exc())
             raise
 
+    def _ensure_settings_collection(self):
+        """Create the settings collection on first use."""
+        if not self.client.collection_exists(SETTINGS_COLLECTION):
+            self.client.create_collection(
+                collection_name=SETTINGS_COLLECTION,
+                vectors_config={}
+            )
+
+    @staticmethod
+    def _settings_point_id(collection_name: str) -> str:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"picollm:{collection_name}"))
+
+    def save_collection_settings(self, collection_name: str, settings: Dict[str, Any]):
+        """
+        Persist settings for a physical collection, merged into any existing ones.
+
+        Args:
+            collection_name: Physical collection name
+            settings: Settings to store (JSON serializable)
+        """
+        self._ensure_settings_collection()
+        physical = self._resolve_cached(collection_name)
+        merged = {**self.get_collection_settings(physical), **settings}
+        self.client.upsert(
+            collection_name=SETTINGS_COLLECTION,
+            points=[models.PointStruct(
+                id=self._settings_point_id(physical),
+                vector={},
+                payload={"collection_name": physical, **merged}
+            )]
+        )
+        self._settings_cache[physical] = merged
+
+    def get_collection_settings(self, collection_name: str) -> Dict[str, Any]:
+        """
+        Get the stored settings of a collection or alias.
+
+        Collections created before settings were stored return an empty dict.
+        """
+        physical = self._resolve_cached(collection_name)
+        if physical in self._settings_cache:
+            return self._settings_cache[physical]
+
+        settings = {}
+        if self.client.collection_exists(SETTINGS_COLLECTION):
+            records = self.client.retrieve(
+                collection_name=SETTINGS_COLLECTION,
+                ids=[self._settings_point_id(physical)],
+                with_payload=True
+            )
+            if records:
+                settings = {k: v for k, v in records[0].payload.items() if k != "collection_name"}
+
+        self._settings_cache[physical] = settings
+        return settings
+
+    def get_collection_profile(self, collection_name: str) -> CollectionProfile:
+        """Get the profile a collection (or alias) was created with."""
+        return get_profile(self.get_collection_settings(collection_name).get("profile"))
+
+    def get_sparse_pruning(self, collection_name: str, target: str = "document") -> SparsePruning:
+        """Get the sparse pruning a collection applies to "document" or "query" vectors."""
+        pruning = self.get_collection_settings(collection_name).get("sparse_pruning") or {}
+        return SparsePruning(**(pruning.get(target) or {}))
+
+    def get_sparse_mode(self, collection_name: str) -> str:
+        """Get the sparse encoder a collection was built with, "splade" for older collections."""
+        return self.get_collection_settings(collection_name).get("sparse_mode", "splade")
+
+    def get_dense_layout(
+        self,
+        collection_name: str,
+        use_matryoshka: Optional[bool] = None,
+        matryoshka_levels: Optional[int] = None,
+        build_with_quantized: Optional[bool] = None
+    ) -> Tuple[bool, int, bool]:
+        """
+        Get the dense vectors a collection was built with: matryoshka, its levels and the uint8 copy.
+
+        Arguments that are not None override the stored settings.
+        """
+        settings = self.get_collection_settings(collection_name)
+        return (
+            settings.get("use_matryoshka", False) if use_matryoshka is None else use_matryoshka,
+            settings.get("matryoshka_levels", 3) if matryoshka_levels is None else matryoshka_levels,
+            settings.get("build_with_quantized", False) if build_with_quantized is None else build_with_quantized,
+        )
+
+    def get_tenant_field(self, collection_name: str) -> Optional[str]:
+        """Get the tenant payload key of a shared collection, None for single-tenant collections."""
+        return self.get_collection_settings(collection_name).get("tenant_field")
+
+    def tenant_filter(
+        self,
+        collection_name: str,
+        filter_params: Optional[Dict[str, Any]],
+        tenant_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Scope a filter to the caller's tenant on shared collections.
+
+        The tenant is `tenant_id`, or the request's tenant (`current_tenant`).
+        Filters on single-tenant collections are returned unchanged.
+
+        Raises:
+            ValueError: If the collection is shared and no tenant is known
+        """
+        tenant_field = self.get_tenant_field(collection_name)
+        if not tenant_field:
+            return filter_params
+        tenant_id = tenant_id or current_tenant.get()
+        if not tenant_id:
+            raise ValueError(f"Collection '{collection_name}' is shared by tenants, a tenant id is required")
+        return scope_filter(filter_params, tenant_field, tenant_id)
+
+    def exact_search_threshold(self, collection_name: str) -> int:
+        """
+        Largest filter match count the planner scores exhaustively.
+
+        This is the profile's `full_scan_threshold` (KB of vectors) converted to
+        points: the same cut-off Qdrant applies when payload indexes let it
+        estimate a filter itself.
+        """
+        if not hasattr(self, 'dense_model') or self.dense_model is None:
+            self._load_model_components()
+        vector_kb = self.dense_model.get_sentence_embedding_dimension() * 4 / 1024
+        return int(self.get_collection_profile(collection_name).full_scan_threshold / vector_kb)
+
+    def _delete_collection_settings(self, collection_name: str):
+        self._settings_cache.pop(collection_name, None)
+        if self.client.collection_exists(SETTINGS_COLLECTION):
+            self.client.delete(
+                collection_name=SETTINGS_COLLECTION,
+                points_selector=models.PointIdsList(points=[self._settings_point_id(collection_name)])
+            )
+
+    def _resolve_cached(self, name: str) -> str:
+        """Resolve an alias, reusing recent answers to keep it off the search path."""
+        cached = self._alias_cache.get(name)
+        if cached and time.monotonic() - cached[1] < ALIAS_CACHE_TTL:
+            return cached[0]
+        physical = self.resolve_collection(name)
+        self._alias_cache[name] = (physical, time.monotonic())
+        return physical
+
+    def create_collection_version(self, alias: str, **kwargs) -> str:
+        """
+        Create a new versioned physical collection for an alias without touching the live one.
+
+        Args:
+            alias: Alias that searches use
+            **kwargs: Forwarded to recreate_collection
+
+        Returns:
+            str: Name of the new physical collection
+        """
+        collection_name = self._new_version_name(alias)
+        self.recreate_collection(collection_name=collection_name, **kwargs)
+        return collection_name
+
+    @staticmethod
+    def _new_version_name(alias: str) -> str:
+        version = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+        return f"{alias}{COLLECTION_VERSION_SEPARATOR}{version}"
+
+    def create_tenant_collection(
+        self,
+        alias: str,
+        tenant_field: str = DEFAULT_TENANT_FIELD,
+        **kwargs
+    ) -> str:
+        """
+        Create an empty collection shared by tenants and serve it under `alias`.
+
+        Args:
+            alias: Name searches use
+            tenant_field: Payload key holding each point's tenant
+            **kwargs: Forwarded to recreate_collection
+
+        Returns:
+            str: Name of the physical collection
+        """
+        if self.get_tenant_field(alias):
+            raise ValueError(f"Collection '{alias}' is already shared by tenants")
+        collection_name = self.create_collection_version(alias=alias, tenant_field=tenant_field, **kwargs)
+        self.promote_collection_version(alias, collection_name)
+        return collection_name
+
+    def migrate_to_tenant_collection(
+        self,
+        sources: Dict[str, str],
+        target: str,
+        tenant_field: str = DEFAULT_TENANT_FIELD,
+        batch_size: int = 256,
+        delete_sources: bool = False
+    ) -> Dict[str, int]:
+        """
+        Copy per-tenant collections into one shared collection, without re-embedding.
+
+        Points are scrolled with their vectors and upserted into the target with
+        the tenant in `tenant_field`. Point ids are remapped to a UUID derived
+        from the tenant and the source id, so ids of different teams cannot
+        collide and re-running a migration overwrites instead of duplicating.
+        A missing target is created with the first source's settings, vectors
+        and payload indexes, so no embedding model is loaded.
+
+        Args:
+            sources: Source collection or alias -> tenant id
+            target: Shared collection or alias
+            tenant_field: Tenant payload key when the target is created
+            batch_size: Points copied per scroll and upsert
+            delete_sources: Delete each source collection once it is copied
+
+        Returns:
+            Dict[str, int]: Points copied per source
+
+        Raises:
+            ValueError: If a source is missing or its vectors do not match the target
+        """
+        physical_sources = {}
+        for source in sources:
+            physical = self.resolve_collection(source)
+            if not self.client.collection_exists(physical):
+                raise ValueError(f"Collection '{source}' does not exist")
+            physical_sources[source] = physical
+
+        if not self.get_tenant_field(target):
+            if self.client.collection_exists(self.resolve_collection(target)):
+                raise ValueError(f"Collection '{target}' exists and is not shared by tenants")
+            first = next(iter(physical_sources.values()))
+            settings = self.get_collection_settings(first)
+            self.create_tenant_collection(
+                alias=target,
+                tenant_field=tenant_field,
+                payload_indexes={
+                    field: info.data_type
+                    for field, info in (self.client.get_collection(first).payload_schema or {}).items()
+                },
+                profile=settings.get("profile", DEFAULT_PROFILE),
+                use_matryoshka=settings.get("use_matryoshka", False),
+                matryoshka_levels=settings.get("matryoshka_levels", 3),
+                build_with_quantized=settings.get("build_with_quantized", False),
+                store_sparse_payload=settings.get("store_sparse_payload", False),
+                dense_datatype=settings.get("dense_datatype", "float32"),
+                sparse_mode=settings.get("sparse_mode", "splade"),
+                document_sparse_pruning=self.get_sparse_pruning(first, "document"),
+                query_sparse_pruning=self.get_sparse_pruning(first, "query"),
+                late_interaction=settings.get("late_interaction", False),
+                vectors_config=self.client.get_collection(first).config.params.vectors
+            )
+
+        physical_target = self.resolve_collection(target)
+        target_field = self.get_tenant_field(physical_target)
+        target_vectors = self.client.get_collection(physical_target).config.params.vectors
+
+        copied = {}
+        for source, tenant_id in sources.items():
+            physical = physical_sources[source]
+            source_vectors = self.client.get_collection(physical).config.params.vectors
+            missing = [name for name in target_vectors if name not in source_vectors]
+            if missing:
+                raise ValueError(f"Collection '{source}' has no {', '.join(missing)} vectors required by '{target}'")
+            # Matryoshka collections have no "dense" vector, so every vector the target stores is compared
+            resized = [name for name in target_vectors if source_vectors[name].size != target_vectors[name].size]
+            if resized:
+                raise ValueError(
+                    f"Collection '{source}' was embedded with different models than '{target}' ({', '.join(resized)})")
+            if self.get_sparse_mode(physical) != self.get_sparse_mode(physical_target):
+                raise ValueError(f"Collection '{source}' uses a different sparse mode than '{target}'")
+
+            copied[source] = 0
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=physical,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True
+                )
+                if records:
+                    self.client.upsert(
+                        collection_name=physical_target,
+                        points=[
+                            models.PointStruct(
+                                id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"picollm:{tenant_id}:{record.id}")),
+                                vector={name: vector for name, vector in (record.vector or {}).items()
+                                        if name in target_vectors or name == "sparse"},
+                                payload={**(record.payload or {}), target_field: tenant_id}
+                            )
+                            for record in records
+                        ]
+                    )
+                    copied[source] += len(records)
+                if offset is None:
+                    break
+            logging.info(f"Migrated {copied[source]} points of '{source}' into '{target}' as tenant '{tenant_id}'")
+
+            if delete_sources:
+                if source != physical:
+                    self.client.update_collection_aliases(change_aliases_operations=[
+                        models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=source))])
+                    self._alias_cache.pop(source, None)
+                self.delete_collection_version(physical)
+
+        self._bump_collection_version(physical_target)
+        return copied
+
+    def resolve_collection(self, name: str) -> str:
+        """
+        Resolve an alias to the physical collection it points to.
+
+        Returns the name unchanged when it is not an alias.
+        """
+        for alias in self.client.get_aliases().aliases:
+            if alias.alias_name == name:
+                return alias.collection_name
+        return name
+
+    def list_collection_versions(self, alias: str) -> List[str]:
+        """List the physical collections built for an alias, oldest first."""
+        prefix = f"{alias}{COLLECTION_VERSION_SEPARATOR}"
+        return sorted(
+            collection.name
+            for collection in self.client.get_collections().collections
+            if collection.name.startswith(prefix)
+        )
+
+    def promote_collection_version(self, alias: str, collection_name: str):
+        """
+        Atomically point an alias at a physical collection.
+
+        The alias delete and create are sent as a single operation, so searches
+        see either the previous or the new collection, never neither.
+        """
+        if not self.client.collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        current = self.resolve_collection(alias)
+        operations = []
+        if current != alias:
+            operations.append(models.DeleteAliasOperation(
+                delete_alias=models.DeleteAlias(alias_name=alias)
+            ))
+        elif self.client.collection_exists(alias):
+            # A collection built before aliases were used owns the name and must go first
+            logging.warning(
+                f"Replacing legacy collection '{alias}' with an alias to '{collection_name}'")
+            self.client.delete_collection(alias)
+
+        operations.append(models.CreateAliasOperation(
+            create_alias=models.CreateAlias(
+                collection_name=collection_name,
+                alias_name=alias
+            )
+        ))
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        self._alias_cache.pop(alias, None)
+        logging.info(f"Alias '{alias}' now points to '{collection_name}'")
+
+    def rollback_collection(self, alias: str, collection_name: Optional[str] = None) -> str:
+        """
+        Point an alias back at a previous version.
+
+        Args:
+            alias: Alias to roll back
+            collection_name: Version to activate (defaults to the one before the active version)
+
+        Returns:
+            str: Name of the now active physical collection
+
+        Raises:
+            ValueError: If there is no previous version, or `collection_name` is not a version of the alias
+        """
+        if collection_name is None:
+            current = self.resolve_collection(alias)
+            previous = [name for name in self.list_collection_versions(alias) if name < current]
+            if not previous:
+                raise ValueError(f"No previous version to roll back to for '{alias}'")
+            collection_name = previous[-1]
+        elif collection_name not in self.list_collection_versions(alias):
+            raise ValueError(f"'{collection_name}' is not a version of '{alias}'")
+
+        self.promote_collection_version(alias, collection_name)
+        return collection_name
+
+    def gc_collection_versions(self, alias: str, keep: int = 2) -> List[str]:
+        """
+        Delete old versions of an alias, keeping the newest `keep` and the active one.
+
+        Returns:
+            List[str]: Names of the deleted collections
+        """
+        current = self.resolve_collection(alias)
+        versions = self.list_collection_versions(alias)
+        retained = set(versions[-keep:]) if keep > 0 else set()
+        retained.add(current)
+
+        deleted = []
+        for name in versions:
+            if name not in retained:
+                self.client.delete_collection(name)
+                self._delete_collection_settings(name)
+                self._bump_collection_version(name)
+                deleted.append(name)
+                logging.info(f"Deleted old collection version '{name}'")
+        return deleted
+
+    def delete_collection_version(self, collection_name: str):
+        """Delete an unpromoted physical collection, e.g. after a failed build."""
+        if self.client.collection_exists(collection_name):
+            self.client.delete_collection(collection_name)
+            self._delete_collection_settings(collection_name)
+            self._bump_collection_version(collection_name)
+            logging.info(f"Deleted collection '{collection_name}'")
+
+    def _snapshot_transfer(self) -> SnapshotTransfer:
+        if self.snapshots is None:
+            raise ValueError("Snapshots need a Qdrant server, embedded storage has no snapshot API")
+        return self.snapshots
+
+    def create_snapshot(self, collection_name: str) -> Dict[str, Any]:
+        """
+        Snapshot a collection or alias on the Qdrant server.
+
+        Returns:
+            Dict[str, Any]: Snapshot name, size, checksum and creation time, with the
+                physical collection and its settings, which live outside the snapshot
+        """
+        self._snapshot_transfer()
+        physical = self.resolve_collection(collection_name)
+        snapshot = self.client.create_snapshot(collection_name=physical, wait=True)
+        logging.info(f"Created snapshot '{snapshot.name}' of '{physical}' ({snapshot.size} bytes)")
+        return {
+            "collection": collection_name,
+            "physical_collection": physical,
+            **snapshot.model_dump(),
+            "settings": self.get_collection_settings(physical),
+        }
+
+    def list_snapshots(self, collection_name: str) -> List[Dict[str, Any]]:
+        """List the snapshots of a collection or alias, newest first."""
+        self._snapshot_transfer()
+        snapshots = self.client.list_snapshots(collection_name=self.resolve_collection(collection_name))
+        return [s.model_dump() for s in sorted(snapshots, key=lambda s: s.creation_time or "", reverse=True)]
+
+    def get_snapshot(self, collection_name: str, snapshot_name: str) -> models.SnapshotDescription:
+        """
+        Raises:
+            ValueError: If the collection has no snapshot with that name
+        """
+        self._snapshot_transfer()
+        for snapshot in self.client.list_snapshots(collection_name=self.resolve_collection(collection_name)):
+            if snapshot.name == snapshot_name:
+                return snapshot
+        raise ValueError(f"Collection '{collection_name}' has no snapshot '{snapshot_name}'")
+
+    def delete_snapshot(self, collection_name: str, snapshot_name: str):
+        self.get_snapshot(collection_name, snapshot_name)
+        self.client.delete_snapshot(
+            collection_name=self.resolve_collection(collection_name), snapshot_name=snapshot_name, wait=True)
+        logging.info(f"Deleted snapshot '{snapshot_name}' of '{collection_name}'")
+
+    def download_snapshot(self, collection_name: str, snapshot_name: str, path: str) -> int:
+        """Stream a snapshot file to a local path and verify its checksum. Returns the bytes written."""
+        snapshot = self.get_snapshot(collection_name, snapshot_name)
+        return self._snapshot_transfer().download(
+            self.resolve_collection(collection_name), snapshot_name, path, checksum=snapshot.checksum)
+
+    def restore_snapshot(
+        self,
+        alias: str,
+        location: Optional[str] = None,
+        fileobj: Optional[BinaryIO] = None,
+        filename: str = "collection.snapshot",
+        checksum: Optional[str] = None,
+        settings: Optional[Dict[str, Any]] = None,
+        keep_versions: int = 2
+    ) -> str:
+        """
+        Restore a snapshot as a new version of `alias` and switch the alias to it.
+
+        The snapshot is recovered into a new physical collection, so the alias
+        keeps serving the current version until recovery has finished, and
+        previous versions stay available for rollback.
+
+        Args:
+            alias: Name searches use
+            location: URL (or file:// path on the Qdrant server) Qdrant downloads the snapshot from
+            fileobj: Snapshot file to upload instead of a location
+            filename: Name of the uploaded file
+            checksum: Expected SHA-256 of the snapshot
+            settings: Collection settings saved with the snapshot (profile, sparse mode, ...).
+                Required, as snapshots do not contain them; `{}` restores a
+                collection built with the default settings
+            keep_versions: Versions of the alias kept after the switch
+
+        Returns:
+            str: Name of the restored physical collection
+
+        Raises:
+            ValueError: If settings are missing, or not exactly one of location and fileobj is given
+        """
+        transfer = self._snapshot_transfer()
+        if (location is None) == (fileobj is None):
+            raise ValueError("Exactly one of location or fileobj is required")
+        if settings is None:
+            # Defaults would silently mis-read collections built with BM25, matryoshka, pruning or tenants
+            raise ValueError(
+                "Collection settings are required to restore a snapshot, which does not contain them. "
+                "Pass the settings returned when the snapshot was created, or {} for default settings")
+        current = self.resolve_collection(alias)
+        if current == alias and self.client.collection_exists(alias):
+            raise ValueError(f"'{alias}' is a collection without versions, restore under another name")
+
+        physical = self._new_version_name(alias)
+        try:
+            if fileobj is not None:
+                transfer.upload(physical, fileobj, filename, checksum=checksum)
+            else:
+                self.client.recover_snapshot(
+                    collection_name=physical,
+                    location=location,
+                    checksum=checksum,
+                    priority=models.SnapshotPriority.SNAPSHOT,
+                    wait=True
+                )
+            self.save_collection_settings(physical, settings)
+            self.promote_collection_version(alias, physical)
+        except Exception:
+            self.delete_collection_version(physical)
+            raise
+
+        self.gc_collection_versions(alias, keep=keep_versions)
+        logging.info(f"Restored snapshot into '{physical}', served as '{alias}'")
+        return physical
+
+    def clone_collection(self, source: str, target: str, keep_versions: int = 2) -> Dict[str, Any]:
+        """
+        Copy a collection under a new name through a snapshot, without re-embedding.
+
+        The snapshot is streamed through a temporary file, so memory stays
+        bounded and the Qdrant server never needs to reach itself over HTTP.
+        The temporary snapshot is deleted from the server afterwards.
+
+        Returns:
+            Dict[str, Any]: Source and target physical collections and the snapshot size
+        """
+        if self.resolve_collection(source) == self.resolve_collection(target):
+            raise ValueError("Source and target of a clone must differ")
+        snapshot = self.create_snapshot(source)
+        try:
+            with tempfile.TemporaryDirectory(prefix="picollm-snapshot-") as directory:
+                path = f"{directory}/{snapshot['name']}"
+                self.download_snapshot(source, snapshot["name"], path)
+                with open(path, "rb") as f:
+                    physical = self.restore_snapshot(
+                        target, fileobj=f, filename=snapshot["name"], checksum=snapshot["checksum"],
+                        settings=snapshot["settings"], keep_versions=keep_versions)
+        finally:
+            self.delete_snapshot(source, snapshot["name"])
+        return {
+            "source": source,
+            "source_collection": snapshot["physical_collection"],
+            "target": target,
+            "target_collection": physical,
+            "snapshot_size": snapshot["size"],
+        }
+
+    def delete_points(
+        self,
+        collection_name: str,
+        point_ids: Optional[List[Union[str, int]]] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[str] = None
+    ):
+        """
+        Delete points by ID or by filter.
+
+        Args:
+            collection_name: Collection or alias to delete from
+            point_ids: IDs of the points to delete
+            filter_params: Filter JSON selecting the points to delete
+            tenant_id: Tenant whose points are deleted in a shared collection
+                (the request's tenant by default)
+
+        On shared collections the deletion is always scoped to one tenant.
+        """
+        if self.get_tenant_field(collection_name):
+            # Shared collections only ever delete the caller's own points
+            if point_ids:
+                filter_params = {**(filter_params or {}), "must": [
+                    *((filter_params or {}).get("must") or []), {"operator": "has_id", "value": point_ids}]}
+            if not filter_params:
+                raise ValueError("Either point_ids or filter_params is required")
+            selector = models.FilterSelector(
+                filter=self._create_filter(self.tenant_filter(collection_name, filter_params, tenant_id)))
+        elif point_ids:
+            selector = models.PointIdsList(points=point_ids)
+        elif filter_params:
+            selector = models.FilterSelector(filter=self._create_filter(filter_params))
+        else:
+            raise ValueError("Either point_ids or filter_params is required")
+
+        self.client.delete(collection_name=collection_name, points_selector=selector)
+        self._bump_collection_version(collection_name)
+
+    def _bump_collection_version(self, collection_name: str):
+        """Record a write so cached search results for the collection are no longer served."""
+        physical = self._resolve_cached(collection_name)
+        self.result_cache.bump(physical)
+        self.planner.invalidate(physical)
+        if self.semantic_cache:
+            self.semantic_cache.bump(physical)
+
+    async def finish_bulk_load(
+        self,
+        collection_name: str,
+        timeout: float = 3600.0,
+        poll_interval: float = 2.0
+    ) -> float:
+        """
+        Re-enable indexing on a bulk-loaded collection and wait for the index build.
+
+        The target HNSW parameters (m, ef_construct, full_scan_threshold) and
+        indexing threshold are taken from the collection's profile.
+
+        Args:
+            collection_name: Collection created with bulk_load=True
+            timeout: Maximum seconds to wait for optimization
+            poll_interval: Seconds between status checks
+
+        Returns:
+            float: Seconds spent waiting for the index build
+        """
+        collection_profile = self.get_collection_profile(collection_name)
+        self.client.update_collection(
+            collection_name=collection_name,
+            hnsw_config=collection_profile.hnsw_config(
+                tenant_partitioned=bool(self.get_tenant_field(collection_name))),
+            optimizers_config=models.OptimizersConfigDiff(
+                indexing_threshold=collection_profile.indexing_threshold_kb
+            )
+        )
+        logging.info(f"Indexing enabled for '{collection_name}', waiting for optimization...")
+        return await self.wait_for_indexing(collection_name, timeout, poll_interval)
+
+    async def wait_for_indexing(
+        self,
+        collection_name: str,
+        timeout: float = 3600.0,
+        poll_interval: float = 2.0
+    ) -> float:
+        """
+        Wait until a collection's optimizers are idle and its status is green.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # Give the optimizer a moment to pick up configuration changes
+        await asyncio.sleep(poll_interval)
+
+        while True:
+            info = self.client.get_collection(collection_name)
+            if info.status == models.CollectionStatus.GREEN:
+                elapsed = loop.time() - started
+                logging.info(
+                    f"Collection '{collection_name}' indexed in {elapsed:.1f}s "
+                    f"({info.indexed_vectors_count} indexed vectors)")
+                return elapsed
+            if info.status == models.CollectionStatus.RED:
+                raise RuntimeError(
+                    f"Optimization failed for '{collection_name}': {info.optimizer_status}")
+            if loop.time() - started > timeout:
+                raise TimeoutError(
+                    f"Collection '{collection_name}' not indexed after {timeout:.0f}s")
+            await asyncio.sleep(poll_interval)
+
     def _setup_collection_schema(
         self,
         collection_name: str,
@@ -213,37 +1081,181 @@ class QdrantDBManager:
             all_samples.extend(samples)
 
         if all_samples:
-            schema = self._infer_payload_schema(all_samples)
+            self.create_profiled_indexes(collection_name, self._infer_payload_schema(all_samples))
 
-            for field_name, field_config in schema.items():
-                try:
-                    if field_name == "sparse":
-                        continue
-
-                    field_type = field_config["type"]
-                    if field_type == models.PayloadSchemaType.TEXT:
-                        self.client.create_payload_index(
-                            collection_name=collection_name,
-                            field_name=field_name,
-                            field_schema=models.TextIndexParams(
-                                type="text",
-                                tokenizer=models.TokenizerType.WORD,
-                                lowercase=True
-                            )
-                        )
-                    else:
-                        self.client.create_payload_index(
-                            collection_name=collection_name,
-                            field_name=field_name,
-                            field_schema=str(field_type).split('.')[-1].lower()
+    def create_profiled_indexes(
+        self,
+        collection_name: str,
+        schema: Dict[str, Dict[str, Any]],
+        skip: Optional[Iterable[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Create the payload indexes of an inferred schema.
+
+        Args:
+            collection_name: Name of the collection
+            schema: Field name -> {"type": PayloadSchemaType, "index": bool}, as
+                returned by SchemaProfiler.schema
+            skip: Fields not to index, e.g. the chunk bookkeeping fields, which
+                are indexed by other means or not worth indexing
+
+        Returns:
+            Dict[str, str]: Field name -> index type of the created indexes
+        """
+        created = {}
+        skip = set(skip or ())
+        for field_name, field_config in schema.items():
+            if field_name == "sparse" or field_name in skip or not field_config.get("index", True):
+                continue
+            field_type = field_config["type"]
+            try:
+                if field_type == models.PayloadSchemaType.TEXT:
+                    self.client.create_payload_index(
+                        collection_name=collection_name,
+                        field_name=field_name,
+                        field_schema=models.TextIndexParams(
+                            type="text",
+                            tokenizer=models.TokenizerType.WORD,
+                            lowercase=True
                         )
+                    )
+                else:
+                    self.client.create_payload_index(
+                        collection_name=collection_name,
+                        field_name=field_name,
+                        field_schema=str(field_type).split('.')[-1].lower()
+                    )
+                created[field_name] = str(field_type).split('.')[-1].lower()
+                logging.info(
+                    f"Created index for field '{field_name}' with type '{field_type}'")
+            except Exception as e:
+                logging.warning(
+                    f"Could not create index for {field_name}: {e}")
+        return created
 
-                    logging.info(
-                        f"Created index for field '{field_name}' with type '{field_type}'")
-                except Exception as e:
-                    logging.warning(
-                        f"Could not create index for {field_name}: {e}")
-                    continue
+    def advise_payload_indexes(
+        self,
+        collection_name: str,
+        sample_size: int = 1000,
+        min_searches: int = DEFAULT_MIN_SEARCHES,
+        min_observed_seconds: float = DEFAULT_MIN_OBSERVED_SECONDS
+    ) -> Dict[str, Any]:
+        """
+        Recommend payload indexes from the filters searches actually used.
+
+        Fields filtered or grouped on without an index are recommended for
+        creation, typed from their operators and a sample of payload values.
+        Keyword fields filtered by equality in most searches are flagged
+        `is_tenant`, and numeric or datetime fields mostly filtered by range
+        `is_principal`. Indexed fields no search used during the observation
+        window are recommended for removal, except the indexes the application
+        relies on: the `document` text index, the chunk fields, the tenant and
+        build fields of shared collections and any `is_tenant` index.
+
+        Args:
+            collection_name: Collection or alias
+            sample_size: Points sampled to type new indexes and estimate cardinality
+            min_searches: Searches to observe before recommending anything
+            min_observed_seconds: Time to observe searches before recommending a drop
+
+        Returns:
+            Dict[str, Any]: Observed usage, current indexes and the recommendations
+        """
+        physical = self._resolve_cached(collection_name)
+        indexed = self.client.get_collection(physical).payload_schema or {}
+        usage = self.filter_usage.usage(physical)
+        searches = self.filter_usage.searches(physical)
+        observed_seconds = self.filter_usage.observed_seconds(physical)
+
+        samples: Dict[str, List[Any]] = {}
+        unindexed = [field for field in usage if field not in indexed]
+        if unindexed and searches >= min_searches:
+            records, _ = self.client.scroll(
+                collection_name=physical,
+                limit=sample_size,
+                with_payload=models.PayloadSelectorInclude(
+                    include=sorted({field.split("[]")[0].split(".")[0] for field in unindexed})),
+                with_vectors=False
+            )
+            samples = {
+                field: [v for record in records for v in payload_values(record.payload or {}, field)]
+                for field in unindexed
+            }
+
+        recommendations = advise(
+            usage, searches, indexed, samples,
+            min_searches=min_searches,
+            keep=self._application_indexes(physical, indexed),
+            observed_seconds=observed_seconds,
+            min_observed_seconds=min_observed_seconds
+        )
+        return {
+            "collection": physical,
+            "searches": searches,
+            "observed_seconds": round(observed_seconds, 1),
+            "usage": {
+                field: {**field_usage.model_dump(exclude={"total_ms", "last_used"}),
+                        "mean_ms": round(field_usage.mean_ms, 2)}
+                for field, field_usage in usage.items()
+            },
+            "indexed": {field: str(info.data_type) for field, info in indexed.items()},
+            "recommendations": [r.model_dump() for r in recommendations],
+        }
+
+    def _application_indexes(self, collection_name: str, indexed: Dict[str, Any]) -> List[str]:
+        """Indexes the application relies on even when no search filters on them."""
+        keep = {"document", *CHUNK_FIELDS}
+        tenant_field = self.get_tenant_field(collection_name)
+        if tenant_field:
+            keep.update((tenant_field, TENANT_BUILD_FIELD))
+        for field, info in indexed.items():
+            if getattr(info.params, "is_tenant", None):
+                keep.add(field)
+        return sorted(keep)
+
+    def apply_payload_index_advice(
+        self,
+        collection_name: str,
+        fields: Optional[List[str]] = None,
+        drop: bool = False,
+        min_searches: int = DEFAULT_MIN_SEARCHES,
+        min_observed_seconds: float = DEFAULT_MIN_OBSERVED_SECONDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Create the recommended payload indexes, and drop unused ones when `drop` is set.
+
+        Args:
+            collection_name: Collection or alias
+            fields: Only act on these fields (all recommendations by default)
+            drop: Also apply drop recommendations
+            min_searches: Searches to observe before recommending anything
+            min_observed_seconds: Time to observe searches before recommending a drop
+
+        Returns:
+            List[Dict[str, Any]]: The recommendations that were applied
+        """
+        physical = self._resolve_cached(collection_name)
+        advice = self.advise_payload_indexes(
+            physical, min_searches=min_searches, min_observed_seconds=min_observed_seconds)
+
+        applied = []
+        for recommendation in advice["recommendations"]:
+            if fields is not None and recommendation["field"] not in fields:
+                continue
+            if recommendation["action"] == "create":
+                self.client.create_payload_index(
+                    collection_name=physical,
+                    field_name=recommendation["field"],
+                    field_schema=index_params(IndexRecommendation(**recommendation))
+                )
+            elif drop:
+                self.client.delete_payload_index(collection_name=physical, field_name=recommendation["field"])
+            else:
+                continue
+            logging.info(f"Applied payload index advice on '{physical}': {recommendation['action']} "
+                         f"'{recommendation['field']}'")
+            applied.append(recommendation)
+        return applied
 
     def _get_dataset_sample(
         self,
@@ -277,95 +1289,22 @@ class QdrantDBManager:
     def _infer_payload_schema(self, sample_docs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
         Generate payload schema from sample documents with proper type detection.
-        """
-        # Get the predefined text field
-        text_field = getattr(self, 'text_field', 'document')
-
-        payload_data = {}
-        schema = {}
-        field_types = {}
 
-        # First pass: collect ALL fields and their values
+        Types come from a SchemaProfiler over the samples; fields without a
+        dominant type are returned with "index": False.
+        """
+        profiler = SchemaProfiler(text_field=getattr(self, 'text_field', 'document'))
         for doc in sample_docs:
-            for field, value in doc.items():
-                if field not in payload_data:
-                    payload_data[field] = []
-                    field_types[field] = set()
-
-                payload_data[field].append(value)
-
-                # Track types, including list contents
-                if isinstance(value, list):
-                    if value:
-                        field_types[field].add(
-                            f"list_{type(value[0]).__name__}")
-                        for item in value:
-                            payload_data[field].append(item)
-                else:
-                    field_types[field].add(type(value).__name__)
-
-        # ISO datetime pattern
-        date_pattern = re.compile(
-            r'^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:\d{2})?)?$')
-
-        # Second pass: determine schema types
-        for field, values in payload_data.items():
-            if field == "sparse":
-                continue
-
-            types = field_types[field]
-
-            # Log field discovery
-            logging.info(f"Processing field: {field} with types: {types}")
-
-            # Handle the predefined text field
-            if field == text_field:
-                field_type = models.PayloadSchemaType.TEXT
-            else:
-                # Infer type from content
-                non_null_values = [v for v in values if v is not None]
-
-                if not non_null_values:
-                    field_type = models.PayloadSchemaType.KEYWORD
-                elif all(isinstance(v, bool) for v in non_null_values):
-                    field_type = models.PayloadSchemaType.BOOL
-                elif all(isinstance(v, int) and not isinstance(v, bool) for v in non_null_values):
-                    field_type = models.PayloadSchemaType.INTEGER
-                elif all(isinstance(v, float) for v in non_null_values):
-                    field_type = models.PayloadSchemaType.FLOAT
-                elif all(isinstance(v, str) for v in non_null_values):
-                    # Sample for performance on large datasets
-                    sample_values = non_null_values[:100]
-
-                    # Check for dates first
-                    if all(date_pattern.match(str(v)) for v in sample_values[:20]):
-                        field_type = models.PayloadSchemaType.DATETIME
-                    elif all(str(v).isdigit() for v in sample_values):
-                        field_type = models.PayloadSchemaType.INTEGER
-                    elif all(re.match(r'^\d+\.\d+$', str(v)) for v in sample_values):
-                        field_type = models.PayloadSchemaType.FLOAT
-                    elif all(len(str(v)) < 50 for v in sample_values):
-                        field_type = models.PayloadSchemaType.KEYWORD
-                    else:
-                        field_type = models.PayloadSchemaType.TEXT
-                else:
-                    field_type = models.PayloadSchemaType.KEYWORD
-
-            schema[field] = {
-                "type": field_type,
-                "index": True
-            }
-
-            logging.info(f"Decided type for {field}: {field_type}")
-
-        return schema
+            profiler.observe(doc)
+        return profiler.schema()
 
     async def process_and_insert_batch(
         self, 
         collection_name: str, 
         batch: List[Dict[str, Any]],
         build_with_quantized: bool = False,
-        calibration_embeddings: Optional[np.ndarray] = None
+        calibration_embeddings: Optional[np.ndarray] = None,
+        tenant_id: Optional[str] = None
     ):
         """
         Process and insert a batch of documents with optimized sparse encoding.
@@ -375,7 +1314,19 @@ class QdrantDBManager:
             batch: List of documents to insert
             build_with_quantized: Whether to include quantized vectors
             calibration_embeddings: Calibration embeddings for quantization (required if build_with_quantized=True)
+            tenant_id: Tenant of the documents in a shared collection. Defaults to the
+                request's tenant, then to each document's own tenant field
         """
+        tenant_field = self.get_tenant_field(collection_name)
+        if tenant_field:
+            tenant_id = tenant_id or current_tenant.get()
+            batch = [{**doc, tenant_field: tenant_id or doc.get(tenant_field)} for doc in batch]
+            untagged = [doc for doc in batch if not doc[tenant_field]]
+            if untagged:
+                raise ValueError(
+                    f"Collection '{collection_name}' is shared by tenants, "
+                    f"{len(untagged)} documents have no tenant id")
+
         try:
             if not hasattr(self, 'dense_model') or self.dense_model is None:
                 self._load_model_components()
@@ -409,23 +1360,47 @@ class QdrantDBManager:
 
             # Sparse embeddings - using batch encoding
             sparse_indices, sparse_values = self.sparse_vectors(
-                texts, is_query=False)
+                texts, is_query=False, sparse_mode=self.get_sparse_mode(collection_name))
+            sparse_indices, sparse_values = self.get_sparse_pruning(collection_name).apply_batch(
+                sparse_indices, sparse_values)
+
+            settings = self.get_collection_settings(collection_name)
+            # Collections created before the setting existed keep the payload copy
+            store_sparse_payload = settings.get("store_sparse_payload", True)
+
+            # float16 collections are rounded once for the whole batch, so the request
+            # carries values Qdrant stores exactly instead of float32 precision it discards
+            if settings.get("dense_datatype") == "float16":
+                stored_embeddings = dense_embeddings.astype(np.float16)
+            else:
+                stored_embeddings = dense_embeddings
+
+            if settings.get("late_interaction"):
+                token_vectors = self.late_interaction_vectors(texts)
+            else:
+                token_vectors = [None] * len(texts)
 
             # Create points
             points = []
-            for idx, (doc, dense_emb, sparse_idx, sparse_val) in enumerate(
-                zip(valid_docs, dense_embeddings, sparse_indices, sparse_values)
+            for idx, (doc, dense_emb, stored_emb, sparse_idx, sparse_val, tokens) in enumerate(
+                zip(valid_docs, dense_embeddings, stored_embeddings, sparse_indices, sparse_values, token_vectors)
             ):
                 payload = doc.copy()
                 payload.pop('id', None)
-                payload["sparse"] = list(zip(sparse_idx, sparse_val))
+                if store_sparse_payload:
+                    payload["sparse"] = list(zip(sparse_idx, sparse_val))
 
-                vector = {"dense": dense_emb.tolist()}
+                vector = {
+                    "dense": stored_emb.tolist(),
+                    "sparse": models.SparseVector(indices=sparse_idx, values=sparse_val)
+                }
                 if build_with_quantized:
                     if calibration_embeddings is None:
                         raise ValueError("Calibration embeddings required for quantization")
                     uint8_vector = self.quantize_vector(dense_emb, calibration_embeddings)
                     vector["dense-uint8"] = uint8_vector.tolist()
+                if tokens is not None:
+                    vector[LATE_INTERACTION_VECTOR] = tokens
 
                 points.append(models.PointStruct(
                     id=doc["id"],
@@ -438,6 +1413,7 @@ class QdrantDBManager:
                 try:
                     self.client.upsert(
                         collection_name=collection_name, points=points)
+                    self._bump_collection_version(collection_name)
                     logging.info(f"Successfully inserted {len(points)} points")
                     break
                 except Exception as e:
@@ -454,6 +1430,91 @@ class QdrantDBManager:
             logging.error(f"Error processing batch: {e}")
             logging.error(traceback.format_exc())
 
+    def strip_sparse_payload(self, collection_name: str, batch_size: int = 256) -> Dict[str, Any]:
+        """
+        Remove the duplicated `sparse` payload field from an existing collection.
+
+        Points are scrolled in batches. Where the `sparse` named vector is missing
+        it is first backfilled from the payload weights, so no sparse data is lost.
+        The collection is then marked so new inserts skip the payload copy.
+
+        Args:
+            collection_name: Collection or alias to migrate
+            batch_size: Points per scroll page
+
+        Returns:
+            Dict[str, Any]: Points scanned and stripped, vectors backfilled and
+                approximate payload bytes reclaimed
+        """
+        report = {
+            "collection_name": collection_name,
+            "points_scanned": 0,
+            "points_stripped": 0,
+            "vectors_backfilled": 0,
+            "bytes_reclaimed": 0,
+        }
+        # New inserts stop writing the payload copy before existing points are migrated
+        self.save_collection_settings(collection_name, {"store_sparse_payload": False})
+
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=models.PayloadSelectorInclude(include=["sparse"]),
+                with_vectors=["sparse"]
+            )
+            report["points_scanned"] += len(records)
+
+            stripped, backfill = [], []
+            for record in records:
+                weights = (record.payload or {}).get("sparse")
+                if weights is None:
+                    continue
+                stripped.append(record.id)
+                report["bytes_reclaimed"] += len(json.dumps(weights))
+
+                if weights and not (record.vector or {}).get("sparse"):
+                    indices, values = zip(*weights)
+                    backfill.append(models.PointVectors(
+                        id=record.id,
+                        vector={"sparse": models.SparseVector(indices=list(indices), values=list(values))}
+                    ))
+
+            if backfill:
+                self.client.update_vectors(collection_name=collection_name, points=backfill)
+                report["vectors_backfilled"] += len(backfill)
+            if stripped:
+                self.client.delete_payload(
+                    collection_name=collection_name,
+                    keys=["sparse"],
+                    points=stripped
+                )
+                report["points_stripped"] += len(stripped)
+
+            logging.info(
+                f"Stripped sparse payload from {report['points_stripped']}/{report['points_scanned']} points "
+                f"in '{collection_name}' ({report['bytes_reclaimed'] / 1024**2:.1f} MB)")
+
+            if offset is None:
+                break
+
+        self._bump_collection_version(collection_name)
+        return report
+
+    def get_chunker(self, chunk_size: Optional[int] = None, chunk_overlap: int = 64) -> DocumentChunker:
+        """
+        Create a document chunker sized to the dense model's tokenizer and context window.
+
+        Args:
+            chunk_size: Chunk length in tokens (defaults to the model's max sequence length)
+            chunk_overlap: Tokens shared between consecutive chunks
+        """
+        if not hasattr(self, 'dense_model') or self.dense_model is None:
+            self._load_model_components()
+        return create_chunker(self.dense_model, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
     def get_dense_embedding(self, text: str, **kwargs) -> Dict[str, Union[List[float], List[int]]]:
         """Generate dense embeddings for the given text."""
         if not self.embeddings:
@@ -528,8 +1589,19 @@ class QdrantDBManager:
             self._load_model_components()
         return self.embeddings.get_sparse_embedding(text, is_query)
 
-    def sparse_vectors(self, texts: List[str], is_query: bool) -> Tuple[List[List[int]], List[List[float]]]:
-        """Generate sparse vectors for batch processing."""
+    def sparse_vectors(
+        self,
+        texts: List[str],
+        is_query: bool,
+        sparse_mode: str = "splade"
+    ) -> Tuple[List[List[int]], List[List[float]]]:
+        """Generate sparse vectors for batch processing.
+
+        BM25 vectors are computed in pure Python and never load the SPLADE models.
+        """
+        if sparse_mode == "bm25":
+            return self.bm25.encode(texts, is_query=is_query)
+
         if not hasattr(self, 'query_sparse_model') or self.query_sparse_model is None:
             self._load_model_components()
 
@@ -547,6 +1619,31 @@ class QdrantDBManager:
 
         return indices_list, values_list
 
+    def late_interaction_size(self) -> int:
+        """Size of the token embeddings produced by the late-interaction model."""
+        if not self.embeddings:
+            self._load_model_components()
+        return token_dimension(self.embeddings.get_late_interaction())
+
+    def late_interaction_vectors(self, texts: List[str], is_query: bool = False) -> List[List[List[float]]]:
+        """
+        Per-token embeddings of each text for the late-interaction multivector.
+
+        ColBERT checkpoints get their query or document marker and token
+        projection (see `encode_tokens`). Tokens are L2-normalized and rounded
+        to float16, the storage type of the multivector, so MaxSim over them is
+        a sum of dot products.
+        """
+        if not self.embeddings:
+            self._load_model_components()
+        model = self.embeddings.get_late_interaction()
+
+        multivectors = []
+        for matrix in encode_tokens(model, texts, is_query=is_query):
+            matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+            multivectors.append(matrix.astype(np.float16).tolist())
+        return multivectors
+
     def _extract_sparse_indices_values(self, embeddings, index: int) -> Tuple[List[int], List[float]]:
         """Extract indices and values from sparse embeddings.
 
@@ -600,16 +1697,426 @@ class QdrantDBManager:
         else:
             raise ValueError(f"Unknown embedding format: {type(embeddings)}")
 
+    def _encode_queries(
+        self,
+        queries: List[str],
+        use_matryoshka: bool = False,
+        matryoshka_levels: int = 3,
+        build_with_quantized: bool = False,
+        calibration_embeddings: Optional[np.ndarray] = None,
+        sparse_pruning: Optional[SparsePruning] = None,
+        sparse_mode: str = "splade",
+        late_interaction: bool = False,
+        dense_embeddings: Optional[np.ndarray] = None
+    ) -> Tuple[List[Dict[str, List[float]]], List[List[int]], List[List[float]]]:
+        """
+        Encode queries for hybrid search in one batched pass per model.
+
+        `sparse_pruning` limits the sparse query terms, usually the collection's query setting.
+        `sparse_mode` selects the sparse encoder the collection was built with.
+        With `late_interaction` the query's token embeddings are added to the
+        dense vectors under the late-interaction vector name.
+        `dense_embeddings` skips the dense model for queries already encoded.
+
+        Returns:
+            Tuple of per-query dense vector dicts (keyed by vector name),
+            sparse indices and sparse values.
+        """
+        if not hasattr(self, 'dense_model') or self.dense_model is None:
+            self._load_model_components()
+
+        if dense_embeddings is None:
+            dense_embeddings = self.dense_model.encode(
+                queries,
+                batch_size=32,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+
+        dense_vectors = [
+            self._dense_query_vectors(
+                dense_vector, use_matryoshka, matryoshka_levels, build_with_quantized, calibration_embeddings)
+            for dense_vector in dense_embeddings
+        ]
+
+        if late_interaction:
+            for vectors, tokens in zip(dense_vectors, self.late_interaction_vectors(queries, is_query=True)):
+                vectors[LATE_INTERACTION_VECTOR] = tokens
+
+        sparse_indices, sparse_values = self.sparse_vectors(queries, is_query=True, sparse_mode=sparse_mode)
+        if sparse_pruning:
+            sparse_indices, sparse_values = sparse_pruning.apply_batch(sparse_indices, sparse_values)
+        return dense_vectors, sparse_indices, sparse_values
+
+    def _dense_query_vectors(
+        self,
+        dense_vector: np.ndarray,
+        use_matryoshka: bool = False,
+        matryoshka_levels: int = 3,
+        build_with_quantized: bool = False,
+        calibration_embeddings: Optional[np.ndarray] = None
+    ) -> Dict[str, List[float]]:
+        """Named dense query vectors of one embedding for a collection's dense layout."""
+        if use_matryoshka:
+            vectors = {}
+            for i in range(matryoshka_levels):
+                size = dense_vector.shape[0] // (2 ** i)
+                vectors[f"matryoshka-{size}dim"] = dense_vector[:size].tolist()
+            return vectors
+        vectors = {"dense": dense_vector.tolist()}
+        # Without calibration the query cannot be quantized, the full dense vector is searched instead
+        if build_with_quantized and calibration_embeddings is not None:
+            vectors["dense-uint8"] = self.quantize_vector(dense_vector, calibration_embeddings).tolist()
+        return vectors
+
+    def _build_hybrid_query(
+        self,
+        dense_vectors: Dict[str, List[float]],
+        sparse_indices: List[int],
+        sparse_values: List[float],
+        top_k: int,
+        search_params: models.SearchParams,
+        search_filter: Optional[models.Filter] = None,
+        use_matryoshka: bool = False,
+        build_with_quantized: bool = False,
+        payload_fields: Optional[List[str]] = None,
+        with_embeddings: bool = False,
+        fusion: Optional[FusionOptions] = None,
+        late_interaction_k: Optional[int] = None
+    ) -> List[models.QueryRequest]:
+        """
+        Build the dense + sparse requests for a single query.
+
+        RRF and DBSF are fused by Qdrant, so a single request is returned. For
+        weighted fusion the dense and sparse branches are returned as separate
+        requests and blended by `_fuse_responses`.
+
+        With `late_interaction_k` and query token embeddings in `dense_vectors`,
+        the RRF/DBSF request keeps that many fused candidates and Qdrant rescores
+        them with MaxSim on the late-interaction multivector. Weighted fusion is
+        rescored by `_late_interaction_rescore` instead.
+
+        Unless `with_embeddings` is set, only the payload needed for results is
+        requested: `document` plus `payload_fields`, or everything but the
+        sparse weights when no fields are given, and no vectors.
+        """
+        fusion = fusion or FusionOptions(dense_limit=top_k * 2, sparse_limit=top_k * 2)
+
+        if use_matryoshka:
+            # Coarse levels fetch twice as many candidates as the level above them
+            dim = self.dense_model.get_sentence_embedding_dimension()
+            dense_prefetch = None
+            for level in (4, 2, 1):
+                name = f"matryoshka-{dim // level}dim"
+                if name not in dense_vectors:
+                    # Collections built with fewer levels skip the coarsest ones
+                    continue
+                dense_prefetch = models.Prefetch(
+                    prefetch=[dense_prefetch] if dense_prefetch else None,
+                    query=dense_vectors[name],
+                    using=name,
+                    filter=search_filter,
+                    params=search_params,
+                    limit=fusion.dense_limit * level,
+                )
+        elif build_with_quantized and "dense-uint8" in dense_vectors:
+            dense_prefetch = models.Prefetch(
+                prefetch=[
+                    models.Prefetch(
+                        query=dense_vectors["dense-uint8"],
+                        using="dense-uint8",
+                        filter=search_filter,
+                        params=search_params,
+                        limit=fusion.dense_limit * 4,
+                    )
+                ],
+                query=dense_vectors["dense"],
+                using="dense",
+                filter=search_filter,
+                params=search_params,
+                limit=fusion.dense_limit,
+            )
+        else:
+            dense_prefetch = models.Prefetch(
+                query=dense_vectors["dense"],
+                using="dense",
+                filter=search_filter,
+                params=search_params,
+                limit=fusion.dense_limit,
+            )
+
+        sparse_prefetch = models.Prefetch(
+            query=models.SparseVector(
+                indices=sparse_indices,
+                values=sparse_values,
+            ),
+            using="sparse",
+            filter=search_filter,
+            params=search_params,
+            limit=fusion.sparse_limit,
+        )
+
+        with_payload = True if with_embeddings else self._payload_selector(payload_fields)
+
+        if fusion.fusion == "weighted":
+            return [
+                models.QueryRequest(
+                    prefetch=branch.prefetch,
+                    query=branch.query,
+                    using=branch.using,
+                    filter=search_filter,
+                    params=search_params,
+                    limit=branch.limit,
+                    with_payload=with_payload,
+                    with_vector=with_embeddings,
+                )
+                for branch in (dense_prefetch, sparse_prefetch)
+            ]
+
+        fusion_query = models.FusionQuery(
+            fusion=models.Fusion.DBSF if fusion.fusion == "dbsf" else models.Fusion.RRF)
+
+        if late_interaction_k and LATE_INTERACTION_VECTOR in dense_vectors:
+            return [models.QueryRequest(
+                prefetch=[models.Prefetch(
+                    prefetch=[dense_prefetch, sparse_prefetch],
+                    query=fusion_query,
+                    filter=search_filter,
+                    limit=max(late_interaction_k, top_k),
+                )],
+                query=dense_vectors[LATE_INTERACTION_VECTOR],
+                using=LATE_INTERACTION_VECTOR,
+                filter=search_filter,
+                limit=top_k,
+                with_payload=with_payload,
+                with_vector=with_embeddings,
+            )]
+
+        return [models.QueryRequest(
+            prefetch=[dense_prefetch, sparse_prefetch],
+            query=fusion_query,
+            filter=search_filter,
+            limit=top_k,
+            with_payload=with_payload,
+            with_vector=with_embeddings,
+        )]
+
+    def _late_interaction_rescore(
+        self,
+        collection_name: str,
+        points: List[models.ScoredPoint],
+        query_tokens: List[List[float]],
+        request: models.QueryRequest,
+        rescore_k: int
+    ) -> List[models.ScoredPoint]:
+        """
+        Rescore client-side fused candidates with MaxSim on the late-interaction multivector.
+
+        The first `rescore_k` candidates are fetched again by id, with the
+        payload and vectors `request` asks for, and reordered by MaxSim. The
+        remaining candidates follow them unrescored, in fused order, so the
+        result is never shorter than `points`.
+        """
+        head, tail = points[:rescore_k], points[rescore_k:]
+        if not head:
+            return points
+        response = self.client.query_points(
+            collection_name=collection_name,
+            query=query_tokens,
+            using=LATE_INTERACTION_VECTOR,
+            query_filter=models.Filter(must=[models.HasIdCondition(has_id=[p.id for p in head])]),
+            limit=len(head),
+            with_payload=request.with_payload,
+            with_vectors=request.with_vector,
+        )
+        return response.points + tail
+
+    def _grouped_search(
+        self,
+        collection_name: str,
+        requests: List[models.QueryRequest],
+        group_by: str,
+        limit: int,
+        group_size: int,
+        fusion: FusionOptions,
+        rescore: Optional[Callable[[List[models.ScoredPoint]], List[models.ScoredPoint]]] = None
+    ) -> List[models.ScoredPoint]:
+        """
+        Run hybrid requests grouped by a payload field, returning the hits of the best groups in order.
+
+        RRF and DBSF queries are grouped by Qdrant with `query_points_groups`, so
+        only the kept hits are transferred. Weighted fusion is blended client-side,
+        so its fused candidates are grouped here, after `rescore` reorders them.
+        Points without the field are skipped.
+        """
+        if fusion.fusion != "weighted":
+            request = requests[0]
+            result = self.client.query_points_groups(
+                collection_name=collection_name,
+                group_by=group_by,
+                prefetch=request.prefetch,
+                query=request.query,
+                using=request.using,
+                query_filter=request.filter,
+                search_params=request.params,
+                limit=limit,
+                group_size=group_size,
+                with_payload=request.with_payload,
+                with_vectors=request.with_vector,
+            )
+            return [hit for group in result.groups for hit in group.hits]
+
+        responses = self.client.query_batch_points(collection_name=collection_name, requests=requests)
+        candidates = self._fuse_responses(responses, fusion.dense_limit + fusion.sparse_limit, fusion)
+        if rescore:
+            candidates = rescore(candidates)
+
+        groups: Dict[Any, List[models.ScoredPoint]] = {}
+        for point in candidates:
+            key = (point.payload or {}).get(group_by)
+            if key is None or isinstance(key, (list, dict)):
+                continue
+            hits = groups.get(key)
+            if hits is None:
+                if len(groups) >= limit:
+                    continue
+                hits = groups[key] = []
+            if len(hits) < group_size:
+                hits.append(point)
+        return [hit for hits in groups.values() for hit in hits]
+
+    @staticmethod
+    def _diversify(
+        points: List[models.ScoredPoint],
+        query_vector: List[float],
+        vector_name: str,
+        top_k: int,
+        mmr_lambda: float = 0.5,
+        duplicate_threshold: Optional[float] = 0.95,
+        keep_vectors: bool = False
+    ) -> List[models.ScoredPoint]:
+        """
+        Rerank fused candidates with MMR on their dense vectors and drop near-duplicates.
+
+        Candidates returned without the vector are kept after the diversified ones.
+        """
+        with_vector = [p for p in points if isinstance(p.vector, dict) and vector_name in p.vector]
+        without_vector = [p for p in points if not (isinstance(p.vector, dict) and vector_name in p.vector)]
+        if not with_vector:
+            return points[:top_k]
+
+        selected, collapsed = mmr_select(
+            np.asarray(query_vector, dtype=np.float32),
+            np.asarray([p.vector[vector_name] for p in with_vector], dtype=np.float32),
+            k=top_k,
+            lambda_mult=mmr_lambda,
+            duplicate_threshold=duplicate_threshold
+        )
+        if collapsed:
+            logging.info(f"Collapsed {collapsed} near-duplicate results")
+
+        diversified = [with_vector[i] for i in selected] + without_vector
+        if not keep_vectors:
+            diversified = [p.model_copy(update={"vector": None}) for p in diversified]
+        return diversified[:top_k]
+
+    @classmethod
+    def _diversify_groups(
+        cls,
+        points: List[models.ScoredPoint],
+        query_vector: List[float],
+        vector_name: str,
+        group_by: str,
+        group_size: int,
+        mmr_lambda: float = 0.5,
+        duplicate_threshold: Optional[float] = 0.95,
+        keep_vectors: bool = False
+    ) -> List[models.ScoredPoint]:
+        """
+        Apply `_diversify` within each group of grouped hits, keeping the group order.
+
+        MMR over the flattened hits would interleave groups, so each group's
+        hits are reranked on their own and cut to `group_size`.
+        """
+        groups: Dict[Any, List[models.ScoredPoint]] = {}
+        for point in points:
+            groups.setdefault((point.payload or {}).get(group_by), []).append(point)
+        return [
+            hit
+            for hits in groups.values()
+            for hit in cls._diversify(
+                hits, query_vector, vector_name, group_size, mmr_lambda, duplicate_threshold, keep_vectors)
+        ]
+
+    @staticmethod
+    def _fuse_responses(
+        responses: List[models.QueryResponse],
+        top_k: int,
+        fusion: Optional[FusionOptions] = None
+    ) -> List[models.ScoredPoint]:
+        """
+        Combine the responses of the requests built by `_build_hybrid_query`.
+
+        For weighted fusion each branch's scores are min-max normalized and
+        blended as `dense_weight * dense + (1 - dense_weight) * sparse`; a point
+        missing from a branch scores 0 there.
+        """
+        if not fusion or fusion.fusion != "weighted":
+            return responses[0].points
+
+        weights = (fusion.dense_weight, 1.0 - fusion.dense_weight)
+        blended: Dict[Any, float] = {}
+        points: Dict[Any, models.ScoredPoint] = {}
+        for weight, response in zip(weights, responses):
+            if not response.points:
+                continue
+            scores = [point.score for point in response.points]
+            low, span = min(scores), max(scores) - min(scores)
+            for point in response.points:
+                normalized = (point.score - low) / span if span else 1.0
+                blended[point.id] = blended.get(point.id, 0.0) + weight * normalized
+                points.setdefault(point.id, point)
+
+        ranked = sorted(blended, key=blended.get, reverse=True)[:top_k]
+        return [points[point_id].model_copy(update={"score": blended[point_id]}) for point_id in ranked]
+
+    @staticmethod
+    def _payload_selector(payload_fields: Optional[List[str]] = None) -> models.PayloadSelector:
+        """Select only the payload fields search results need."""
+        if payload_fields:
+            return models.PayloadSelectorInclude(include=["document", *payload_fields])
+        return models.PayloadSelectorExclude(exclude=["sparse"])
+
     async def advanced_search(
         self,
         collection_name: str,
         query: str,
         filter_params: Dict[str, Any] = None,
         top_k: int = 10,
-        use_matryoshka: bool = False,
-        matryoshka_levels: int = 3,
-        build_with_quantized: bool = False,
-        calibration_embeddings: Optional[np.ndarray] = None
+        use_matryoshka: Optional[bool] = None,
+        matryoshka_levels: Optional[int] = None,
+        build_with_quantized: Optional[bool] = None,
+        calibration_embeddings: Optional[np.ndarray] = None,
+        use_cache: bool = True,
+        payload_fields: Optional[List[str]] = None,
+        with_embeddings: bool = False,
+        fusion: Optional[str] = None,
+        dense_limit: Optional[int] = None,
+        sparse_limit: Optional[int] = None,
+        dense_weight: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        group_by: Optional[str] = None,
+        group_size: int = 1,
+        diversify: bool = False,
+        mmr_lambda: float = 0.5,
+        fetch_k: Optional[int] = None,
+        duplicate_threshold: Optional[float] = 0.95,
+        late_interaction: Optional[bool] = None,
+        rescore_k: Optional[int] = None,
+        use_semantic_cache: bool = True,
+        use_planner: bool = True,
+        tenant_id: Optional[str] = None
     ) -> List[TextNode]:
         """
         Execute hybrid search on the specified collection.
@@ -619,136 +2126,651 @@ class QdrantDBManager:
             query: Search query
             filter_params: Optional filters
             top_k: Number of results to return
-            use_matryoshka: Whether the collection uses matryoshka embeddings
-            matryoshka_levels: Number of matryoshka levels if enabled
-            build_with_quantized: Whether the collection has quantized vectors
-            calibration_embeddings: Calibration embeddings if using quantization
+            use_matryoshka: Whether the collection uses matryoshka embeddings (stored setting by default)
+            matryoshka_levels: Number of matryoshka levels if enabled (stored setting by default)
+            build_with_quantized: Whether the collection has quantized vectors (stored setting by default)
+            calibration_embeddings: Calibration embeddings if using quantization; without them the
+                uint8 prefetch is skipped and the full dense vector is searched
+            use_cache: Serve and store results in the result cache
+            payload_fields: Payload fields to return besides the document text (all but sparse by default)
+            with_embeddings: Return vectors and sparse weights as node embeddings
+            fusion: "rrf", "dbsf" or "weighted" (profile default when omitted)
+            dense_limit: Candidates fetched by the dense branch
+            sparse_limit: Candidates fetched by the sparse branch
+            dense_weight: Weight of the dense branch for weighted fusion
+            hnsw_ef: HNSW ef for this query (profile default when omitted)
+            exact: Bypass the HNSW index and score all matching points
+            group_by: Payload field (e.g. parent_id) to group results by. `top_k`
+                groups are returned, flattened in group order, with at most
+                `group_size` hits each
+            group_size: Hits kept per group when grouping
+            diversify: Over-fetch `fetch_k` candidates and keep `top_k` of them
+                by maximal marginal relevance on the dense vectors. With `group_by`,
+                MMR runs within each group and keeps `group_size` of its hits
+            mmr_lambda: Relevance/diversity trade-off for MMR (1.0 is relevance only)
+            fetch_k: Candidates reranked by MMR (`top_k * 4` by default), or hits
+                fetched per group with `group_by` (`group_size * 4` by default)
+            duplicate_threshold: When diversifying, drop candidates whose cosine
+                similarity to a kept result reaches this value (None keeps them)
+            late_interaction: Rescore the fused candidates with MaxSim on the
+                late-interaction multivector (default: when the collection has one)
+            rescore_k: Fused candidates rescored by late interaction (all of them by default)
+            use_semantic_cache: With `use_cache`, also serve results of a near-identical
+                earlier query when the semantic cache is enabled
+            use_planner: Count the points matching `filter_params` and skip the
+                search when none match, or score them exhaustively when few do
+            tenant_id: Tenant searched in a shared collection (the request's tenant by default)
         """
+        # Tenant scoping is part of the filter, so caches, planner counts and usage are per tenant
+        filter_params = self.tenant_filter(collection_name, filter_params, tenant_id)
+        # Unset dense flags follow the vectors the collection was built with
+        use_matryoshka, matryoshka_levels, build_with_quantized = self.get_dense_layout(
+            collection_name, use_matryoshka, matryoshka_levels, build_with_quantized)
+        # Invalid filters and fusion options are reported to the caller rather than returning no results
+        search_filter = self._create_filter(filter_params) if filter_params else None
+        if diversify and not 0.0 <= mmr_lambda <= 1.0:
+            raise ValueError("mmr_lambda must be between 0 and 1")
+        if diversify and group_by:
+            # Groups are distinct documents already, so MMR over-fetches hits per group rather than groups
+            candidates_k, fetch_group_size = top_k, max(fetch_k or group_size * MMR_FETCH_FACTOR, group_size)
+        else:
+            candidates_k = max(fetch_k or top_k * MMR_FETCH_FACTOR, top_k) if diversify else top_k
+            fetch_group_size = group_size
+        profile = self.get_collection_profile(collection_name)
+        fusion_options = profile.fusion_options(
+            candidates_k * fetch_group_size * GROUP_PREFETCH_FACTOR if group_by else candidates_k,
+            fusion, dense_limit, sparse_limit, dense_weight)
+        search_params = profile.search_params(hnsw_ef=hnsw_ef, exact=exact)
+        if group_by and payload_fields:
+            payload_fields = [*payload_fields, group_by]
+
+        has_late_interaction = self.get_collection_settings(collection_name).get("late_interaction", False)
+        if late_interaction and not has_late_interaction:
+            raise ValueError(f"Collection '{collection_name}' was built without late interaction vectors")
+        late_interaction = has_late_interaction if late_interaction is None else late_interaction
+        if late_interaction:
+            rescore_k = rescore_k or fusion_options.dense_limit + fusion_options.sparse_limit
+
         try:
-            # Ensure models are loaded
-            if not hasattr(self, 'dense_model') or self.dense_model is None:
-                self._load_model_components()
-                    
-            dense_vectors = self.get_dense_embedding(
-                query, 
+            physical = self._resolve_cached(collection_name)
+            cache_version = self.result_cache.version(physical)
+            key_params = dict(
+                use_matryoshka=use_matryoshka,
+                build_with_quantized=build_with_quantized,
+                payload_fields=payload_fields,
+                with_embeddings=with_embeddings,
+                fusion=fusion_options.model_dump(),
+                search_params=search_params.model_dump(exclude_none=True),
+                group_by=group_by,
+                group_size=group_size,
+                diversify=[mmr_lambda, candidates_k, fetch_group_size, duplicate_threshold] if diversify else None,
+                late_interaction=rescore_k if late_interaction else None
+            )
+            cache_key = self.result_cache.make_key(physical, query, filter_params, top_k, **key_params)
+            if use_cache:
+                cached = self.result_cache.get(physical, cache_key)
+                if cached is not None:
+                    return cached
+
+            plan = SearchPlan(name="unfiltered")
+            if search_filter and use_planner and not exact:
+                planning_started = time.perf_counter()
+                try:
+                    plan = self.planner.plan(
+                        physical, filter_params, search_filter, self.exact_search_threshold(collection_name))
+                except Exception as e:
+                    logging.warning(f"Filter count failed, using filtered HNSW: {e}")
+                    plan = SearchPlan(name="hnsw")
+                if plan.name == "empty":
+                    # Answered by the count alone, which is the whole latency of the search
+                    self.planner.record(plan, time.perf_counter() - planning_started)
+                    if use_cache:
+                        self.result_cache.put(physical, cache_key, [], version=cache_version)
+                    return []
+                if plan.name == "exact":
+                    search_params = profile.search_params(hnsw_ef=hnsw_ef, exact=True)
+
+            # Semantic cache entries are shared by every wording of the same search
+            semantic_context = None
+            if use_cache and use_semantic_cache and self.semantic_cache:
+                semantic_context = self.result_cache.make_key(physical, "", filter_params, top_k, **key_params)
+                semantic_version = self.semantic_cache.version(physical)
+
+            query_embedding = None
+            if semantic_context:
+                # The dense embedding is encoded first, so a hit skips the sparse and token encoders too
+                if not hasattr(self, 'dense_model') or self.dense_model is None:
+                    self._load_model_components()
+                query_embedding = self.dense_model.encode(
+                    [query], convert_to_numpy=True, show_progress_bar=False)
+                cached = self.semantic_cache.get(physical, semantic_context, query_embedding[0])
+                if cached is not None:
+                    self.result_cache.put(physical, cache_key, cached, version=cache_version)
+                    return cached
+
+            dense_vectors, sparse_indices, sparse_values = self._encode_queries(
+                [query],
+                dense_embeddings=query_embedding,
                 use_matryoshka=use_matryoshka,
                 matryoshka_levels=matryoshka_levels,
                 build_with_quantized=build_with_quantized,
-                calibration_embeddings=calibration_embeddings
+                calibration_embeddings=calibration_embeddings,
+                sparse_pruning=self.get_sparse_pruning(collection_name, "query"),
+                sparse_mode=self.get_sparse_mode(collection_name),
+                late_interaction=late_interaction
             )
-            sparse_indices, sparse_values = self.sparse_vectors(
-                [query], is_query=True)
-
-            search_params = models.SearchParams(hnsw_ef=128, exact=False)
-            prefetch = []
-
-            if use_matryoshka:
-                dim = self.dense_model.get_sentence_embedding_dimension()
-                matryoshka_prefetch = models.Prefetch(
-                    prefetch=[
-                        models.Prefetch(
-                            prefetch=[
-                                models.Prefetch(
-                                    query=dense_vectors[f"matryoshka-{dim//4}dim"],
-                                    using=f"matryoshka-{dim//4}dim",
-                                    params=search_params,
-                                    limit=100,
-                                ),
-                            ],
-                            query=dense_vectors[f"matryoshka-{dim//2}dim"],
-                            using=f"matryoshka-{dim//2}dim",
-                            params=search_params,
-                            limit=50,
-                        )
-                    ],
-                    query=dense_vectors[f"matryoshka-{dim}dim"],
-                    using=f"matryoshka-{dim}dim",
-                    params=search_params,
-                    limit=25,
-                )
-                prefetch.append(matryoshka_prefetch)
-            elif build_with_quantized and "dense-uint8" in dense_vectors:
-                quantized_prefetch = models.Prefetch(
-                    prefetch=[
-                        models.Prefetch(
-                            query=dense_vectors["dense-uint8"],
-                            using="dense-uint8",
-                            params=search_params,
-                            limit=100,
-                        )
-                    ],
-                    query=dense_vectors["dense"],
-                    using="dense",
-                    params=search_params,
-                    limit=top_k * 2,
-                )
-                prefetch.append(quantized_prefetch)
+
+            search_started = time.perf_counter()
+            requests = self._build_hybrid_query(
+                dense_vectors[0],
+                sparse_indices[0],
+                sparse_values[0],
+                top_k=candidates_k,
+                search_params=search_params,
+                search_filter=search_filter,
+                use_matryoshka=use_matryoshka,
+                build_with_quantized=build_with_quantized,
+                payload_fields=payload_fields,
+                with_embeddings=with_embeddings,
+                fusion=fusion_options,
+                late_interaction_k=rescore_k if late_interaction else None
+            )
+
+            # Client-side fusion: the blended candidates are rescored in a second call
+            rescore = partial(
+                self._late_interaction_rescore, collection_name,
+                query_tokens=dense_vectors[0][LATE_INTERACTION_VECTOR], request=requests[0], rescore_k=rescore_k
+            ) if late_interaction and fusion_options.fusion == "weighted" else None
+
+            if diversify:
+                # MMR needs the candidates' primary dense vector
+                if use_matryoshka:
+                    vector_name = f"matryoshka-{self.dense_model.get_sentence_embedding_dimension()}dim"
+                else:
+                    vector_name = "dense"
+                for request in requests:
+                    request.with_vector = True if with_embeddings else [vector_name]
+
+            if group_by:
+                points = self._grouped_search(
+                    collection_name, requests, group_by, candidates_k, fetch_group_size, fusion_options, rescore)
             else:
-                dense_prefetch = models.Prefetch(
-                    query=dense_vectors["dense"],
-                    using="dense",
-                    params=search_params,
-                    limit=top_k * 2,
+                responses = self.client.query_batch_points(
+                    collection_name=collection_name,
+                    requests=requests
                 )
-                prefetch.append(dense_prefetch)
+                if rescore:
+                    points = rescore(self._fuse_responses(
+                        responses, max(rescore_k, candidates_k), fusion_options))[:candidates_k]
+                else:
+                    points = self._fuse_responses(responses, candidates_k, fusion_options)
+            search_seconds = time.perf_counter() - search_started
+            self.planner.record(plan, search_seconds)
+            self.filter_usage.record(physical, filter_params, search_seconds, group_by)
+
+            if diversify and group_by:
+                points = self._diversify_groups(
+                    points, dense_vectors[0][vector_name], vector_name, group_by, group_size,
+                    mmr_lambda, duplicate_threshold, keep_vectors=with_embeddings)
+            elif diversify:
+                points = self._diversify(
+                    points, dense_vectors[0][vector_name], vector_name, top_k,
+                    mmr_lambda, duplicate_threshold, keep_vectors=with_embeddings)
+
+            results = self._process_search_results(points, with_embeddings)
+            if use_cache:
+                self.result_cache.put(physical, cache_key, results, version=cache_version)
+            if semantic_context:
+                self.semantic_cache.put(
+                    physical, semantic_context, query_embedding[0], query, results, version=semantic_version)
+            return results
 
-            sparse_prefetch = models.Prefetch(
-                query=models.SparseVector(
-                    indices=sparse_indices[0],
-                    values=sparse_values[0],
-                ),
-                using="sparse",
-                params=search_params,
-                limit=top_k * 2,
-            )
-            prefetch.append(sparse_prefetch)
+        except Exception as e:
+            logging.error(f"Search failed: {str(e)}")
+            logging.error(traceback.format_exc())
+            return []
+
+    async def batch_advanced_search(
+        self,
+        collection_name: str,
+        searches: List[Dict[str, Any]],
+        use_matryoshka: Optional[bool] = None,
+        matryoshka_levels: Optional[int] = None,
+        build_with_quantized: Optional[bool] = None,
+        calibration_embeddings: Optional[np.ndarray] = None,
+        use_cache: bool = True,
+        payload_fields: Optional[List[str]] = None,
+        with_embeddings: bool = False,
+        fusion: Optional[str] = None,
+        dense_limit: Optional[int] = None,
+        sparse_limit: Optional[int] = None,
+        dense_weight: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        late_interaction: Optional[bool] = None,
+        use_semantic_cache: bool = True,
+        use_planner: bool = True,
+        tenant_id: Optional[str] = None
+    ) -> List[List[TextNode]]:
+        """
+        Execute many hybrid searches against one collection in a single round trip.
+
+        All queries are encoded in one batched pass per model and sent with
+        one `query_batch_points` call. Each query is cached, planned and
+        rescored like the same query sent to `advanced_search`, so both return
+        the same ranking and share cache entries.
+
+        Args:
+            collection_name: Name of collection to search
+            searches: One dict per query with `query` and optional `filter_params` and `top_k`
+            use_matryoshka: Whether the collection uses matryoshka embeddings (stored setting by default)
+            matryoshka_levels: Number of matryoshka levels if enabled (stored setting by default)
+            build_with_quantized: Whether the collection has quantized vectors (stored setting by default)
+            calibration_embeddings: Calibration embeddings if using quantization; without them the
+                uint8 prefetch is skipped and the full dense vector is searched
+            use_cache: Serve and store results in the result cache
+            payload_fields: Payload fields to return besides the document text (all but sparse by default)
+            with_embeddings: Return vectors and sparse weights as node embeddings
+            fusion: "rrf", "dbsf" or "weighted" (profile default when omitted)
+            dense_limit: Candidates fetched by the dense branch of every query
+            sparse_limit: Candidates fetched by the sparse branch of every query
+            dense_weight: Weight of the dense branch for weighted fusion
+            hnsw_ef: HNSW ef for these queries (profile default when omitted)
+            exact: Bypass the HNSW index and score all matching points
+            late_interaction: Rescore each query's fused candidates with MaxSim on the
+                late-interaction multivector (default: when the collection has one)
+            use_semantic_cache: With `use_cache`, also serve results of near-identical
+                earlier queries when the semantic cache is enabled
+            use_planner: Skip queries whose filter matches no points and score
+                exhaustively those whose filter matches few
+            tenant_id: Tenant searched in a shared collection (the request's tenant by default)
 
-            fusion_prefetch = models.Prefetch(
-                prefetch=prefetch,
-                query=models.FusionQuery(fusion=models.Fusion.RRF),
+        Returns:
+            List[List[TextNode]]: Results per query, in request order
+        """
+        if not searches:
+            return []
+        use_matryoshka, matryoshka_levels, build_with_quantized = self.get_dense_layout(
+            collection_name, use_matryoshka, matryoshka_levels, build_with_quantized)
+        if self.get_tenant_field(collection_name):
+            searches = [
+                {**search, "filter_params": self.tenant_filter(collection_name, search.get("filter_params"), tenant_id)}
+                for search in searches
+            ]
+
+        has_late_interaction = self.get_collection_settings(collection_name).get("late_interaction", False)
+        if late_interaction and not has_late_interaction:
+            raise ValueError(f"Collection '{collection_name}' was built without late interaction vectors")
+        late_interaction = has_late_interaction if late_interaction is None else late_interaction
+
+        profile = self.get_collection_profile(collection_name)
+        search_params = profile.search_params(hnsw_ef=hnsw_ef, exact=exact)
+        fusion_options = [
+            profile.fusion_options(search.get("top_k", 10), fusion, dense_limit, sparse_limit, dense_weight)
+            for search in searches
+        ]
+        # Late interaction rescores all fused candidates, as advanced_search does without rescore_k
+        rescore_ks = [
+            options.dense_limit + options.sparse_limit if late_interaction else None for options in fusion_options]
+
+        physical = self._resolve_cached(collection_name)
+        cache_version = self.result_cache.version(physical)
+        # Same keys as advanced_search, so batch and single searches share cache entries
+        key_params = [
+            dict(
+                use_matryoshka=use_matryoshka,
+                build_with_quantized=build_with_quantized,
+                payload_fields=payload_fields,
+                with_embeddings=with_embeddings,
+                fusion=options.model_dump(),
+                search_params=search_params.model_dump(exclude_none=True),
+                group_by=None,
+                group_size=1,
+                diversify=None,
+                late_interaction=rescore_k
             )
+            for options, rescore_k in zip(fusion_options, rescore_ks)
+        ]
+        cache_keys = [
+            self.result_cache.make_key(
+                physical, search["query"], search.get("filter_params"), search.get("top_k", 10), **params)
+            for search, params in zip(searches, key_params)
+        ]
+
+        results: List[Optional[List[TextNode]]] = [None] * len(searches)
+        if use_cache:
+            for i, key in enumerate(cache_keys):
+                results[i] = self.result_cache.get(physical, key)
+
+        # Filtered queries are planned one by one; filters matching nothing are answered without a search
+        plans: Dict[int, SearchPlan] = {}
+        for i in [i for i, cached in enumerate(results) if cached is None]:
+            filter_params = searches[i].get("filter_params")
+            plans[i] = SearchPlan(name="unfiltered")
+            if filter_params and use_planner and not exact:
+                planning_started = time.perf_counter()
+                try:
+                    plans[i] = self.planner.plan(
+                        physical, filter_params, self._create_filter(filter_params),
+                        self.exact_search_threshold(collection_name))
+                except Exception as e:
+                    logging.warning(f"Filter count failed, using filtered HNSW: {e}")
+                    plans[i] = SearchPlan(name="hnsw")
+                if plans[i].name == "empty":
+                    self.planner.record(plans[i], time.perf_counter() - planning_started)
+                    results[i] = []
+                    if use_cache:
+                        self.result_cache.put(physical, cache_keys[i], [], version=cache_version)
+
+        # Only queries missing from the caches are encoded and sent to Qdrant
+        pending = [i for i, cached in enumerate(results) if cached is None]
+        if not pending:
+            return results
+
+        dense_embeddings = None
+        semantic_contexts: Dict[int, str] = {}
+        if use_cache and use_semantic_cache and self.semantic_cache:
+            # The dense embeddings are encoded first, so hits skip the sparse and token encoders
+            if not hasattr(self, 'dense_model') or self.dense_model is None:
+                self._load_model_components()
+            dense_embeddings = self.dense_model.encode(
+                [searches[i]["query"] for i in pending], batch_size=32, convert_to_numpy=True, show_progress_bar=False)
+            semantic_version = self.semantic_cache.version(physical)
+            for i, embedding in zip(pending, dense_embeddings):
+                semantic_contexts[i] = self.result_cache.make_key(
+                    physical, "", searches[i].get("filter_params"), searches[i].get("top_k", 10), **key_params[i])
+                cached = self.semantic_cache.get(physical, semantic_contexts[i], embedding)
+                if cached is not None:
+                    results[i] = cached
+                    self.result_cache.put(physical, cache_keys[i], cached, version=cache_version)
+            misses = [j for j, i in enumerate(pending) if results[i] is None]
+            pending = [pending[j] for j in misses]
+            dense_embeddings = dense_embeddings[misses]
+            if not pending:
+                return results
+
+        dense_vectors, sparse_indices, sparse_values = self._encode_queries(
+            [searches[i]["query"] for i in pending],
+            use_matryoshka=use_matryoshka,
+            matryoshka_levels=matryoshka_levels,
+            build_with_quantized=build_with_quantized,
+            calibration_embeddings=calibration_embeddings,
+            sparse_pruning=self.get_sparse_pruning(collection_name, "query"),
+            sparse_mode=self.get_sparse_mode(collection_name),
+            late_interaction=late_interaction,
+            dense_embeddings=dense_embeddings
+        )
 
-            search_filter = self._create_filter(
-                filter_params) if filter_params else None
+        # Weighted fusion sends two requests per query, remember which ones belong together
+        search_started = time.perf_counter()
+        requests, spans = [], []
+        for i, dense, indices, values in zip(pending, dense_vectors, sparse_indices, sparse_values):
+            filter_params = searches[i].get("filter_params")
+            query_requests = self._build_hybrid_query(
+                dense,
+                indices,
+                values,
+                top_k=searches[i].get("top_k", 10),
+                search_params=(
+                    profile.search_params(hnsw_ef=hnsw_ef, exact=True) if plans[i].name == "exact" else search_params),
+                search_filter=self._create_filter(filter_params) if filter_params else None,
+                use_matryoshka=use_matryoshka,
+                build_with_quantized=build_with_quantized,
+                payload_fields=payload_fields,
+                with_embeddings=with_embeddings,
+                fusion=fusion_options[i],
+                late_interaction_k=rescore_ks[i]
+            )
+            spans.append((len(requests), len(requests) + len(query_requests)))
+            requests.extend(query_requests)
 
-            if use_matryoshka:
-                dim = self.dense_model.get_sentence_embedding_dimension()
-                primary_vector = dense_vectors[f"matryoshka-{dim}dim"]
-                using_vector = f"matryoshka-{dim}dim"
-            elif build_with_quantized and "dense-uint8" in dense_vectors:
-                primary_vector = dense_vectors["dense-uint8"]
-                using_vector = "dense-uint8"
+        responses = self.client.query_batch_points(
+            collection_name=collection_name,
+            requests=requests
+        )
+        search_seconds = (time.perf_counter() - search_started) / len(pending)
+        for position, (i, dense, (start, end)) in enumerate(zip(pending, dense_vectors, spans)):
+            top_k = searches[i].get("top_k", 10)
+            options = fusion_options[i]
+            if rescore_ks[i] and options.fusion == "weighted":
+                # Client-side fusion: the blended candidates are rescored in a second call
+                points = self._late_interaction_rescore(
+                    collection_name,
+                    self._fuse_responses(responses[start:end], max(rescore_ks[i], top_k), options),
+                    dense[LATE_INTERACTION_VECTOR], requests[start], rescore_ks[i])[:top_k]
             else:
-                primary_vector = dense_vectors["dense"]
-                using_vector = "dense"
+                points = self._fuse_responses(responses[start:end], top_k, options)
+            self.planner.record(plans[i], search_seconds)
+            self.filter_usage.record(physical, searches[i].get("filter_params"), search_seconds)
+            results[i] = self._process_search_results(points, with_embeddings)
+            if use_cache:
+                self.result_cache.put(physical, cache_keys[i], results[i], version=cache_version)
+            if i in semantic_contexts:
+                self.semantic_cache.put(
+                    physical, semantic_contexts[i], dense_embeddings[position], searches[i]["query"],
+                    results[i], version=semantic_version)
+        return results
+
+    async def multi_collection_search(
+        self,
+        collection_names: List[str],
+        query: str,
+        filter_params: Dict[str, Any] = None,
+        top_k: int = 10,
+        collection_fusion: str = "rrf",
+        use_cache: bool = True,
+        payload_fields: Optional[List[str]] = None,
+        hnsw_ef: Optional[int] = None,
+        exact: bool = False,
+        group_by: Optional[str] = None,
+        group_size: int = 1,
+        tenant_id: Optional[str] = None
+    ) -> List[TextNode]:
+        """
+        Execute one hybrid search across several collections and fuse the results globally.
 
-            search_result = self.client.query_points(
-                collection_name=collection_name,
-                prefetch=[fusion_prefetch],
-                query=primary_vector,
-                query_filter=search_filter,
-                using=using_vector,
-                with_payload=True,
-                limit=top_k,
-                search_params=search_params,
+        The query is encoded once, each collection is searched concurrently with
+        its own profile's fusion settings, and the per-collection rankings are
+        merged. Each result's metadata records the collection it came from.
+
+        Args:
+            collection_names: Collections or aliases to search
+            query: Search query
+            filter_params: Optional filters applied in every collection
+            top_k: Number of results to return overall (and fetched per collection)
+            collection_fusion: "rrf" to merge by rank, or "normalized" to merge
+                min-max normalized scores
+            use_cache: Serve and store per-collection results in the result cache
+            payload_fields: Payload fields to return besides the document text (all but sparse by default)
+            hnsw_ef: HNSW ef for these queries (profile default when omitted)
+            exact: Bypass the HNSW index and score all matching points
+            group_by: Payload field to group each collection's results by
+            group_size: Hits kept per group when grouping
+            tenant_id: Tenant searched in shared collections (the request's tenant by default)
+        """
+        if collection_fusion not in ("rrf", "normalized"):
+            raise ValueError(f"Unknown collection fusion '{collection_fusion}', expected 'rrf' or 'normalized'")
+        collection_names = list(dict.fromkeys(collection_names))
+        if not collection_names:
+            return []
+
+        # Shared collections add their tenant condition, so each collection gets its own filter
+        collection_filters = {
+            name: self.tenant_filter(name, filter_params, tenant_id) for name in collection_names}
+        search_filters = {
+            name: self._create_filter(params) if params else None for name, params in collection_filters.items()}
+        if group_by and payload_fields:
+            payload_fields = [*payload_fields, group_by]
+
+        # Each collection is searched on the dense vectors it was built with
+        layouts = {name: self.get_dense_layout(name) for name in collection_names}
+
+        ranked: Dict[str, Optional[List[TextNode]]] = {}
+        pending = []
+        for collection_name in collection_names:
+            profile = self.get_collection_profile(collection_name)
+            fusion_options = profile.fusion_options(
+                top_k * group_size * GROUP_PREFETCH_FACTOR if group_by else top_k)
+            search_params = profile.search_params(hnsw_ef=hnsw_ef, exact=exact)
+            # Collections with late-interaction vectors rescore all their fused candidates, as in advanced_search
+            late_k = None
+            if self.get_collection_settings(collection_name).get("late_interaction"):
+                late_k = fusion_options.dense_limit + fusion_options.sparse_limit
+            physical = self._resolve_cached(collection_name)
+            # Same key as advanced_search, so single-collection results are reused
+            cache_key = self.result_cache.make_key(
+                physical, query, collection_filters[collection_name], top_k,
+                use_matryoshka=layouts[collection_name][0],
+                build_with_quantized=layouts[collection_name][2],
+                payload_fields=payload_fields,
+                with_embeddings=False,
+                fusion=fusion_options.model_dump(),
+                search_params=search_params.model_dump(exclude_none=True),
+                group_by=group_by,
+                group_size=group_size,
+                diversify=None,
+                late_interaction=late_k
             )
+            ranked[collection_name] = self.result_cache.get(physical, cache_key) if use_cache else None
+            if ranked[collection_name] is None:
+                pending.append((collection_name, physical, cache_key, fusion_options, search_params,
+                                self.result_cache.version(physical), late_k))
 
-            return self._process_search_results(search_result.points)
+        if pending:
+            if not hasattr(self, 'dense_model') or self.dense_model is None:
+                self._load_model_components()
+            embedding = self.dense_model.encode([query], convert_to_numpy=True, show_progress_bar=False)
+            modes = sorted({self.get_sparse_mode(name) for name, *_ in pending})
+            dense_vectors, sparse_indices, sparse_values = self._encode_queries(
+                [query], dense_embeddings=embedding, sparse_mode=modes[0],
+                late_interaction=any(late_k for *_, late_k in pending))
+            sparse_by_mode = {modes[0]: (sparse_indices[0], sparse_values[0])}
+            for mode in modes[1:]:
+                mode_indices, mode_values = self.sparse_vectors([query], is_query=True, sparse_mode=mode)
+                sparse_by_mode[mode] = (mode_indices[0], mode_values[0])
+            # Matryoshka levels are cut from the same embedding, once per dense layout
+            dense_by_layout = {}
+            for layout in {layouts[name] for name, *_ in pending}:
+                vectors = self._dense_query_vectors(embedding[0], *layout)
+                if LATE_INTERACTION_VECTOR in dense_vectors[0]:
+                    vectors[LATE_INTERACTION_VECTOR] = dense_vectors[0][LATE_INTERACTION_VECTOR]
+                dense_by_layout[layout] = vectors
+
+            def search(collection_name, fusion_options, search_params, late_k) -> List[models.ScoredPoint]:
+                started = time.perf_counter()
+                points = search_collection(collection_name, fusion_options, search_params, late_k)
+                self.filter_usage.record(
+                    self._resolve_cached(collection_name), collection_filters[collection_name],
+                    time.perf_counter() - started, group_by)
+                return points
+
+            def search_collection(collection_name, fusion_options, search_params, late_k) -> List[models.ScoredPoint]:
+                # The query is encoded once per sparse mode, each collection applies its own sparse pruning
+                indices, values = self.get_sparse_pruning(collection_name, "query").apply(
+                    *sparse_by_mode[self.get_sparse_mode(collection_name)])
+                use_matryoshka, _, build_with_quantized = layouts[collection_name]
+                query_vectors = dense_by_layout[layouts[collection_name]]
+                requests = self._build_hybrid_query(
+                    query_vectors,
+                    indices,
+                    values,
+                    top_k=top_k,
+                    search_params=search_params,
+                    search_filter=search_filters[collection_name],
+                    use_matryoshka=use_matryoshka,
+                    build_with_quantized=build_with_quantized,
+                    payload_fields=payload_fields,
+                    fusion=fusion_options,
+                    late_interaction_k=late_k
+                )
+                rescore = partial(
+                    self._late_interaction_rescore, collection_name,
+                    query_tokens=query_vectors[LATE_INTERACTION_VECTOR], request=requests[0], rescore_k=late_k
+                ) if late_k and fusion_options.fusion == "weighted" else None
+                if group_by:
+                    return self._grouped_search(
+                        collection_name, requests, group_by, top_k, group_size, fusion_options, rescore)
+                responses = self.client.query_batch_points(collection_name=collection_name, requests=requests)
+                if rescore:
+                    return rescore(self._fuse_responses(responses, max(late_k, top_k), fusion_options))[:top_k]
+                return self._fuse_responses(responses, top_k, fusion_options)
+
+            if self.embedded:
+                # Embedded storage is not safe to query from several threads.
+                # Errors are collected like gather's return_exceptions, so one failing collection is skipped
+                responses = []
+                for name, _, _, fusion, params, _, late_k in pending:
+                    try:
+                        responses.append(search(name, fusion, params, late_k))
+                    except Exception as e:
+                        responses.append(e)
+            else:
+                responses = await asyncio.gather(
+                    *(asyncio.to_thread(search, name, fusion, params, late_k)
+                      for name, _, _, fusion, params, _, late_k in pending),
+                    return_exceptions=True
+                )
 
-        except Exception as e:
-            logging.error(f"Search failed: {str(e)}")
-            logging.error(traceback.format_exc())
-            return []
+            for (collection_name, physical, cache_key, _, _, version, _), points in zip(pending, responses):
+                if isinstance(points, Exception):
+                    logging.error(f"Search of '{collection_name}' failed: {points}")
+                    ranked[collection_name] = []
+                    continue
+                ranked[collection_name] = self._process_search_results(points)
+                if use_cache:
+                    self.result_cache.put(physical, cache_key, ranked[collection_name], version=version)
+
+        return self._fuse_collections(ranked, top_k * group_size if group_by else top_k, collection_fusion)
+
+    @staticmethod
+    def _fuse_collections(ranked: Dict[str, List[TextNode]], top_k: int, fusion: str = "rrf") -> List[TextNode]:
+        """
+        Merge per-collection rankings into one list.
 
-    def _process_search_results(self, results: List[models.ScoredPoint]) -> List[TextNode]:
+        "rrf" scores each result 1 / (60 + rank) so every collection's best hits
+        interleave regardless of score scale. "normalized" min-max normalizes
+        each collection's scores to [0, 1] before merging.
+        """
+        fused = []
+        for collection_name, nodes in ranked.items():
+            scores = [node.metadata.get("score", 0.0) for node in nodes]
+            low, span = (min(scores), max(scores) - min(scores)) if scores else (0.0, 0.0)
+            for rank, (node, score) in enumerate(zip(nodes, scores)):
+                if fusion == "rrf":
+                    fused_score = 1.0 / (60 + rank + 1)
+                else:
+                    fused_score = (score - low) / span if span else 1.0
+                fused.append((fused_score, score, collection_name, node))
+
+        fused.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [
+            TextNode(
+                text=node.text,
+                id_=node.id_,
+                embedding=node.embedding,
+                metadata={**node.metadata, "collection": collection_name,
+                          "collection_score": score, "score": fused_score}
+            )
+            for fused_score, score, collection_name, node in fused[:top_k]
+        ]
+
+    def _process_search_results(self, results: List[models.ScoredPoint], with_embeddings: bool = False) -> List[TextNode]:
         """
         Convert Qdrant search results to TextNode objects.
         """
-        text_nodes = []
-        for result in results:
-            text_node = self._convert_to_text_node(result)
-            text_nodes.append(text_node)
-        return text_nodes
+        convert = self._convert_to_text_node if with_embeddings else self._convert_to_lean_node
+        return [convert(result) for result in results]
+
+    @staticmethod
+    def _convert_to_lean_node(result: models.ScoredPoint) -> TextNode:
+        """
+        Convert a ScoredPoint fetched without vectors to a TextNode holding only text and metadata.
+        """
+        metadata = dict(result.payload or {})
+        metadata.pop('sparse', None)
+        text = metadata.pop('document', '')
+        metadata['score'] = result.score
+        return TextNode(text=text, id_=str(result.id), metadata=metadata)
 
     def _convert_to_text_node(self, result: models.ScoredPoint) -> TextNode:
         """
@@ -776,12 +2798,7 @@ class QdrantDBManager:
     def _create_filter(self, filter_params: Dict[str, Any]) -> models.Filter:
         """
         Create a Qdrant filter with json input.
+
+        Compiled filters are cached by canonical JSON, see `compile_filter`.
         """
-        builder = FilterBuilder()
-        if 'must' in filter_params:
-            builder.add_must(filter_params['must'])
-        if 'should' in filter_params:
-            builder.add_should(filter_params['should'])
-        if 'must_not' in filter_params:
-            builder.add_must_not(filter_params['must_not'])
-        return builder.build()
\ No newline at end of file
+        return compile_filter(filter_params)
\ No newline at end of file
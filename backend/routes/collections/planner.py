@@ -0,0 +1,126 @@
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Literal, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+# Latencies kept per plan for the percentile stats
+PLAN_LATENCY_WINDOW = 1000
+
+
+class SearchPlan(BaseModel):
+    """How one filtered search is executed, from the number of matching points."""
+    name: Literal["unfiltered", "empty", "exact", "hnsw"]
+    matches: Optional[int] = None
+
+
+class SearchPlanner:
+    """
+    Chooses between filtered HNSW and an exact scan from the filter's cardinality.
+
+    Filtered HNSW over a small match set walks many graph nodes that fail the
+    filter and can miss results. Qdrant falls back to a full scan by itself only
+    when payload indexes let it estimate the filter. This planner counts the
+    matching points with Qdrant `count`, caches the count per collection and
+    canonical filter JSON, and picks:
+
+    - "empty": nothing matches, the search is skipped
+    - "exact": at most `exact_threshold` matches, scored exhaustively
+    - "hnsw": everything else
+
+    Counts are dropped when the collection is written to, or after `ttl` seconds.
+    """
+
+    def __init__(self, client: QdrantClient, ttl: float = 300.0, max_entries: int = 4096):
+        """
+        Args:
+            client: Qdrant client used for counting
+            ttl: Seconds a filter count is reused
+            max_entries: Maximum number of cached filter counts
+        """
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._counts: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._plans: Dict[str, int] = {}
+
+    @staticmethod
+    def signature(filter_params: Dict[str, Any]) -> str:
+        """Canonical JSON of a filter, identical for equivalent key orders."""
+        return json.dumps(filter_params, sort_keys=True, default=str)
+
+    def count(self, collection_name: str, filter_params: Dict[str, Any], search_filter: models.Filter) -> int:
+        """Number of points matching a filter, served from the cache when fresh."""
+        key = (collection_name, self.signature(filter_params))
+        cached = self._counts.get(key)
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+
+        matches = self.client.count(
+            collection_name=collection_name,
+            count_filter=search_filter,
+            exact=True
+        ).count
+
+        if len(self._counts) >= self.max_entries:
+            self._counts.pop(next(iter(self._counts)))
+        self._counts[key] = (matches, time.monotonic())
+        return matches
+
+    def plan(
+        self,
+        collection_name: str,
+        filter_params: Dict[str, Any],
+        search_filter: models.Filter,
+        exact_threshold: int
+    ) -> SearchPlan:
+        """
+        Choose the plan for a filtered search.
+
+        Args:
+            collection_name: Physical collection name
+            filter_params: Filter JSON, used as the cache key
+            search_filter: The compiled filter
+            exact_threshold: Largest match count scored exhaustively
+        """
+        matches = self.count(collection_name, filter_params, search_filter)
+        if matches == 0:
+            plan = SearchPlan(name="empty", matches=matches)
+        elif matches <= exact_threshold:
+            plan = SearchPlan(name="exact", matches=matches)
+        else:
+            plan = SearchPlan(name="hnsw", matches=matches)
+        logging.info(f"Search plan for '{collection_name}': {plan.name} ({matches} matching points)")
+        return plan
+
+    def record(self, plan: SearchPlan, seconds: float):
+        """Record the latency of a search executed with a plan."""
+        self._plans[plan.name] = self._plans.get(plan.name, 0) + 1
+        self._latencies.setdefault(plan.name, deque(maxlen=PLAN_LATENCY_WINDOW)).append(seconds * 1000)
+        if plan.name != "unfiltered":
+            logging.info(f"Search with plan '{plan.name}' took {seconds * 1000:.1f}ms")
+
+    def invalidate(self, collection_name: str):
+        """Drop the cached counts of a collection after a write."""
+        for key in [key for key in self._counts if key[0] == collection_name]:
+            del self._counts[key]
+
+    def clear(self):
+        self._counts.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        plans = {}
+        for name, count in self._plans.items():
+            latencies = np.asarray(self._latencies[name])
+            plans[name] = {
+                "searches": count,
+                "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+                "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+            }
+        return {"cached_counts": len(self._counts), "ttl": self.ttl, "plans": plans}
@@ -0,0 +1,139 @@
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+from qdrant_client.http import models
+
+
+class CollectionProfile(BaseModel):
+    """Storage and latency settings applied to a collection at creation and query time."""
+    name: str
+    description: str
+
+    # HNSW graph
+    hnsw_m: int = Field(16, description="Edges per node in the HNSW graph")
+    hnsw_ef_construct: int = Field(100, description="Candidate list size while building the graph")
+    full_scan_threshold: int = Field(10000, description="Below this size (KB) filtered searches use a full scan")
+    hnsw_on_disk: bool = Field(False, description="Keep the HNSW graph on disk")
+
+    # Storage
+    vectors_on_disk: bool = Field(False, description="Store dense vectors as mmap files")
+    sparse_on_disk: bool = Field(False, description="Store the sparse index on disk")
+    payload_on_disk: bool = Field(True, description="Read payloads from disk instead of RAM")
+
+    # Segments and optimizer
+    default_segment_number: int = Field(0, description="Target segment count, 0 selects by CPU count")
+    max_segment_size_kb: Optional[int] = Field(None, description="Largest segment size in KB")
+    memmap_threshold_kb: Optional[int] = Field(None, description="Segments above this size (KB) become mmap")
+    indexing_threshold_kb: int = Field(20000, description="Segments above this size (KB) get an HNSW index")
+
+    # Query time
+    search_hnsw_ef: int = Field(128, description="Default HNSW ef used by searches")
+    fusion: Literal["rrf", "dbsf", "weighted"] = Field("rrf", description="Default fusion of the dense and sparse branches")
+    dense_weight: float = Field(0.5, ge=0.0, le=1.0, description="Weight of the dense branch in weighted fusion")
+    prefetch_multiplier: int = Field(2, ge=1, description="Candidates fetched per branch as a multiple of top_k")
+
+    def hnsw_config(self, tenant_partitioned: bool = False) -> models.HnswConfigDiff:
+        """
+        HNSW settings of the profile. Collections partitioned by a tenant payload
+        key build one graph per tenant (`payload_m`) instead of a global graph,
+        since every search is filtered to a single tenant.
+        """
+        if tenant_partitioned:
+            return models.HnswConfigDiff(
+                m=0,
+                payload_m=self.hnsw_m,
+                ef_construct=self.hnsw_ef_construct,
+                full_scan_threshold=self.full_scan_threshold,
+                on_disk=self.hnsw_on_disk
+            )
+        return models.HnswConfigDiff(
+            m=self.hnsw_m,
+            ef_construct=self.hnsw_ef_construct,
+            full_scan_threshold=self.full_scan_threshold,
+            on_disk=self.hnsw_on_disk
+        )
+
+    def optimizers_config(self) -> models.OptimizersConfigDiff:
+        return models.OptimizersConfigDiff(
+            default_segment_number=self.default_segment_number,
+            max_segment_size=self.max_segment_size_kb,
+            memmap_threshold=self.memmap_threshold_kb,
+            indexing_threshold=self.indexing_threshold_kb
+        )
+
+    def search_params(self, hnsw_ef: Optional[int] = None, exact: bool = False) -> models.SearchParams:
+        return models.SearchParams(hnsw_ef=hnsw_ef or self.search_hnsw_ef, exact=exact)
+
+    def fusion_options(
+        self,
+        top_k: int,
+        fusion: Optional[str] = None,
+        dense_limit: Optional[int] = None,
+        sparse_limit: Optional[int] = None,
+        dense_weight: Optional[float] = None
+    ) -> "FusionOptions":
+        """
+        Resolve per-query fusion settings, falling back to the profile defaults.
+
+        Raises:
+            ValueError: If an override is invalid
+        """
+        return FusionOptions(
+            fusion=fusion or self.fusion,
+            dense_limit=dense_limit or top_k * self.prefetch_multiplier,
+            sparse_limit=sparse_limit or top_k * self.prefetch_multiplier,
+            dense_weight=self.dense_weight if dense_weight is None else dense_weight
+        )
+
+
+class FusionOptions(BaseModel):
+    """How the dense and sparse branches of one hybrid query are fetched and combined."""
+    fusion: Literal["rrf", "dbsf", "weighted"] = Field(
+        "rrf", description="Reciprocal rank fusion, distribution-based score fusion or a client-side weighted blend")
+    dense_limit: int = Field(20, ge=1, description="Candidates fetched by the dense branch")
+    sparse_limit: int = Field(20, ge=1, description="Candidates fetched by the sparse branch")
+    dense_weight: float = Field(0.5, ge=0.0, le=1.0, description="Weight of the dense branch in weighted fusion")
+
+
+COLLECTION_PROFILES: Dict[str, CollectionProfile] = {
+    "low-latency-ram": CollectionProfile(
+        name="low-latency-ram",
+        description="Everything in RAM with a denser graph and few large segments, for latency-critical collections",
+        hnsw_m=32,
+        hnsw_ef_construct=200,
+        payload_on_disk=False,
+        default_segment_number=2,
+        search_hnsw_ef=128
+    ),
+    "balanced": CollectionProfile(
+        name="balanced",
+        description="Vectors and indexes in RAM, payloads on disk",
+        search_hnsw_ef=128
+    ),
+    "large-mmap": CollectionProfile(
+        name="large-mmap",
+        description="Vectors, HNSW graph and sparse index memory-mapped from disk, for collections larger than RAM",
+        hnsw_on_disk=True,
+        vectors_on_disk=True,
+        sparse_on_disk=True,
+        max_segment_size_kb=2_000_000,
+        memmap_threshold_kb=20000,
+        search_hnsw_ef=64
+    ),
+}
+
+DEFAULT_PROFILE = "balanced"
+
+
+def get_profile(name: Optional[str] = None) -> CollectionProfile:
+    """
+    Look up a collection profile by name.
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    name = name or DEFAULT_PROFILE
+    if name not in COLLECTION_PROFILES:
+        raise ValueError(
+            f"Unknown collection profile '{name}', expected one of {list(COLLECTION_PROFILES)}")
+    return COLLECTION_PROFILES[name]
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File, Form
+from fastapi.responses import JSONResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 from datetime import datetime
-from typing import Dict, Any, List, AsyncGenerator
+from typing import Dict, Any, List, AsyncGenerator, Optional
 from datasets import load_dataset, load_dataset_builder
 import os
 import uuid
@@ -13,7 +13,12 @@ import gc
 import torch
 
 import models.http as rest
-from .filters import FilterBuilder
+from .advisor import DEFAULT_MIN_OBSERVED_SECONDS, DEFAULT_MIN_SEARCHES
+from .chunking import CHUNK_FIELDS, CHUNK_PAYLOAD_INDEXES
+from .profiler import SchemaProfiler
+from .profiles import COLLECTION_PROFILES, DEFAULT_PROFILE
+from .sparse import SparsePruning
+from .tenancy import TENANT_BUILD_FIELD, current_tenant
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/collections", tags=["qdrant"])
@@ -35,14 +40,52 @@ async def _build_collection_stream(
     split: str = "train",
     text_field: str = "text",
     batch_size: int = 4,
-    load_from_disk: bool = False
+    load_from_disk: bool = False,
+    enable_chunking: bool = True,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: int = 64,
+    keep_versions: int = 2,
+    bulk_load: bool = True,
+    profile: str = DEFAULT_PROFILE,
+    document_sparse_pruning: Optional[SparsePruning] = None,
+    query_sparse_pruning: Optional[SparsePruning] = None,
+    dense_datatype: str = "float32",
+    dense_on_disk: Optional[bool] = None,
+    sparse_mode: str = "splade",
+    late_interaction: bool = False,
+    schema_sample_size: int = 5000,
+    tenant_id: Optional[str] = None
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Memory-optimized streaming generator for building collections.
+
+    `collection_name` is served through an alias: documents are inserted into a
+    new versioned collection which the alias is switched to once the build
+    succeeds, after which versions beyond `keep_versions` are removed.
+
+    With `bulk_load`, HNSW indexing is deferred until all documents are inserted
+    and the alias is only switched once the index build has finished.
+
+    Documents longer than the dense model's context window are split into
+    overlapping token chunks before embedding when `enable_chunking` is set.
+
+    Payload indexes are chosen from a profile of every inserted point (type
+    histograms, HyperLogLog cardinality, string lengths) plus a reservoir of
+    `schema_sample_size` points, and created once insertion is done.
+
+    When `collection_name` is a collection shared by tenants, the build
+    replaces one tenant's documents (`tenant_id`, or the request's tenant)
+    instead of creating a new version: new points carry a build id, and the
+    tenant's older points are deleted once the build succeeds. Collection
+    settings come from the shared collection and the options above are ignored.
     """
     def progress(status: str, message: str, **kwargs) -> Dict[str, Any]:
         return {"status": status, "message": message, **kwargs}
     
+    build_name = None
+    promoted = False
+    tenant_field = None
+    build_id = uuid.uuid4().hex
     try:
         yield progress("initializing", f"Starting collection build process for '{collection_name}'")
         
@@ -87,33 +130,52 @@ async def _build_collection_stream(
             yield progress("error", "No datasets were successfully verified")
             return
 
-        # Create collection with minimal schema
-        yield progress("creating", f"Creating collection '{collection_name}'")
-        
-        # Load just one sample for schema
-        sample_data = None
-        for name in dataset_names:
+        if enable_chunking:
+            # Reject chunk sizes the model cannot take before any collection is created
             try:
-                sample = load_dataset(
-                    name, 
-                    split=f"{split}[:1]",  # Just 1 sample
-                    trust_remote_code=True
-                ) if not load_from_disk else load_dataset(name, split=f"{split}[:1]")
-                sample_data = sample
-                break
-            except:
-                continue
-        
-        if sample_data:
-            qdrant_manager.recreate_collection(
-                collection_name=collection_name,
-                datasets=[sample_data],
-                text_field=text_field
+                qdrant_manager.get_chunker(chunk_size, chunk_overlap)
+            except ValueError as e:
+                yield progress("error", f"Invalid chunking settings: {e}")
+                return
+
+        tenant_field = qdrant_manager.get_tenant_field(collection_name)
+        if tenant_field:
+            tenant_id = tenant_id or current_tenant.get()
+            if not tenant_id:
+                tenant_field = None
+                yield progress("error", f"Collection '{collection_name}' is shared by tenants, a tenant id is required")
+                return
+            # The shared collection stays live: the tenant's new points are added next to its old ones
+            build_name = qdrant_manager.resolve_collection(collection_name)
+            bulk_load = False
+            yield progress(
+                "created",
+                f"Building tenant '{tenant_id}' into shared collection '{build_name}'",
+                build_collection=build_name,
+                tenant_id=tenant_id
             )
-            del sample_data  # Free memory immediately
-            gc.collect()
-    
-        
+        else:
+            # Create collection with minimal schema
+            yield progress("creating", f"Creating collection '{collection_name}'")
+
+            # Build into a new versioned collection; the alias keeps serving the old one until promotion
+            build_name = qdrant_manager.create_collection_version(
+                alias=collection_name,
+                payload_indexes=CHUNK_PAYLOAD_INDEXES if enable_chunking else None,
+                bulk_load=bulk_load,
+                profile=profile,
+                document_sparse_pruning=document_sparse_pruning,
+                query_sparse_pruning=query_sparse_pruning,
+                dense_datatype=dense_datatype,
+                dense_on_disk=dense_on_disk,
+                sparse_mode=sparse_mode,
+                late_interaction=late_interaction
+            )
+            yield progress("created", f"Building into '{build_name}'", build_collection=build_name)
+
+        # Payload indexes are typed from the points actually inserted, profiled during the single pass
+        profiler = SchemaProfiler(sample_size=schema_sample_size)
+
         # Process datasets with aggressive memory management
         total_processed = 0
         
@@ -149,29 +211,41 @@ async def _build_collection_stream(
                 # Reduce batch size for memory efficiency
                 effective_batch_size = min(batch_size, 4)
 
-                for item in dataset:
-                    if text_field not in item:
-                        continue
-                    
-                    # Create minimal document
-                    doc = {
-                        "document": item[text_field],  # Limit text length
-                        "id": str(uuid.uuid4()),  # Generate ID instead of using dataset ID
-                        "dataset": name  # Just track source dataset
-                    }
-                    
-                    # Only include essential metadata
-                    essential_fields = ['title', 'author', 'date', 'category', 'label']
-                    for field in essential_fields:
-                        if field in item and field != text_field:
-                            doc[field] = item[field]
-                    
+                def documents():
+                    for item in dataset:
+                        if text_field not in item:
+                            continue
+                        
+                        # Create minimal document
+                        doc = {
+                            "document": item[text_field],  # Limit text length
+                            "id": str(uuid.uuid4()),  # Generate ID instead of using dataset ID
+                            "dataset": name  # Just track source dataset
+                        }
+                        
+                        # Only include essential metadata
+                        essential_fields = ['title', 'author', 'date', 'category', 'label']
+                        for field in essential_fields:
+                            if field in item and field != text_field:
+                                doc[field] = item[field]
+
+                        if tenant_field:
+                            doc[TENANT_BUILD_FIELD] = build_id
+                        
+                        yield doc
+
+                # Chunks are produced lazily, so only the current batch is ever held in memory
+                chunker = qdrant_manager.get_chunker(chunk_size, chunk_overlap) if enable_chunking else None
+                stream = profiler.stream(chunker.stream(documents()) if chunker else documents())
+
+                for doc in stream:
                     batch.append(doc)
                     
                     if len(batch) >= effective_batch_size:
                         await qdrant_manager.process_and_insert_batch(
-                            collection_name=collection_name,
-                            batch=batch
+                            collection_name=build_name,
+                            batch=batch,
+                            tenant_id=tenant_id
                         )
                         processed += len(batch)
                         batch = []
@@ -182,7 +256,8 @@ async def _build_collection_stream(
                             current=processed,
                             total=total_count,
                             dataset=idx + 1,
-                            total_datasets=len(dataset_names)
+                            total_datasets=len(dataset_names),
+                            **(chunker.stats() if chunker else {})
                         )
                         
                         # Aggressive cleanup every few batches
@@ -193,15 +268,17 @@ async def _build_collection_stream(
                                 torch.cuda.empty_cache()
                         
                         # Hard limit to prevent memory overflow
-                        if processed >= min(total_count, 50000):  # Max 50k per dataset
+                        documents_seen = chunker.documents if chunker else processed
+                        if documents_seen >= min(total_count, 50000):  # Max 50k per dataset
                             yield progress("info", f"Reached processing limit for {name}")
                             break
 
                 # Final batch
                 if batch:
                     await qdrant_manager.process_and_insert_batch(
-                        collection_name=collection_name,
-                        batch=batch
+                        collection_name=build_name,
+                        batch=batch,
+                        tenant_id=tenant_id
                     )
                     processed += len(batch)
                 
@@ -210,7 +287,8 @@ async def _build_collection_stream(
                     "completed_dataset",
                     f"Completed dataset {idx + 1}/{len(dataset_names)}: {name}",
                     processed=processed,
-                    total_processed=total_processed
+                    total_processed=total_processed,
+                    **(chunker.stats() if chunker else {})
                 )
                 
                 # Force cleanup after each dataset
@@ -225,6 +303,58 @@ async def _build_collection_stream(
                 gc.collect()
                 continue
 
+        if not total_processed:
+            yield progress("error", "No documents were inserted, keeping the current collection")
+            return
+
+        schema = profiler.schema()
+        if tenant_field:
+            # Indexes of a shared collection are not re-typed from one tenant's data
+            payload_indexes = {}
+        else:
+            payload_indexes = qdrant_manager.create_profiled_indexes(
+                build_name, schema, skip=CHUNK_FIELDS if enable_chunking else None)
+        yield progress(
+            "profiled",
+            f"Created {len(payload_indexes)} payload indexes from {profiler.rows} profiled points",
+            payload_indexes=payload_indexes,
+            schema_profile=profiler.report(schema)
+        )
+
+        if bulk_load:
+            yield progress("indexing", f"Building HNSW index for '{build_name}'")
+            indexing_seconds = await qdrant_manager.finish_bulk_load(build_name)
+            yield progress(
+                "indexed",
+                f"Index built in {indexing_seconds:.1f}s",
+                indexing_seconds=round(indexing_seconds, 2)
+            )
+
+        if tenant_field:
+            await asyncio.to_thread(
+                qdrant_manager.delete_points, build_name,
+                filter_params={"must_not": [{"key": TENANT_BUILD_FIELD, "value": build_id}]},
+                tenant_id=tenant_id
+            )
+            promoted = True
+            yield progress(
+                "completed",
+                f"Tenant '{tenant_id}' rebuilt in '{collection_name}'. Processed {total_processed} documents.",
+                total_processed=total_processed,
+                tenant_id=tenant_id
+            )
+            return
+
+        qdrant_manager.promote_collection_version(collection_name, build_name)
+        promoted = True
+        deleted = qdrant_manager.gc_collection_versions(collection_name, keep=keep_versions)
+        yield progress(
+            "promoted",
+            f"Alias '{collection_name}' now points to '{build_name}'",
+            build_collection=build_name,
+            removed_versions=deleted
+        )
+
         yield progress("completed", f"Collection build completed. Processed {total_processed} documents.", total_processed=total_processed)
 
     except Exception as e:
@@ -232,6 +362,20 @@ async def _build_collection_stream(
         yield progress("error", f"Build process failed: {str(e)}")
         raise
     finally:
+        # Partially built versions are never served, drop them
+        if build_name and not promoted:
+            try:
+                if tenant_field:
+                    qdrant_manager.delete_points(
+                        build_name,
+                        filter_params={"must": [{"key": TENANT_BUILD_FIELD, "value": build_id}]},
+                        tenant_id=tenant_id
+                    )
+                else:
+                    qdrant_manager.delete_collection_version(build_name)
+            except Exception as e:
+                logger.error(f"Failed to delete unpromoted collection '{build_name}': {e}")
+
         # Final cleanup
         gc.collect()
         if torch.cuda.is_available():
@@ -262,7 +406,20 @@ async def build_collection_endpoint(
                 split=request.split,
                 text_field=request.text_field,
                 batch_size=request.batch_size,
-                load_from_disk=request.load_from_disk
+                load_from_disk=request.load_from_disk,
+                enable_chunking=request.enable_chunking,
+                chunk_size=request.chunk_size,
+                chunk_overlap=request.chunk_overlap,
+                keep_versions=request.keep_versions,
+                bulk_load=request.bulk_load,
+                profile=request.profile,
+                document_sparse_pruning=SparsePruning(top_n=request.sparse_top_n, mass=request.sparse_mass),
+                query_sparse_pruning=SparsePruning(top_n=request.query_sparse_top_n, mass=request.query_sparse_mass),
+                dense_datatype=request.dense_datatype,
+                dense_on_disk=request.dense_on_disk,
+                sparse_mode=request.sparse_mode,
+                late_interaction=request.late_interaction,
+                schema_sample_size=request.schema_sample_size
             ):
                 active_builds[collection_name]["status"] = update["status"]
                 update["timestamp"] = datetime.now().isoformat()
@@ -329,50 +486,461 @@ async def cancel_build(collection_name: str):
         "message": f"Requested cancellation of build for collection '{collection_name}'"
     })
 
+@router.get("/profiles")
+async def list_collection_profiles():
+    """List the storage/latency profiles collections can be built with."""
+    return JSONResponse(content={
+        "default": DEFAULT_PROFILE,
+        "profiles": {name: profile.model_dump() for name, profile in COLLECTION_PROFILES.items()}
+    })
+
+@router.post("/{collection_name}/migrations/strip-sparse-payload")
+async def strip_sparse_payload(collection_name: str, batch_size: int = 256):
+    """
+    Remove sparse weights duplicated in the payload of an existing collection.
+
+    Returns the number of points migrated and the approximate storage reclaimed.
+    """
+    if collection_name in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{collection_name}'")
+    try:
+        report = await asyncio.to_thread(
+            qdrant_manager.strip_sparse_payload,
+            collection_name,
+            batch_size
+        )
+        return JSONResponse(content=report)
+    except Exception as e:
+        logger.error(f"Error stripping sparse payload from '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Migration failed: {str(e)}")
+
+@router.get("/{collection_name}/indexes/advice")
+async def get_payload_index_advice(
+    collection_name: str,
+    min_searches: int = DEFAULT_MIN_SEARCHES,
+    min_observed_seconds: float = DEFAULT_MIN_OBSERVED_SECONDS
+):
+    """
+    Recommend payload indexes to create or drop from the filters searches used since startup.
+    """
+    try:
+        advice = await asyncio.to_thread(
+            qdrant_manager.advise_payload_indexes,
+            collection_name,
+            min_searches=min_searches,
+            min_observed_seconds=min_observed_seconds
+        )
+        return JSONResponse(content=advice)
+    except Exception as e:
+        logger.error(f"Error advising payload indexes for '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Index advice failed: {str(e)}")
+
+@router.post("/{collection_name}/indexes/apply")
+async def apply_payload_index_advice(collection_name: str, request: rest.IndexAdviceApplyRequest):
+    """
+    Create the recommended payload indexes, and drop unused ones when requested.
+    """
+    if collection_name in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{collection_name}'")
+    try:
+        applied = await asyncio.to_thread(
+            qdrant_manager.apply_payload_index_advice,
+            collection_name,
+            fields=request.fields,
+            drop=request.drop,
+            min_searches=request.min_searches,
+            min_observed_seconds=request.min_observed_seconds
+        )
+        return JSONResponse(content={"collection": collection_name, "applied": applied})
+    except Exception as e:
+        logger.error(f"Error applying payload index advice for '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Applying index advice failed: {str(e)}")
+
+@router.post("/tenants")
+async def create_tenant_collection(request: rest.TenantCollectionRequest):
+    """
+    Create an empty collection shared by tenants. Builds sent with an
+    X-Tenant-ID header then fill or replace one tenant's documents in it.
+    """
+    try:
+        physical = await asyncio.to_thread(
+            qdrant_manager.create_tenant_collection,
+            request.collection_name,
+            tenant_field=request.tenant_field,
+            payload_indexes=CHUNK_PAYLOAD_INDEXES if request.enable_chunking else None,
+            profile=request.profile,
+            dense_datatype=request.dense_datatype,
+            sparse_mode=request.sparse_mode,
+            late_interaction=request.late_interaction
+        )
+        return JSONResponse(content={
+            "collection": request.collection_name,
+            "physical_collection": physical,
+            "tenant_field": request.tenant_field
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating tenant collection '{request.collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Creating tenant collection failed: {str(e)}")
+
+@router.post("/tenants/migrate")
+async def migrate_to_tenant_collection(request: rest.TenantMigrationRequest):
+    """
+    Copy per-team collections into a shared collection, one tenant per source, without re-embedding.
+    """
+    busy = [name for name in [request.target_collection, *request.sources] if name in active_builds]
+    if busy:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{busy[0]}'")
+    try:
+        copied = await asyncio.to_thread(
+            qdrant_manager.migrate_to_tenant_collection,
+            request.sources,
+            request.target_collection,
+            tenant_field=request.tenant_field,
+            batch_size=request.batch_size,
+            delete_sources=request.delete_sources
+        )
+        return JSONResponse(content={"collection": request.target_collection, "copied": copied})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error migrating into '{request.target_collection}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Tenant migration failed: {str(e)}")
+
+@router.post("/{collection_name}/snapshots")
+async def create_snapshot(collection_name: str):
+    """
+    Snapshot a collection on the Qdrant server. The response carries the
+    collection settings, which restoring elsewhere needs and the snapshot does not hold.
+    """
+    try:
+        snapshot = await asyncio.to_thread(qdrant_manager.create_snapshot, collection_name)
+        return JSONResponse(content=snapshot)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating snapshot of '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Creating snapshot failed: {str(e)}")
+
+@router.get("/{collection_name}/snapshots")
+async def list_snapshots(collection_name: str):
+    """List the snapshots of a collection, newest first."""
+    try:
+        snapshots = await asyncio.to_thread(qdrant_manager.list_snapshots, collection_name)
+        return JSONResponse(content={"collection": collection_name, "snapshots": snapshots})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing snapshots of '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Listing snapshots failed: {str(e)}")
+
+@router.get("/{collection_name}/snapshots/{snapshot_name}")
+async def download_snapshot(collection_name: str, snapshot_name: str):
+    """
+    Stream a snapshot file from Qdrant to the client in fixed-size chunks.
+
+    The collection settings are returned in the X-Collection-Settings header,
+    to be passed back when the file is uploaded.
+    """
+    try:
+        snapshot = await asyncio.to_thread(qdrant_manager.get_snapshot, collection_name, snapshot_name)
+        physical = await asyncio.to_thread(qdrant_manager.resolve_collection, collection_name)
+        settings = await asyncio.to_thread(qdrant_manager.get_collection_settings, physical)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{snapshot_name}"',
+        "X-Collection-Settings": json.dumps(settings),
+    }
+    if snapshot.size:
+        headers["Content-Length"] = str(snapshot.size)
+    if snapshot.checksum:
+        headers["X-Snapshot-Checksum"] = snapshot.checksum
+    return StreamingResponse(
+        qdrant_manager.snapshots.stream(physical, snapshot_name),
+        media_type="application/octet-stream",
+        headers=headers
+    )
+
+@router.delete("/{collection_name}/snapshots/{snapshot_name}")
+async def delete_snapshot(collection_name: str, snapshot_name: str):
+    """Delete a snapshot file from the Qdrant server."""
+    try:
+        await asyncio.to_thread(qdrant_manager.delete_snapshot, collection_name, snapshot_name)
+        return JSONResponse(content={"collection": collection_name, "deleted": snapshot_name})
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error deleting snapshot '{snapshot_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Deleting snapshot failed: {str(e)}")
+
+@router.post("/{collection_name}/snapshots/upload")
+async def upload_snapshot(
+    collection_name: str,
+    snapshot: UploadFile = File(..., description="Snapshot file"),
+    settings: str = Form(..., description="X-Collection-Settings JSON returned with the download ({} for default settings)"),
+    checksum: Optional[str] = Form(None, description="Expected SHA-256 of the snapshot file"),
+    keep_versions: int = Form(2, ge=1)
+):
+    """
+    Restore an uploaded snapshot as a new version of the collection and switch the alias to it.
+
+    The upload is spooled to disk and streamed on to Qdrant, so memory stays
+    bounded whatever the file size.
+    """
+    if collection_name in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{collection_name}'")
+    try:
+        physical = await asyncio.to_thread(
+            qdrant_manager.restore_snapshot,
+            collection_name,
+            fileobj=snapshot.file,
+            filename=snapshot.filename or "collection.snapshot",
+            checksum=checksum,
+            settings=json.loads(settings),
+            keep_versions=keep_versions
+        )
+        return JSONResponse(content={"collection": collection_name, "physical_collection": physical})
+    except (ValueError, json.JSONDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error restoring snapshot into '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Restoring snapshot failed: {str(e)}")
+    finally:
+        await snapshot.close()
+
+@router.post("/{collection_name}/snapshots/recover")
+async def recover_snapshot(collection_name: str, request: rest.SnapshotRecoverRequest):
+    """
+    Restore a snapshot Qdrant downloads itself, e.g. from another Qdrant or object storage,
+    as a new version of the collection.
+    """
+    if collection_name in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{collection_name}'")
+    try:
+        physical = await asyncio.to_thread(
+            qdrant_manager.restore_snapshot,
+            collection_name,
+            location=request.location,
+            checksum=request.checksum,
+            settings=request.settings,
+            keep_versions=request.keep_versions
+        )
+        return JSONResponse(content={"collection": collection_name, "physical_collection": physical})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error recovering snapshot into '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Recovering snapshot failed: {str(e)}")
+
+@router.post("/{collection_name}/clone")
+async def clone_collection(collection_name: str, request: rest.CollectionCloneRequest):
+    """Copy a collection, vectors, payload indexes and settings included, under a new name."""
+    busy = [name for name in (collection_name, request.target_collection) if name in active_builds]
+    if busy:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{busy[0]}'")
+    try:
+        clone = await asyncio.to_thread(
+            qdrant_manager.clone_collection,
+            collection_name,
+            request.target_collection,
+            keep_versions=request.keep_versions
+        )
+        return JSONResponse(content=clone)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error cloning '{collection_name}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Cloning collection failed: {str(e)}")
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get search result cache size and hit-rate metrics."""
+    return JSONResponse(content=qdrant_manager.result_cache.stats())
+
+@router.get("/cache/semantic/stats")
+async def get_semantic_cache_stats():
+    """Get semantic query cache size and hit-rate metrics."""
+    if not qdrant_manager.semantic_cache:
+        return JSONResponse(content={"enabled": False})
+    return JSONResponse(content={"enabled": True, **qdrant_manager.semantic_cache.stats()})
+
+@router.get("/planner/stats")
+async def get_planner_stats():
+    """Get search counts and latency per filtered search plan."""
+    return JSONResponse(content=qdrant_manager.planner.stats())
+
+@router.delete("/cache")
+async def clear_cache():
+    """Drop all cached search results."""
+    qdrant_manager.result_cache.clear()
+    qdrant_manager.planner.clear()
+    if qdrant_manager.semantic_cache:
+        qdrant_manager.semantic_cache.clear()
+    return JSONResponse(content={"status": "cleared"})
+
+@router.get("/{alias}/versions", response_model=rest.CollectionVersionsResponse)
+async def list_collection_versions(alias: str):
+    """List the physical collections built for an alias and the one it serves."""
+    try:
+        return rest.CollectionVersionsResponse(
+            alias=alias,
+            active=qdrant_manager.resolve_collection(alias),
+            versions=qdrant_manager.list_collection_versions(alias)
+        )
+    except Exception as e:
+        logger.error(f"Error listing versions for '{alias}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to list versions: {str(e)}")
+
+@router.post("/{alias}/rollback", response_model=rest.CollectionVersionsResponse)
+async def rollback_collection(alias: str, request: rest.CollectionRollbackRequest):
+    """Switch an alias back to a previous version (the one before the active version by default)."""
+    if alias in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{alias}'")
+    try:
+        active = qdrant_manager.rollback_collection(alias, request.version)
+        return rest.CollectionVersionsResponse(
+            alias=alias,
+            active=active,
+            versions=qdrant_manager.list_collection_versions(alias)
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        logger.error(f"Error rolling back '{alias}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Rollback failed: {str(e)}")
+
+@router.delete("/{alias}/versions")
+async def gc_collection_versions(alias: str, keep: int = 2):
+    """Delete old versions of an alias, keeping the newest `keep` and the active one."""
+    if alias in active_builds:
+        raise HTTPException(status_code=409, detail=f"Build in progress for collection '{alias}'")
+    try:
+        deleted = qdrant_manager.gc_collection_versions(alias, keep=keep)
+        return JSONResponse(content={"alias": alias, "deleted": deleted})
+    except Exception as e:
+        logger.error(f"Error removing versions of '{alias}': {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to remove versions: {str(e)}")
+
+def _format_results(search_results) -> rest.SearchResponse:
+    """Convert TextNodes into the search response model."""
+    return rest.SearchResponse(results=[
+        rest.SearchResult(
+            content=node.text,
+            metadata={
+                k: v for k, v in node.metadata.items()
+                if k not in ['_node_content', 'embedding']
+            },
+            score=float(node.metadata.get('score', 0.0))
+        )
+        for node in search_results or []
+    ])
+
 @router.post("/search", response_model=rest.SearchResponse)
 async def filtered_search_endpoint(request: rest.FilteredSearchRequest):
     """
     Endpoint for filtered search with hybrid vector search capabilities.
     """
     try:
-        qdrant_filter = None
-        if request.filters:
-            filter_builder = FilterBuilder()
-            if 'must' in request.filters:
-                filter_builder.add_must(request.filters['must'])
-            if 'should' in request.filters:
-                filter_builder.add_should(request.filters['should'])
-            if 'must_not' in request.filters:
-                filter_builder.add_must_not(request.filters['must_not'])
-            qdrant_filter = filter_builder.build()
-
         search_results = await qdrant_manager.advanced_search(
             collection_name=request.collection_name,
             query=request.query,
-            filter_params=qdrant_filter.model_dump() if qdrant_filter else None,
-            top_k=request.top_k
+            filter_params=request.filters,
+            top_k=request.top_k,
+            use_cache=request.use_cache,
+            payload_fields=request.payload_fields,
+            fusion=request.fusion,
+            dense_limit=request.dense_limit,
+            sparse_limit=request.sparse_limit,
+            dense_weight=request.alpha,
+            hnsw_ef=request.hnsw_ef,
+            exact=request.exact,
+            group_by=request.group_by,
+            group_size=request.group_size,
+            diversify=request.diversify,
+            mmr_lambda=request.mmr_lambda,
+            fetch_k=request.fetch_k,
+            duplicate_threshold=request.duplicate_threshold,
+            late_interaction=request.late_interaction,
+            rescore_k=request.rescore_k,
+            use_semantic_cache=request.use_semantic_cache,
+            use_planner=request.use_planner
         )
 
-        if not search_results:
-            return rest.SearchResponse(results=[])
-
-        formatted_results = [
-            rest.SearchResult(
-                content=node.text,
-                metadata={
-                    k: v for k, v in node.metadata.items()
-                    if k not in ['_node_content', 'embedding']
-                },
-                score=float(node.metadata.get('score', 0.0))
-            )
-            for node in search_results
-        ]
-
-        return rest.SearchResponse(results=formatted_results)
+        return _format_results(search_results)
 
     except ValueError as ve:
         logger.error(f"Value error in search endpoint: {ve}")
         raise HTTPException(status_code=400, detail=f"Invalid request parameters: {str(ve)}")
     except Exception as e:
         logger.error(f"Error in filtered_search_endpoint: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail="An internal server error occurred during search")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="An internal server error occurred during search")
+
+@router.post("/search/multi", response_model=rest.SearchResponse)
+async def multi_collection_search_endpoint(request: rest.MultiCollectionSearchRequest):
+    """
+    Search several collections with one query and fuse the results into a single ranking.
+    """
+    try:
+        search_results = await qdrant_manager.multi_collection_search(
+            collection_names=request.collection_names,
+            query=request.query,
+            filter_params=request.filters,
+            top_k=request.top_k,
+            collection_fusion=request.collection_fusion,
+            use_cache=request.use_cache,
+            payload_fields=request.payload_fields,
+            group_by=request.group_by,
+            group_size=request.group_size
+        )
+
+        return _format_results(search_results)
+
+    except ValueError as ve:
+        logger.error(f"Value error in multi-collection search endpoint: {ve}")
+        raise HTTPException(status_code=400, detail=f"Invalid request parameters: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Error in multi_collection_search_endpoint: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="An internal server error occurred during search")
+
+@router.post("/search/batch", response_model=rest.BatchSearchResponse)
+async def batch_search_endpoint(request: rest.BatchSearchRequest):
+    """
+    Run many filtered hybrid searches against one collection in a single Qdrant round trip.
+    """
+    try:
+        batch_results = await qdrant_manager.batch_advanced_search(
+            collection_name=request.collection_name,
+            searches=[
+                {
+                    "query": search.query,
+                    "filter_params": search.filters,
+                    "top_k": search.top_k
+                }
+                for search in request.searches
+            ],
+            use_cache=request.use_cache,
+            payload_fields=request.payload_fields,
+            fusion=request.fusion,
+            dense_limit=request.dense_limit,
+            sparse_limit=request.sparse_limit,
+            dense_weight=request.alpha,
+            hnsw_ef=request.hnsw_ef,
+            exact=request.exact,
+            late_interaction=request.late_interaction,
+            use_semantic_cache=request.use_semantic_cache,
+            use_planner=request.use_planner
+        )
+
+        return rest.BatchSearchResponse(
+            results=[_format_results(search_results) for search_results in batch_results]
+        )
+
+    except ValueError as ve:
+        logger.error(f"Value error in batch search endpoint: {ve}")
+        raise HTTPException(status_code=400, detail=f"Invalid request parameters: {str(ve)}")
+    except Exception as e:
+        logger.error(f"Error in batch_search_endpoint: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="An internal server error occurred during search")
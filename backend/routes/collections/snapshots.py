@@ -0,0 +1,113 @@
+import hashlib
+import logging
+import os
+from typing import Any, AsyncIterator, BinaryIO, Optional
+
+import httpx
+
+# Bytes read or written per step, the memory bound of a transfer
+SNAPSHOT_CHUNK_SIZE = 1024 * 1024
+
+
+class SnapshotTransfer:
+    """
+    Streams collection snapshot files to and from the Qdrant REST API.
+
+    qdrant-client creates, lists and recovers snapshots but does not move the
+    files. Transfers here go chunk by chunk, so memory use is bounded by
+    `chunk_size` whatever the snapshot size.
+    """
+
+    def __init__(self, base_url: str, chunk_size: int = SNAPSHOT_CHUNK_SIZE, timeout: float = 60.0):
+        """
+        Args:
+            base_url: Qdrant REST address, e.g. http://qdrant:6333
+            chunk_size: Bytes per read and write
+            timeout: Seconds to wait for a connection or between two chunks
+        """
+        self.base_url = base_url.rstrip("/")
+        self.chunk_size = chunk_size
+        self.timeout = httpx.Timeout(timeout, connect=10.0)
+        # Qdrant recovers an uploaded snapshot before answering, so uploads have no read timeout
+        self.upload_timeout = httpx.Timeout(timeout, connect=10.0, read=None)
+
+    def url(self, collection_name: str, snapshot_name: str) -> str:
+        return f"{self.base_url}/collections/{collection_name}/snapshots/{snapshot_name}"
+
+    async def stream(self, collection_name: str, snapshot_name: str) -> AsyncIterator[bytes]:
+        """Yield a snapshot file in chunks, e.g. as an HTTP response body."""
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client.stream("GET", self.url(collection_name, snapshot_name)) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(self.chunk_size):
+                    yield chunk
+
+    def download(
+        self,
+        collection_name: str,
+        snapshot_name: str,
+        path: str,
+        checksum: Optional[str] = None
+    ) -> int:
+        """
+        Download a snapshot file to `path`, verifying its SHA-256 checksum when given.
+
+        The file is written next to `path` and renamed once complete, so an
+        interrupted download never leaves a truncated snapshot behind.
+
+        Returns:
+            int: Bytes written
+        """
+        partial = f"{path}.part"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with httpx.stream("GET", self.url(collection_name, snapshot_name), timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(partial, "wb") as f:
+                    for chunk in response.iter_bytes(self.chunk_size):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            if checksum and digest.hexdigest() != checksum:
+                raise ValueError(f"Snapshot '{snapshot_name}' checksum mismatch after download")
+            os.replace(partial, path)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        logging.info(f"Downloaded snapshot '{snapshot_name}' of '{collection_name}' ({size} bytes) to {path}")
+        return size
+
+    def upload(
+        self,
+        collection_name: str,
+        fileobj: BinaryIO,
+        filename: str,
+        checksum: Optional[str] = None
+    ) -> Any:
+        """
+        Upload a snapshot file and recover it as `collection_name`.
+
+        The file object is streamed as multipart form data; Qdrant creates the
+        collection, or replaces it when it exists.
+        """
+        params = {"priority": "snapshot", "wait": "true"}
+        if checksum:
+            params["checksum"] = checksum
+        response = httpx.post(
+            f"{self.base_url}/collections/{collection_name}/snapshots/upload",
+            params=params,
+            files={"snapshot": (filename, fileobj, "application/octet-stream")},
+            timeout=self.upload_timeout
+        )
+        response.raise_for_status()
+        logging.info(f"Uploaded snapshot '{filename}' as '{collection_name}'")
+        return response.json().get("result")
+
+    def checksum(self, fileobj: BinaryIO) -> str:
+        """SHA-256 of a file object, read in chunks and rewound afterwards."""
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fileobj.read(self.chunk_size), b""):
+            digest.update(chunk)
+        fileobj.seek(0)
+        return digest.hexdigest()
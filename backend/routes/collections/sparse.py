@@ -0,0 +1,50 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+
+class SparsePruning(BaseModel):
+    """Limits applied to sparse vectors before they are indexed or used as a query."""
+    top_n: Optional[int] = Field(None, ge=1, description="Keep at most this many of the highest weights")
+    mass: Optional[float] = Field(
+        None, gt=0.0, le=1.0,
+        description="Keep the fewest highest weights that cover this fraction of the total weight"
+    )
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_n is not None or self.mass is not None
+
+    def apply(self, indices: List[int], values: List[float]) -> Tuple[List[int], List[float]]:
+        """
+        Prune one sparse vector, keeping the surviving terms in their original order.
+
+        When both limits are set the stricter one wins.
+        """
+        if not self.enabled or len(values) <= 1:
+            return indices, values
+
+        weights = np.abs(np.asarray(values, dtype=np.float32))
+        order = np.argsort(-weights, kind="stable")
+
+        keep = len(order)
+        if self.mass is not None:
+            cumulative = np.cumsum(weights[order])
+            if cumulative[-1] > 0:
+                keep = int(np.searchsorted(cumulative, self.mass * cumulative[-1])) + 1
+        if self.top_n is not None:
+            keep = min(keep, self.top_n)
+
+        kept = np.sort(order[:keep])
+        return [indices[i] for i in kept], [values[i] for i in kept]
+
+    def apply_batch(
+        self,
+        indices: List[List[int]],
+        values: List[List[float]]
+    ) -> Tuple[List[List[int]], List[List[float]]]:
+        if not self.enabled:
+            return indices, values
+        pruned = [self.apply(i, v) for i, v in zip(indices, values)]
+        return [i for i, _ in pruned], [v for _, v in pruned]
@@ -0,0 +1,126 @@
+import contextlib
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from qdrant_client.http import models
+
+# Payload key holding the tenant of every point in a shared collection
+DEFAULT_TENANT_FIELD = "tenant_id"
+
+# Payload key marking the build that wrote a point, so a tenant rebuild can replace its older points
+TENANT_BUILD_FIELD = "build_id"
+
+# Request header carrying the caller's tenant
+TENANT_HEADER = "x-tenant-id"
+
+# Request header carrying the hex HMAC-SHA256 of the tenant id, for gateways that sign it
+TENANT_SIGNATURE_HEADER = "x-tenant-signature"
+
+# Tenant of the current request; tools and searches read it instead of taking it as an argument
+current_tenant: ContextVar[Optional[str]] = ContextVar("current_tenant", default=None)
+
+
+@contextlib.contextmanager
+def tenant_scope(tenant_id: Optional[str]) -> Iterator[None]:
+    """Run a block as a tenant, e.g. a background job acting for one team."""
+    token = current_tenant.set(tenant_id)
+    try:
+        yield
+    finally:
+        current_tenant.reset(token)
+
+
+def sign_tenant(tenant_id: str, signing_key: str) -> str:
+    """Signature a gateway sends in `X-Tenant-Signature` to vouch for a tenant id."""
+    return hmac.new(signing_key.encode("utf-8"), tenant_id.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+class TenantMiddleware:
+    """
+    Sets `current_tenant` from the `X-Tenant-ID` header for the duration of a request.
+
+    The header scopes every search and delete, so it is only trusted when it
+    comes from the authentication layer: a direct peer in `trusted_proxies`
+    (a gateway that sets the header itself), or a request whose
+    `X-Tenant-Signature` matches `signing_key`. A tenant header arriving any
+    other way is rejected with a 403, and without either setting no tenant
+    header is accepted.
+
+    Implemented as plain ASGI so the value is also visible while streaming
+    responses run, including tool calls made by the chat providers.
+    """
+
+    def __init__(
+        self,
+        app,
+        header: str = TENANT_HEADER,
+        trusted_proxies: Optional[Iterable[str]] = None,
+        signing_key: Optional[str] = None
+    ):
+        """
+        Args:
+            app: ASGI application
+            header: Request header carrying the tenant
+            trusted_proxies: Addresses or networks (CIDR) of peers allowed to set the header
+            signing_key: Secret whose HMAC-SHA256 of the tenant id authenticates the header
+        """
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+        self.signature_header = TENANT_SIGNATURE_HEADER.encode("latin-1")
+        self.trusted_proxies = [ipaddress.ip_network(proxy.strip(), strict=False)
+                                for proxy in trusted_proxies or [] if proxy.strip()]
+        self.signing_key = signing_key or None
+
+    def _trusted(self, scope, tenant_id: str, signature: Optional[str]) -> bool:
+        if self.signing_key and signature:
+            return hmac.compare_digest(sign_tenant(tenant_id, self.signing_key), signature)
+        client = scope.get("client")
+        if not client or not self.trusted_proxies:
+            return False
+        try:
+            address = ipaddress.ip_address(client[0])
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_proxies)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        tenant_id, signature = None, None
+        for name, value in scope.get("headers", []):
+            if name == self.header:
+                tenant_id = value.decode("latin-1").strip() or None
+            elif name == self.signature_header:
+                signature = value.decode("latin-1").strip() or None
+        if tenant_id and not self._trusted(scope, tenant_id, signature):
+            logging.warning(f"Rejected untrusted tenant header from {scope.get('client')}")
+            body = json.dumps({"detail": "Tenant header not accepted from this client"}).encode("utf-8")
+            await send({"type": "http.response.start", "status": 403, "headers": [
+                (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]})
+            await send({"type": "http.response.body", "body": body})
+            return
+        with tenant_scope(tenant_id):
+            await self.app(scope, receive, send)
+
+
+def scope_filter(filter_params: Optional[Dict[str, Any]], tenant_field: str, tenant_id: str) -> Dict[str, Any]:
+    """
+    Add a tenant equality condition to a filter, without modifying it.
+
+    The condition is a top-level `must`, so `should` and `must_not` clauses of
+    the caller cannot widen the search to other tenants.
+    """
+    filter_params = dict(filter_params or {})
+    filter_params["must"] = [*(filter_params.get("must") or []), {"key": tenant_field, "value": tenant_id}]
+    return filter_params
+
+
+def tenant_index_params() -> models.KeywordIndexParams:
+    """Keyword index co-locating each tenant's points, so a tenant's search reads only its own data."""
+    return models.KeywordIndexParams(type="keyword", is_tenant=True)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, List, Union, Optional
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -8,6 +8,9 @@ class RetrieveContextRequest(BaseModel):
     """Pydantic model for RAG tool request parameters."""
     query: str = Field(..., description="The query to search for relevant context")
     collection_name: Optional[str] = Field(None, description="Name of the collection to search in")
+    collection_names: Optional[List[str]] = Field(None, description="Search several collections at once and merge the results")
+    group_by: Optional[str] = Field(None, description="Return only the best hit per value of this payload field, e.g. parent_id")
+    diversify: bool = Field(False, description="Drop near-duplicate passages and prefer diverse results")
     top_k: int = Field(5, description="Number of results to retrieve", ge=1, le=10)
     
     model_config = {
@@ -18,14 +21,24 @@ class RetrieveContextRequest(BaseModel):
 
 async def hybrid_search(
     request: Union[RetrieveContextRequest, str],
-    collection_name: Optional[str] = None
+    collection_name: Optional[str] = None,
+    collection_names: Optional[List[str]] = None,
+    group_by: Optional[str] = None,
+    diversify: bool = False
 ) -> Dict[str, Any]:
     """
     Perform hybrid search and return results with truncated content.
+
+    Collections shared by tenants are searched as the caller's tenant (the
+    request's X-Tenant-ID), which the model cannot override.
     
     Args:
         request: Either a string (interpreted as 'query') or a RetrieveContextRequest model
         collection_name: Collection name (can be overridden by request.collection_name if present)
+        collection_names: Collections to search in a single call, results are fused across them
+        group_by: Payload field (e.g. parent_id) to return only the best hit per document
+        diversify: Rerank candidates with MMR and collapse near-duplicate passages (single collection;
+            within each group with group_by)
     
     Returns:
         Dict containing search results, total count, query, and collection info
@@ -44,12 +57,26 @@ async def hybrid_search(
             query = request.query
             top_k_value = max(1, min(request.top_k, 10))
             search_collection = request.collection_name or collection_name or "picollm"
+            collection_names = request.collection_names or collection_names
+            group_by = request.group_by or group_by
+            diversify = request.diversify
         
-        search_results = await qdrant_manager.advanced_search(
-            collection_name=search_collection,
-            query=query,
-            top_k=top_k_value
-        )
+        if collection_names:
+            search_collection = list(collection_names)
+            search_results = await qdrant_manager.multi_collection_search(
+                collection_names=search_collection,
+                query=query,
+                top_k=top_k_value,
+                group_by=group_by
+            )
+        else:
+            search_results = await qdrant_manager.advanced_search(
+                collection_name=search_collection,
+                query=query,
+                top_k=top_k_value,
+                group_by=group_by,
+                diversify=diversify
+            )
         
         nodes = []
         for doc in search_results:
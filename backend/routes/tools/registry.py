@@ -8,6 +8,9 @@ from typing import (
     List,
     Optional,
     Type,
+    Union,
+    get_args,
+    get_origin,
     get_type_hints,
 )
 import json
@@ -203,6 +206,11 @@ class ToolRegistry:
     @staticmethod
     def _type_to_schema(type_hint: Type) -> Dict[str, Any]:
         """Convert Python type hints to JSON Schema types"""
+        # Optional[X] is described as X, the parameter is simply not required
+        args = get_args(type_hint)
+        if get_origin(type_hint) is Union and len(args) == 2 and type(None) in args:
+            type_hint = next(arg for arg in args if arg is not type(None))
+
         type_map = {
             str: {"type": "string"},
             int: {"type": "integer"},
@@ -298,7 +306,11 @@ def register_core_tools():
     global_tool_registry.register_tool(web_search)
     global_tool_registry.register_tool(
         hybrid_search,
-        description="Retrieve relevant context from vector store to enhance responses."
+        description=(
+            "Retrieve relevant context from vector store to enhance responses. "
+            "Pass collection_names to search several collections in one call, "
+            "and group_by=\"parent_id\" to get at most one passage per source document."
+        )
     )
     
 register_core_tools()
@@ -0,0 +1,32 @@
+import pytest
+
+from routes.collections.bm25 import BM25Encoder, _singular
+
+
+@pytest.mark.parametrize("singular, plural", [
+    ("search", "searches"),
+    ("cache", "caches"),
+    ("size", "sizes"),
+    ("box", "boxes"),
+    ("axe", "axes"),
+    ("wish", "wishes"),
+    ("niche", "niches"),
+    ("class", "classes"),
+    ("query", "queries"),
+    ("document", "documents"),
+    ("horse", "horses"),
+])
+def test_plural_and_singular_share_a_term(singular, plural):
+    assert _singular(plural) == _singular(singular)
+
+
+@pytest.mark.parametrize("token", ["status", "analysis", "glass", "bus"])
+def test_non_plurals_are_kept(token):
+    assert _singular(token) == token
+
+
+def test_query_matches_plural_document_terms():
+    encoder = BM25Encoder()
+    query_indices, _ = encoder.encode_query("cache size")
+    document_indices, _ = encoder.encode_document("Caches of every size and sizes of caches")
+    assert set(query_indices) <= set(document_indices)
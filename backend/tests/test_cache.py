@@ -0,0 +1,57 @@
+import numpy as np
+
+from routes.collections.cache import SearchResultCache, SemanticQueryCache
+
+
+def test_key_normalizes_query_and_filter_order():
+    first = SearchResultCache.make_key("docs", "Fourth  Amendment", {"must": [], "should": []}, 5, fusion="rrf")
+    second = SearchResultCache.make_key("docs", "fourth amendment", {"should": [], "must": []}, 5, fusion="rrf")
+    assert first == second
+    assert first != SearchResultCache.make_key("docs", "fourth amendment", None, 10, fusion="rrf")
+
+
+def test_write_version_invalidates_entries():
+    cache = SearchResultCache()
+    cache.put("docs", "key", [{"text": "a"}])
+    assert cache.get("docs", "key") == [{"text": "a"}]
+
+    cache.bump("docs")
+    assert cache.get("docs", "key") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_results_raced_with_a_write_are_stored_stale():
+    cache = SearchResultCache()
+    version = cache.version("docs")
+    cache.bump("docs")
+    cache.put("docs", "key", [{"text": "a"}], version=version)
+    assert cache.get("docs", "key") is None
+
+
+def test_entries_are_copied_in_and_out():
+    cache = SearchResultCache()
+    results = [{"text": "a", "metadata": {"court": "scotus"}}]
+    cache.put("docs", "key", results)
+    results[0]["text"] = "changed"
+
+    hit = cache.get("docs", "key")
+    assert hit[0]["text"] == "a"
+    hit[0]["metadata"]["court"] = "changed"
+    assert cache.get("docs", "key")[0]["metadata"]["court"] == "scotus"
+
+
+def test_semantic_cache_threshold():
+    cache = SemanticQueryCache(threshold=0.9)
+    cache.put("docs", "context", np.array([1.0, 0.0]), "fourth amendment", [{"text": "a"}])
+
+    # cos = 0.95 and 0.8
+    assert cache.get("docs", "context", np.array([0.95, np.sqrt(1 - 0.95 ** 2)])) == [{"text": "a"}]
+    assert cache.get("docs", "context", np.array([0.8, 0.6])) is None
+    assert cache.get("docs", "other context", np.array([1.0, 0.0])) is None
+
+
+def test_semantic_cache_write_drops_entries():
+    cache = SemanticQueryCache(threshold=0.9)
+    cache.put("docs", "context", np.array([1.0, 0.0]), "query", [{"text": "a"}])
+    cache.bump("docs")
+    assert cache.get("docs", "context", np.array([1.0, 0.0])) is None
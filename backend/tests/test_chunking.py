@@ -0,0 +1,64 @@
+import re
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from routes.collections.chunking import CHUNK_FIELDS, DocumentChunker, create_chunker
+
+
+class WhitespaceTokenizer:
+    """Fast-tokenizer stand-in: one token per word, with character offsets."""
+    is_fast = True
+
+    def __call__(self, text, **kwargs):
+        return {"offset_mapping": [match.span() for match in re.finditer(r"\S+", text)]}
+
+
+class Model:
+    tokenizer = WhitespaceTokenizer()
+    max_seq_length = 12
+
+
+@pytest.mark.parametrize("max_tokens, overlap", [(12, 0), (12, 9), (3, 0)])
+def test_overlap_inside_the_window_is_accepted(max_tokens, overlap):
+    chunker = DocumentChunker(WhitespaceTokenizer(), max_tokens=max_tokens, overlap=overlap)
+    assert chunker.stride == max_tokens - 2 - overlap
+
+
+@pytest.mark.parametrize("max_tokens, overlap", [(12, 10), (12, 12), (12, -1), (2, 0)])
+def test_overlap_outside_the_window_is_rejected(max_tokens, overlap):
+    with pytest.raises(ValueError):
+        DocumentChunker(WhitespaceTokenizer(), max_tokens=max_tokens, overlap=overlap)
+
+
+def test_create_chunker_does_not_clamp_the_overlap():
+    assert create_chunker(Model(), chunk_overlap=9).overlap == 9
+    with pytest.raises(ValueError):
+        create_chunker(Model(), chunk_size=8, chunk_overlap=6)
+
+
+def test_chunk_spans_overlap_and_cover_the_text():
+    text = " ".join(f"w{i}" for i in range(25))
+    chunker = DocumentChunker(WhitespaceTokenizer(), max_tokens=12, overlap=4)
+    chunks = chunker.chunk({"id": "doc", "document": text, "court": "scotus"})
+
+    # 10-token windows every 6 tokens
+    assert [chunk["document"].split() for chunk in chunks] == [
+        [f"w{i}" for i in range(start, min(start + 10, 25))] for start in (0, 6, 12, 18)
+    ]
+    for index, chunk in enumerate(chunks):
+        assert chunk["document"] == text[chunk["chunk_start"]:chunk["chunk_end"]]
+        assert {field: chunk[field] for field in CHUNK_FIELDS[:3]} == {
+            "parent_id": "doc", "chunk_index": index, "chunk_count": 4}
+        assert chunk["court"] == "scotus"
+    assert chunks[0]["chunk_start"] == 0 and chunks[-1]["chunk_end"] == len(text)
+    assert len({chunk["id"] for chunk in chunks}) == 4
+
+
+def test_short_and_empty_documents():
+    chunker = DocumentChunker(WhitespaceTokenizer(), max_tokens=12, overlap=4)
+    text = " short text "
+    [chunk] = chunker.chunk({"id": "doc", "document": text})
+    assert (chunk["document"], chunk["chunk_start"], chunk["chunk_end"]) == (text, 0, len(text))
+    assert chunker.chunk({"id": "doc", "document": "   "}) == []
@@ -0,0 +1,29 @@
+import numpy as np
+
+from routes.collections.diversity import mmr_select
+
+QUERY = np.array([1.0, 0.0])
+# Two near-identical passages close to the query, and a less relevant but different one
+CANDIDATES = np.array([[1.0, 0.1], [1.0, 0.11], [0.6, 0.8]])
+
+
+def test_relevance_only_keeps_score_order():
+    selected, collapsed = mmr_select(QUERY, CANDIDATES, k=3, lambda_mult=1.0)
+    assert selected == [0, 1, 2]
+    assert collapsed == 0
+
+
+def test_diversity_promotes_different_candidates():
+    selected, _ = mmr_select(QUERY, CANDIDATES, k=2, lambda_mult=0.3)
+    assert selected == [0, 2]
+
+
+def test_near_duplicates_are_collapsed():
+    selected, collapsed = mmr_select(QUERY, CANDIDATES, k=3, lambda_mult=1.0, duplicate_threshold=0.95)
+    assert selected == [0, 2]
+    assert collapsed == 1
+
+
+def test_empty_input():
+    assert mmr_select(QUERY, np.empty((0, 2)), k=3) == ([], 0)
+    assert mmr_select(QUERY, CANDIDATES, k=0) == ([], 0)
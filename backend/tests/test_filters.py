@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from routes.collections.filters import compile_filter, create_filter
+
+
+@pytest.fixture
+def client():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        "docs", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("docs", points=[
+        models.PointStruct(id=1, vector=[1.0, 0.0], payload={"lang": "en", "year": 2020}),
+        models.PointStruct(id=2, vector=[0.9, 0.1], payload={"lang": "fr", "year": 2022}),
+        models.PointStruct(id=3, vector=[0.0, 1.0], payload={"lang": "en", "year": 2024}),
+    ])
+    return client
+
+
+def search_ids(client, filter_params):
+    points = client.query_points("docs", query=[1.0, 0.0], query_filter=compile_filter(filter_params), limit=10).points
+    return sorted(point.id for point in points)
+
+
+def test_empty_clauses_are_unset():
+    built = create_filter({"must": [{"key": "lang", "value": "en"}]})
+    assert built.should is None
+    assert built.must_not is None
+    assert len(built.must) == 1
+
+
+def test_must_filter_in_local_mode(client):
+    assert search_ids(client, {"must": [{"key": "lang", "value": "en"}]}) == [1, 3]
+
+
+def test_must_not_filter_in_local_mode(client):
+    assert search_ids(client, {"must_not": [{"key": "lang", "value": "en"}]}) == [2]
+
+
+def test_should_and_range_filters_in_local_mode(client):
+    filter_params = {
+        "should": [{"key": "lang", "value": "fr"}, {"key": "year", "operator": "range", "value": {"gte": 2024}}]
+    }
+    assert search_ids(client, filter_params) == [2, 3]
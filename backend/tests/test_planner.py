@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
+
+from routes.collections.filters import compile_filter
+from routes.collections.planner import SearchPlanner
+
+
+@pytest.fixture
+def client():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        "docs", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("docs", points=[
+        models.PointStruct(id=i, vector=[1.0, float(i)], payload={"court": "scotus" if i < 3 else "appeals"})
+        for i in range(10)
+    ])
+    return client
+
+
+def plan(planner, court, exact_threshold=5):
+    filter_params = {"must": [{"key": "court", "value": court}]}
+    return planner.plan("docs", filter_params, compile_filter(filter_params), exact_threshold)
+
+
+def test_plans_follow_match_counts(client):
+    planner = SearchPlanner(client)
+    assert plan(planner, "district").model_dump() == {"name": "empty", "matches": 0}
+    assert plan(planner, "scotus").model_dump() == {"name": "exact", "matches": 3}
+    assert plan(planner, "appeals").model_dump() == {"name": "hnsw", "matches": 7}
+
+
+def test_empty_count_is_cached_until_a_write(client):
+    planner = SearchPlanner(client)
+    assert plan(planner, "district").name == "empty"
+
+    client.upsert("docs", points=[models.PointStruct(id=10, vector=[1.0, 0.0], payload={"court": "district"})])
+    assert plan(planner, "district").name == "empty"
+
+    planner.invalidate("docs")
+    assert plan(planner, "district").model_dump() == {"name": "exact", "matches": 1}
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client.http import models
+
+from routes.collections.profiler import HyperLogLog, SchemaProfiler
+
+
+@pytest.mark.parametrize("distinct", [10, 1000, 50000])
+def test_hyperloglog_cardinality(distinct):
+    hll = HyperLogLog()
+    for i in range(distinct):
+        hll.add(f"value-{i}")
+        hll.add(f"value-{i}")
+    assert hll.count() == pytest.approx(distinct, rel=0.05)
+
+
+def test_profiled_index_types():
+    profiler = SchemaProfiler()
+    for i in range(200):
+        profiler.observe({
+            "id": i,
+            "document": "full text",
+            "court": ["scotus", "appeals"][i % 2],
+            "year": 1990 + i % 30,
+            "score": i / 7,
+            "published": i % 3 == 0,
+            "decided": f"2020-01-{i % 28 + 1:02d}",
+            "summary": f"opinion number {i} on the question presented",
+            "extra": {"nested": i},
+        })
+    schema = profiler.schema()
+
+    assert {field: entry["type"] for field, entry in schema.items()} == {
+        "document": models.PayloadSchemaType.TEXT,
+        "court": models.PayloadSchemaType.KEYWORD,
+        "year": models.PayloadSchemaType.INTEGER,
+        "score": models.PayloadSchemaType.FLOAT,
+        "published": models.PayloadSchemaType.BOOL,
+        "decided": models.PayloadSchemaType.DATETIME,
+        "summary": models.PayloadSchemaType.TEXT,
+        "extra": None,
+    }
+    assert schema["court"]["profile"]["distinct"] == 2
+    assert schema["year"]["profile"]["distinct"] == 30
+    assert not schema["extra"]["index"]
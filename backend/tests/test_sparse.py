@@ -0,0 +1,30 @@
+from routes.collections.sparse import SparsePruning
+
+INDICES = [10, 20, 30, 40]
+VALUES = [0.1, 0.5, -0.3, 0.1]
+
+
+def test_disabled_pruning_keeps_everything():
+    assert SparsePruning().apply(INDICES, VALUES) == (INDICES, VALUES)
+
+
+def test_top_n_keeps_the_largest_weights_in_order():
+    # Magnitudes count, so the negative weight is kept
+    assert SparsePruning(top_n=2).apply(INDICES, VALUES) == ([20, 30], [0.5, -0.3])
+
+
+def test_mass_keeps_the_fewest_weights_covering_the_share():
+    # 0.5 + 0.3 covers 80% of the total weight 1.0
+    assert SparsePruning(mass=0.8).apply(INDICES, VALUES) == ([20, 30], [0.5, -0.3])
+    assert SparsePruning(mass=0.81).apply(INDICES, VALUES) == ([10, 20, 30], [0.1, 0.5, -0.3])
+
+
+def test_stricter_limit_wins():
+    assert SparsePruning(top_n=1, mass=0.8).apply(INDICES, VALUES) == ([20], [0.5])
+    assert SparsePruning(top_n=3, mass=0.5).apply(INDICES, VALUES) == ([20], [0.5])
+
+
+def test_batch():
+    indices, values = SparsePruning(top_n=1).apply_batch([INDICES, [1, 2]], [VALUES, [0.2, 0.9]])
+    assert indices == [[20], [2]]
+    assert values == [[0.5], [0.9]]
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from routes.collections.tenancy import TenantMiddleware, current_tenant, sign_tenant
+
+
+def call(middleware, headers, client="203.0.113.5"):
+    seen, sent = [], []
+
+    async def app(scope, receive, send):
+        seen.append(current_tenant.get())
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "client": (client, 4000),
+             "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]}
+    asyncio.run(middleware(app)(scope, None, send))
+    status = sent[0]["status"] if sent else None
+    return seen, status
+
+
+def test_header_is_rejected_without_trust_settings():
+    seen, status = call(lambda app: TenantMiddleware(app), {"x-tenant-id": "legal"})
+    assert seen == [] and status == 403
+
+
+def test_requests_without_header_pass_through():
+    seen, status = call(lambda app: TenantMiddleware(app), {})
+    assert seen == [None] and status is None
+
+
+def test_header_from_trusted_proxy_network():
+    middleware = lambda app: TenantMiddleware(app, trusted_proxies=["10.0.0.0/8"])
+    assert call(middleware, {"x-tenant-id": "legal"}, client="10.1.2.3") == (["legal"], None)
+    assert call(middleware, {"x-tenant-id": "legal"}, client="203.0.113.5") == ([], 403)
+
+
+def test_signed_header():
+    middleware = lambda app: TenantMiddleware(app, signing_key="secret")
+    signed = {"x-tenant-id": "legal", "x-tenant-signature": sign_tenant("legal", "secret")}
+    assert call(middleware, signed) == (["legal"], None)
+    forged = {"x-tenant-id": "hr", "x-tenant-signature": sign_tenant("legal", "secret")}
+    assert call(middleware, forged) == ([], 403)